@@ -0,0 +1,258 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+#
+# Benchmark suite for psi_fix_pkg functions and all bittrue models.
+#
+# Usage:
+#   python3 psi_fix_benchmark.py [-o results.json] [-f <regex>] [-s 1000 100000] [-r 5] [-c baseline.json]
+#
+# Each benchmark is executed once as warm-up and then <repeat> times. The fastest run is used to calculate the
+# throughput in samples/second. Results are written as JSON, a previous result file can be passed with --compare to
+# print the speedup per benchmark and fail (exit code 1) if a benchmark got slower than allowed by --max-regression.
+
+import os
+import sys
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(THIS_DIR, "../model"))
+from psi_fix_pkg import *
+import numpy as np
+import argparse
+import datetime
+import json
+import platform
+import re
+import time
+from functools import partial
+from typing import Callable, Iterator, NamedTuple
+
+from psi_fix_bin_div import psi_fix_bin_div
+from psi_fix_cic_dec import psi_fix_cic_dec
+from psi_fix_cic_int import psi_fix_cic_int
+from psi_fix_complex_abs import psi_fix_complex_abs
+from psi_fix_complex_addsub import psi_fix_complex_addsub
+from psi_fix_complex_mult import psi_fix_complex_mult
+from psi_fix_cordic_abs_pl import psi_fix_cordic_abs_pl
+from psi_fix_cordic_rot import psi_fix_cordic_rot
+from psi_fix_cordic_vect import psi_fix_cordic_vect
+from psi_fix_dds_18b import psi_fix_dds_18b
+from psi_fix_demod_real2cplx import psi_fix_demod_real2cplx
+from psi_fix_fir import psi_fix_fir
+from psi_fix_inv import psi_fix_inv
+from psi_fix_lin_approx import psi_fix_lin_approx
+from psi_fix_lowpass_iir_order1 import psi_fix_lowpass_iir_order1
+from psi_fix_lut import psi_fix_lut
+from psi_fix_mod_cplx2real import psi_fix_mod_cplx2real
+from psi_fix_mov_avg import psi_fix_mov_avg
+from psi_fix_noise_awgn import psi_fix_noise_awgn
+from psi_fix_phase_unwrap import psi_fix_phase_unwrap
+from psi_fix_pol2cart_approx import psi_fix_pol2cart_approx
+from psi_fix_sqrt import psi_fix_sqrt
+from psi_fix_white_noise import psi_fix_white_noise
+
+########################################################################################################################
+# Definitions
+########################################################################################################################
+DEFAULT_SIZES = [1000, 100000]
+DEFAULT_REPEAT = 3
+PKG_WIDTHS = [8, 16, 32, 48]
+
+class Benchmark(NamedTuple):
+    name : str              # Function or model method benchmarked
+    config : str            # Configuration (formats, parameters)
+    samples : int           # Samples processed per call
+    run : Callable[[], object]
+
+def RandomFix(fmt : psi_fix_fmt_t, shape, seed : int = 0) -> np.ndarray:
+    # Random numbers covering the full range of a format
+    rng = np.random.RandomState(seed)
+    return psi_fix_from_real(rng.uniform(psi_fix_lower_bound(fmt), psi_fix_upper_bound(fmt), shape), fmt)
+
+########################################################################################################################
+# psi_fix_pkg Benchmarks
+########################################################################################################################
+def PkgBenchmarks(sizes) -> Iterator[Benchmark]:
+    for w in PKG_WIDTHS:
+        aFmt = psi_fix_fmt_t(1, 1, w-2)
+        bFmt = psi_fix_fmt_t(1, 2, w-3)
+        rFmt = psi_fix_fmt_t(1, 2, w//2)
+        multFmt = psi_fix_fmt_t(1, 3, min(2*w, 52-3))
+        for n in sizes:
+            a = RandomFix(aFmt, n, 0)
+            b = RandomFix(bFmt, n, 1)
+            bits = psi_fix_get_bits_as_int(a, aFmt)
+            real = np.random.RandomState(2).uniform(-1, 1, n)
+            cfg = "a={} b={} r={}".format(aFmt, bFmt, rFmt)
+            rs = psi_fix_rnd_t.round, psi_fix_sat_t.sat
+            # All arguments are bound with partial (lambdas would read the formats of the last loop iteration)
+            yield Benchmark("psi_fix_from_real", "r={}".format(aFmt), n, partial(psi_fix_from_real, real, aFmt))
+            yield Benchmark("psi_fix_get_bits_as_int", "a={}".format(aFmt), n, partial(psi_fix_get_bits_as_int, a, aFmt))
+            yield Benchmark("psi_fix_from_bits_as_int", "a={}".format(aFmt), n, partial(psi_fix_from_bits_as_int, bits, aFmt))
+            yield Benchmark("psi_fix_resize", cfg + " trunc wrap", n, partial(psi_fix_resize, a, aFmt, rFmt))
+            yield Benchmark("psi_fix_resize", cfg + " round sat", n, partial(psi_fix_resize, a, aFmt, rFmt, *rs))
+            yield Benchmark("psi_fix_add", cfg + " round sat", n, partial(psi_fix_add, a, aFmt, b, bFmt, rFmt, *rs))
+            yield Benchmark("psi_fix_sub", cfg + " round sat", n, partial(psi_fix_sub, a, aFmt, b, bFmt, rFmt, *rs))
+            yield Benchmark("psi_fix_mult", "a={} b={} r={} trunc wrap".format(aFmt, bFmt, multFmt), n,
+                            partial(psi_fix_mult, a, aFmt, b, bFmt, multFmt))
+            yield Benchmark("psi_fix_mult", cfg + " round sat", n, partial(psi_fix_mult, a, aFmt, b, bFmt, rFmt, *rs))
+            yield Benchmark("psi_fix_abs", cfg + " round sat", n, partial(psi_fix_abs, a, aFmt, rFmt, *rs))
+            yield Benchmark("psi_fix_neg", cfg + " round sat", n, partial(psi_fix_neg, a, aFmt, rFmt, *rs))
+            yield Benchmark("psi_fix_shift_left", cfg + " round sat", n, partial(psi_fix_shift_left, a, aFmt, 1, 2, rFmt, *rs))
+            yield Benchmark("psi_fix_shift_right", cfg + " round sat", n, partial(psi_fix_shift_right, a, aFmt, 1, 2, rFmt, *rs))
+            yield Benchmark("psi_fix_in_range", cfg + " round", n, partial(psi_fix_in_range, a, aFmt, rFmt, psi_fix_rnd_t.round))
+
+########################################################################################################################
+# Model Benchmarks
+########################################################################################################################
+def ModelBenchmarks(sizes) -> Iterator[Benchmark]:
+    f15 = psi_fix_fmt_t(1, 0, 15)
+    rs = psi_fix_rnd_t.round, psi_fix_sat_t.sat
+    for n in sizes:
+        x = RandomFix(f15, n, 0)
+        y = RandomFix(f15, n, 1)
+        phase = RandomFix(psi_fix_fmt_t(0, 0, 15), n, 2)
+        absVal = RandomFix(psi_fix_fmt_t(0, 0, 16), n, 3)
+
+        # Functions and stateless models
+        yield Benchmark("psi_fix_bin_div", "num=(1,2,5) denom=(1,2,8) out=(1,4,10)", n,
+                        lambda x=x, y=y: psi_fix_bin_div(psi_fix_resize(x, f15, psi_fix_fmt_t(1, 2, 5)), psi_fix_fmt_t(1, 2, 5),
+                                                         psi_fix_resize(y, f15, psi_fix_fmt_t(1, 2, 8)) + 0.25, psi_fix_fmt_t(1, 2, 8),
+                                                         psi_fix_fmt_t(1, 4, 10), psi_fix_rnd_t.trunc, psi_fix_sat_t.sat))
+        m = psi_fix_complex_abs(f15, psi_fix_fmt_t(0, 1, 15), *rs)
+        yield Benchmark("psi_fix_complex_abs.Process", "in=(1,0,15)", n, lambda m=m, x=x, y=y: m.Process(x, y))
+        m = psi_fix_complex_addsub(f15, f15, f15)
+        yield Benchmark("psi_fix_complex_addsub.Process", "in=(1,0,15)", n, lambda m=m, x=x, y=y: m.Process(x, y, y, x, True))
+        m = psi_fix_complex_mult(f15, psi_fix_fmt_t(1, 0, 24), psi_fix_fmt_t(1, 1, 24), psi_fix_fmt_t(1, 0, 20), *rs)
+        yield Benchmark("psi_fix_complex_mult.Process", "a=(1,0,15) b=(1,0,24)", n, lambda m=m, x=x, y=y: m.Process(x, y, y, x))
+        m = psi_fix_cordic_abs_pl(f15, psi_fix_fmt_t(0, 2, 16), psi_fix_fmt_t(1, 2, 22), 13, *rs)
+        yield Benchmark("psi_fix_cordic_abs_pl.Process", "iterations=13", n, lambda m=m, x=x, y=y: m.Process(x, y))
+        for iterations in (13, 21):
+            m = psi_fix_cordic_rot(psi_fix_fmt_t(0, 0, 16), psi_fix_fmt_t(0, 0, 15), psi_fix_fmt_t(1, 2, 16),
+                                   psi_fix_fmt_t(1, 2, 22), psi_fix_fmt_t(1, -2, 23), iterations, True, *rs)
+            yield Benchmark("psi_fix_cordic_rot.Process", "iterations={}".format(iterations), n,
+                            lambda m=m, a=absVal, p=phase: m.Process(a, p))
+            m = psi_fix_cordic_vect(f15, psi_fix_fmt_t(0, 2, 16), psi_fix_fmt_t(1, 2, 22), psi_fix_fmt_t(0, 0, 15),
+                                    psi_fix_fmt_t(1, 0, 18), iterations, True, *rs)
+            yield Benchmark("psi_fix_cordic_vect.Process", "iterations={}".format(iterations), n,
+                            lambda m=m, x=x, y=y: m.Process(x, y))
+        m = psi_fix_dds_18b(psi_fix_fmt_t(0, 0, 31))
+        yield Benchmark("psi_fix_dds_18b.Synthesize", "phase=(0,0,31)", n, lambda m=m, n=n: m.Synthesize(0.12345, n, 0.5))
+        m = psi_fix_inv(psi_fix_fmt_t(1, 4, 14), psi_fix_fmt_t(1, 1, 15), *rs)
+        yield Benchmark("psi_fix_inv.Process", "in=(1,4,14) out=(1,1,15)", n, lambda m=m, x=x: m.Process(x + 2))
+        m = psi_fix_sqrt(psi_fix_fmt_t(0, 2, 14), f15, *rs)
+        yield Benchmark("psi_fix_sqrt.Process", "in=(0,2,14) out=(1,0,15)", n, lambda m=m, a=absVal: m.Process(a))
+        m = psi_fix_pol2cart_approx(psi_fix_fmt_t(0, 0, 16), psi_fix_fmt_t(0, 0, 15), psi_fix_fmt_t(1, 0, 16), *rs)
+        yield Benchmark("psi_fix_pol2cart_approx.Process", "in=(0,0,16) out=(1,0,16)", n,
+                        lambda m=m, a=absVal, p=phase: m.Process(a, p))
+        m = psi_fix_lin_approx(psi_fix_lin_approx.CONFIGS.Sin18Bit)
+        yield Benchmark("psi_fix_lin_approx.Approximate", "Sin18Bit", n,
+                        lambda m=m, x=psi_fix_resize(phase, psi_fix_fmt_t(0, 0, 15), m.cfg.inFmt): m.Approximate(x))
+        m = psi_fix_lut(np.sin(np.linspace(0, np.pi, 1024)) * 0.99, f15)
+        yield Benchmark("psi_fix_lut.Process", "entries=1024", n,
+                        lambda m=m, i=np.random.RandomState(4).randint(0, 1024, n): m.Process(i))
+        m = psi_fix_phase_unwrap(f15, psi_fix_fmt_t(1, 3, 15), psi_fix_rnd_t.trunc)
+        yield Benchmark("psi_fix_phase_unwrap.Process", "in=(1,0,15) out=(1,3,15)", n, lambda m=m, x=x: m.Process(x))
+
+        # Filters
+        for ratio in (1, 4):
+            for taps in (12, 48):
+                m = psi_fix_fir(f15, psi_fix_fmt_t(1, 0, 16), psi_fix_fmt_t(1, 0, 17))
+                c = psi_fix_from_real(np.ones(taps) / taps, psi_fix_fmt_t(1, 0, 17))
+                yield Benchmark("psi_fix_fir.Filter", "taps={} ratio={}".format(taps, ratio), n,
+                                lambda m=m, x=x, r=ratio, c=c: m.Filter(x, r, c))
+        for gc in (psi_fix_mov_avg.GAINCORR_NONE, psi_fix_mov_avg.GAINCORR_EXACT):
+            m = psi_fix_mov_avg(f15, psi_fix_fmt_t(1, 1, 12), 7, gc)
+            yield Benchmark("psi_fix_mov_avg.Process", "taps=7 gaincorr={}".format(gc), n, lambda m=m, x=x: m.Process(x))
+        m = psi_fix_lowpass_iir_order1(100e6, 1e6, f15, psi_fix_fmt_t(1, 0, 14), psi_fix_fmt_t(1, 0, 24), psi_fix_fmt_t(1, 0, 17))
+        yield Benchmark("psi_fix_lowpass_iir_order1.Filter", "fs=100MHz fc=1MHz", n, lambda m=m, x=x: m.Filter(x))
+        for order, ratio in ((3, 10), (5, 100)):
+            m = psi_fix_cic_dec(order, ratio, 1, psi_fix_fmt_t(1, 0, 16), psi_fix_fmt_t(1, 0, 17), True)
+            yield Benchmark("psi_fix_cic_dec.Process", "order={} ratio={}".format(order, ratio), n,
+                            lambda m=m, x=x: m.Process(x))
+            m = psi_fix_cic_int(order, ratio, 1, psi_fix_fmt_t(1, 0, 16), psi_fix_fmt_t(1, 0, 17), True)
+            # Samples are counted at the output (high rate) side
+            yield Benchmark("psi_fix_cic_int.Process", "order={} ratio={}".format(order, ratio), max(1, n // ratio) * ratio,
+                            lambda m=m, x=x[:max(1, n // ratio)]: m.Process(x))
+
+        # Modulation
+        m = psi_fix_demod_real2cplx(f15, psi_fix_fmt_t(1, 0, 16), 25, 5, 1)
+        yield Benchmark("psi_fix_demod_real2cplx.Process", "ratio=5/1 coefBits=25", n, lambda m=m, x=x: m.Process(x, 0))
+        m = psi_fix_mod_cplx2real(psi_fix_fmt_t(1, 1, 15), psi_fix_fmt_t(1, 1, 23), psi_fix_fmt_t(1, 1, 23),
+                                  psi_fix_fmt_t(1, 1, 15), 5, 1)
+        yield Benchmark("psi_fix_mod_cplx2real.Process", "ratio=5/1", n, lambda m=m, x=x, y=y: m.Process(x, y))
+
+        # Generators
+        m = psi_fix_white_noise(psi_fix_fmt_t(1, 0, 19))
+        yield Benchmark("psi_fix_white_noise.Generate", "out=(1,0,19)", n, lambda m=m, n=n: m.Generate(n))
+        m = psi_fix_noise_awgn(psi_fix_fmt_t(1, 0, 19))
+        yield Benchmark("psi_fix_noise_awgn.Generate", "out=(1,0,19)", n, lambda m=m, n=n: m.Generate(n))
+
+########################################################################################################################
+# Runner
+########################################################################################################################
+def RunBenchmark(b : Benchmark, repeat : int) -> dict:
+    b.run()     # Warm-up
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        b.run()
+        times.append(time.perf_counter() - start)
+    return {"name" : b.name, "config" : b.config, "samples" : b.samples, "repeat" : repeat,
+            "seconds_min" : min(times), "seconds_mean" : float(np.mean(times)),
+            "samples_per_second" : b.samples / max(min(times), 1e-12)}
+
+def ResultKey(r : dict) -> tuple:
+    return r["name"], r["config"], r["samples"]
+
+def Compare(results, baseline, maxRegression : float) -> bool:
+    # Print the speedup compared to a baseline, returns False if any benchmark regressed more than allowed
+    base = {ResultKey(r) : r for r in baseline["results"]}
+    ok = True
+    for r in results:
+        if ResultKey(r) not in base:
+            continue
+        speedup = r["samples_per_second"] / base[ResultKey(r)]["samples_per_second"]
+        regressed = speedup < 1 - maxRegression
+        ok = ok and not regressed
+        print("{:<40} {:<50} {:>8} {:>8.2f}x{}".format(r["name"], r["config"], r["samples"], speedup,
+                                                       "  REGRESSION" if regressed else ""))
+    return ok
+
+def Main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark psi_fix_pkg functions and models")
+    parser.add_argument("-o", "--output", default="benchmark_results.json", help="JSON file to write results to")
+    parser.add_argument("-f", "--filter", default=".*", help="Only run benchmarks whose name matches this regex")
+    parser.add_argument("-s", "--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Input sizes in samples")
+    parser.add_argument("-r", "--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per benchmark")
+    parser.add_argument("-c", "--compare", default=None, help="JSON file of a previous run to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="Allowed throughput loss compared to --compare (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    results = []
+    for b in list(PkgBenchmarks(args.sizes)) + list(ModelBenchmarks(args.sizes)):
+        if not re.search(args.filter, b.name):
+            continue
+        r = RunBenchmark(b, args.repeat)
+        results.append(r)
+        print("{:<40} {:<50} {:>8} {:>14.0f} samples/s".format(r["name"], r["config"], r["samples"],
+                                                               r["samples_per_second"]))
+
+    with open(args.output, "w") as f:
+        json.dump({"timestamp" : datetime.datetime.now().isoformat(timespec="seconds"),
+                   "python" : platform.python_version(),
+                   "numpy" : np.__version__,
+                   "machine" : platform.platform(),
+                   "results" : results}, f, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print("\nSpeedup compared to {}:".format(args.compare))
+        if not Compare(results, baseline, args.max_regression):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -47,7 +47,7 @@ def psi_fix_bin_div(num, numFmt : psi_fix_fmt_t,
     denomComp = psi_fix_shift_left(denomAbs, denomAbsFmt, firstShift, firstShift, denomCompFmt)
     numComp = psi_fix_resize(numAbs, numAbsFmt, numCompFmt)
     iterations = outFmt.i+outFmt.f+2
-    resultInt = np.zeros(numComp.size)
+    resultInt = np.zeros(np.broadcast_shapes(np.shape(numComp), np.shape(denomComp)))
 
     #Execution
     for i in range(iterations):
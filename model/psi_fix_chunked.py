@@ -0,0 +1,170 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+
+########################################################################################################################
+# Imports
+########################################################################################################################
+from psi_fix_pkg import *
+from psi_fix_io import psi_fix_bin_file
+from psi_fix_pipeline import _PipelineStage
+import numpy as np
+from typing import Callable
+
+########################################################################################################################
+# Chunked (Out-of-Core) Execution
+########################################################################################################################
+class psi_fix_chunked:
+    """
+    Out-of-core execution of psi_fix operations and models on arrays that are larger than the RAM.
+
+    The inputs (e.g. numpy.memmap or psi_fix_bin_file) are read chunk by chunk along the last axis, the processing
+    function is called for each chunk and the results are written to the outputs (e.g. numpy.memmap, psi_fix_bin_file
+    or .npy files created on the fly). Only one chunk and the temporaries of its processing are held in memory.
+
+    State is handed over between chunks as in psi_fix_pipeline:
+    - Models that keep their state themselves are called with continueState=True and their Reset() method is passed
+      as reset (e.g. psi_fix_cic_dec, psi_fix_mov_avg, psi_fix_phase_unwrap)
+    - For models with a finite impulse response (e.g. psi_fix_fir), the last "history" input samples are prepended to
+      the next chunk and the corresponding output samples are discarded
+    - psi_fix_pkg functions and other memoryless models need no state (history=0, reset=None)
+
+    Usage example:
+    inp = psi_fix_bin_file("capture.bin")
+    resize = psi_fix_chunked(lambda x: psi_fix_resize(x, inFmt, outFmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat))
+    resize.Run(inp, psi_fix_bin_file.Create("resized.bin", outFmt, inp.channels, inp.samples))
+    cic = psi_fix_cic_dec(3, 10, 1, inFmt, cicFmt, True)
+    psi_fix_chunked(lambda x: cic.Process(x, continueState=True), decimation=10, reset=cic.Reset).Run(inp, "cic.npy")
+    fir = psi_fix_fir(inFmt, firFmt, coefFmt)
+    psi_fix_chunked(lambda x: fir.Filter(x, 1, coefs), history=len(coefs)-1).Run(inp, "fir.npy")
+    """
+
+    ####################################################################################################################
+    # Constructor
+    ####################################################################################################################
+    def __init__(self, process : Callable,
+                 chunkSize : int = 1 << 20,
+                 decimation : int = 1,
+                 interpolation : int = 1,
+                 history : int = 0,
+                 reset : Callable[[], None] = None):
+        """
+        Constructor
+        :param process: Function that processes one chunk. It is called with one argument per input (samples along
+                        the last axis) and returns an array or a tuple of arrays.
+        :param chunkSize: Number of input samples processed per chunk (must be a multiple of the decimation ratio)
+        :param decimation: Decimation ratio of the processing
+        :param interpolation: Interpolation ratio of the processing
+        :param history: Number of input samples prepended from the last chunk (0 = processing is memoryless or keeps
+                        its state itself). Must be a multiple of the decimation ratio.
+        :param reset: Function that resets the state of the processing (e.g. the Reset() method of the model)
+        """
+        if chunkSize < 1 or chunkSize % decimation != 0:
+            raise ValueError("psi_fix_chunked: chunkSize must be a positive multiple of the decimation ratio")
+        if decimation < 1 or interpolation < 1:
+            raise ValueError("psi_fix_chunked: decimation and interpolation must be >= 1")
+        if history < 0 or history % decimation != 0:
+            raise ValueError("psi_fix_chunked: history must be a non-negative multiple of the decimation ratio")
+        self.process = process
+        self.chunkSize = chunkSize
+        self._stage = _PipelineStage("chunked", lambda chunks: process(*chunks), None, None, decimation, interpolation,
+                                     history, reset)
+
+    ####################################################################################################################
+    # Public Methods
+    ####################################################################################################################
+    def Reset(self) -> None:
+        """
+        Reset the state (history kept between chunks and the reset function passed)
+        """
+        self._stage.Reset()
+
+    def Run(self, inputs, outputs = None, continueState : bool = False):
+        """
+        Process the inputs chunk by chunk
+        :param inputs: Input (array, numpy.memmap or psi_fix_bin_file) or tuple of inputs, all with the same number of
+                       samples (last axis). Fixed-point values are read from psi_fix_bin_file inputs.
+        :param outputs: Where the results are written to, one per output of the processing function (tuple for
+                        multiple outputs). Each output is either:
+                        - An array or numpy.memmap of the full output shape
+                        - A psi_fix_bin_file (opened with mode "r+")
+                        - A file name: a .npy file is created and returned as numpy.memmap
+                        - None (default): results are returned as in-memory arrays
+        :param continueState: False (default) = the state is reset before processing,
+                              True = continue from the state at the end of the last call
+        :return: Outputs (array/memmap/psi_fix_bin_file or tuple of them)
+        """
+        if not continueState:
+            self.Reset()
+        inputs = inputs if isinstance(inputs, tuple) else (inputs,)
+        samples = {self._Samples(i) for i in inputs}
+        if len(samples) != 1:
+            raise ValueError("psi_fix_chunked: All inputs must have the same number of samples")
+        samples = samples.pop()
+        if samples % self._stage.decimation != 0:
+            raise ValueError("psi_fix_chunked: Number of samples must be a multiple of the decimation ratio")
+        outSamples = samples * self._stage.interpolation // self._stage.decimation
+        targets = None
+        for start in range(0, samples, self.chunkSize):
+            chunks = tuple(self._Read(i, start, start + self.chunkSize) for i in inputs)
+            res = self._stage.Run(chunks)
+            isTuple = isinstance(res, tuple)
+            res = res if isTuple else (res,)
+            if targets is None:
+                targets = self._OpenOutputs(outputs, res, outSamples)
+            outStart = start * self._stage.interpolation // self._stage.decimation
+            for t, r in zip(targets, res):
+                self._Write(t, r, outStart)
+        if targets is None:
+            raise ValueError("psi_fix_chunked: No input samples")
+        for t in targets:
+            if isinstance(t, psi_fix_bin_file):
+                t.codes.flush()
+            elif isinstance(t, np.memmap):
+                t.flush()
+        return targets if isTuple else targets[0]
+
+    ####################################################################################################################
+    # Private Methods (do not call!)
+    ####################################################################################################################
+    @staticmethod
+    def _Samples(inp) -> int:
+        return inp.samples if isinstance(inp, psi_fix_bin_file) else np.shape(inp)[-1]
+
+    @staticmethod
+    def _Read(inp, start : int, stop : int) -> np.ndarray:
+        if isinstance(inp, psi_fix_bin_file):
+            return inp.GetData(start, stop)
+        return np.asarray(inp[..., start:stop])
+
+    @staticmethod
+    def _Write(target, data : np.ndarray, start : int):
+        if isinstance(target, psi_fix_bin_file):
+            target.SetData(data, start)
+        else:
+            target[..., start:start + data.shape[-1]] = data
+
+    @staticmethod
+    def _OpenOutputs(outputs, first : tuple, outSamples : int) -> tuple:
+        # Outputs are opened/created when the first chunk is processed (leading shape and data type are known then)
+        if not isinstance(outputs, tuple):
+            outputs = (None,) * len(first) if outputs is None else (outputs,)
+        if len(outputs) != len(first):
+            raise ValueError("psi_fix_chunked: {} outputs passed but the processing returns {}"
+                             .format(len(outputs), len(first)))
+        targets = []
+        for out, f in zip(outputs, first):
+            shape = f.shape[:-1] + (outSamples,)
+            if out is None:
+                out = np.empty(shape, f.dtype)
+            elif isinstance(out, str):
+                out = np.lib.format.open_memmap(out, mode="w+", dtype=f.dtype, shape=shape)
+            elif isinstance(out, psi_fix_bin_file):
+                if (out.channels, out.samples) != (int(np.prod(f.shape[:-1])), outSamples) or f.ndim > 2:
+                    raise ValueError("psi_fix_chunked: psi_fix_bin_file output must have {} channels and {} samples"
+                                     .format(int(np.prod(f.shape[:-1])), outSamples))
+            elif np.shape(out) != shape:
+                raise ValueError("psi_fix_chunked: Output has shape {}, expected {}".format(np.shape(out), shape))
+            targets.append(out)
+        return tuple(targets)
@@ -10,6 +10,7 @@
 from psi_fix_pkg import *
 import numpy as np
 from math import *
+from typing import Callable
 
 ########################################################################################################################
 # Decimating CIC model
@@ -28,7 +29,8 @@ class psi_fix_cic_dec:
                         diffDelay : int,
                         inFmt : psi_fix_fmt_t,
                         outFmt : psi_fix_fmt_t,
-                        autoGainCorr : bool):
+                        autoGainCorr : bool,
+                        trace : Callable[[str, np.ndarray], None] = None):
         """
         Creation of a decimating CIC model
         :param order: CIC order
@@ -37,6 +39,8 @@ class psi_fix_cic_dec:
         :param inFmt: Input fixed-point format
         :param outFmt: Output fixed-point format
         :param autoGainCorr: True = CIC gain is automatically compensated, False = CIC gain is not compensated
+        :param trace: Optional callback trace(name, values) that is called with internal signals ("int<n>" = integrator outputs,
+                      "diff<n>" = comb outputs). If None (default), no tracing is done (see psi_fix_probe).
         """
         #Store Config
         self.inFmt = inFmt
@@ -45,6 +49,7 @@ class psi_fix_cic_dec:
         self.ratio = ratio
         self.diffDelay = diffDelay
         self.autoGainCorr = autoGainCorr
+        self.trace = trace
         #Calculated constants
         self.cicGain = (ratio*diffDelay)**order
         self.cicAddBits = ceil(log2(self.cicGain))
@@ -58,32 +63,57 @@ class psi_fix_cic_dec:
         #Constants
         self.gcCoefFmt = psi_fix_fmt_t(0,1,16)
         self.gc = psi_fix_from_real(2**self.cicAddBits/self.cicGain, self.gcCoefFmt)
+        #State for block-wise processing
+        self.Reset()
 
     ####################################################################################################################
     # Public functions
     ####################################################################################################################
-    def Process(self, inp : np.ndarray):
+    def Reset(self):
+        """
+        Reset the filter state (integrators, differentiator delay lines and decimation phase) to zero
+        """
+        self._integrators = [int(0)] * self.order
+        self._diffLast = None
+        self._decimPhase = 0
+
+    def Process(self, inp : np.ndarray, continueState : bool = False):
         """
         Process data using the CIC model object
-        :param inp: Input data
+        :param inp: Input data. Leading axes are independent channels (e.g. shape (trials, samples)), the filter is
+                    applied along the last axis.
+        :param continueState: False (default) = the filter starts with all state being zero,
+                              True = continue from the state at the end of the last call (for block-wise processing).
+                              The result is the same as processing the concatenated blocks at once.
         :return: Output data
         """
+        if not continueState:
+            self.Reset()
         #Make iniput fixed point
         sig = psi_fix_from_real(inp, self.inFmt)
-
-        # Do integration in integer to avoid fixed point precision problems
-        sigInt = []
-        sigInt.append(np.array(psi_fix_get_bits_as_int(sig, self.inFmt), dtype=object))
+        samples = sig.shape[-1]
+        if self._diffLast is None:
+            self._diffLast = [np.zeros(sig.shape[:-1] + (self.diffDelay,)) for _ in range(self.order)]
+        elif self._diffLast[0].shape[:-1] != sig.shape[:-1]:
+            raise ValueError("psi_fix_cic_dec: Number of channels must not change when continueState=True is used")
+
+        # Do integration in integer to avoid fixed point precision problems (stages are calculated in place). Each
+        # integrator is a cumulative sum along the last axis, the modulo can be applied afterwards.
+        sigInt = np.array(psi_fix_get_bits_as_int(sig, self.inFmt), dtype=object)
+        mod = 1 << int(psi_fix_size(self.accuFmt))
         for stage in range(self.order):
-            stageOut = np.zeros(sig.size, dtype=object)
-            integrator = int(0)
-            for i in range(sig.size):
-                integrator = (integrator + sigInt[stage][i]) % (1 << int(psi_fix_size(self.accuFmt)))
-                stageOut[i] = integrator
-            sigInt.append(stageOut)
+            np.cumsum(sigInt, axis=-1, out=sigInt)
+            sigInt += self._integrators[stage]
+            sigInt %= mod
+            if samples > 0:
+                self._integrators[stage] = sigInt[..., -1:].copy()
+            if self.trace is not None:
+                self._TraceAccu("int{}".format(stage+1), sigInt)
 
         # Do decimation and shift
-        sigDecFull = np.array(sigInt[self.order][::self.ratio], dtype=object)
+        sigDecFull = sigInt[..., self._decimPhase::self.ratio].copy()
+        del sigInt
+        self._decimPhase = (self._decimPhase - samples) % self.ratio
         addFracPlaces = self.diffFmt.f - self.accuFmt.f
         if self.shift - addFracPlaces > 0:
             sigDecSft = (sigDecFull >> (self.shift - addFracPlaces)) % (1 << int(psi_fix_size(self.diffFmt)))
@@ -91,31 +121,33 @@ class psi_fix_cic_dec:
             sigDecSft = (sigDecFull << (addFracPlaces - self.shift)) % (1 << int(psi_fix_size(self.diffFmt)))
         signBitValue = 1 << int(psi_fix_size(self.diffFmt) - 1)
         sigDecSft = np.where(sigDecSft >= signBitValue, sigDecSft - 2 * signBitValue, sigDecSft)
-        sigDec = psi_fix_from_bits_as_int(sigDecSft, self.diffFmt)
+        sigDiff = psi_fix_from_bits_as_int(sigDecSft, self.diffFmt)
         # Do differentiation
-        sigDiff = []
-        sigDiff.append(sigDec)
         for stage in range(self.order):
-            last = np.concatenate((np.zeros([self.diffDelay]), sigDiff[stage][0:-self.diffDelay]))
-            stageOut = psi_fix_sub(sigDiff[stage], self.diffFmt,
-                                 last, self.diffFmt, self.diffFmt)
-            sigDiff.append(stageOut)
+            decSamples = sigDiff.shape[-1]
+            ext = np.concatenate((self._diffLast[stage], sigDiff), axis=-1)
+            last = ext[..., :decSamples]
+            self._diffLast[stage] = ext[..., decSamples:].copy()
+            sigDiff = psi_fix_sub(sigDiff, self.diffFmt,
+                                  last, self.diffFmt, self.diffFmt)
+            if self.trace is not None:
+                self.trace("diff{}".format(stage+1), sigDiff)
         # Gain Compensation
         if self.autoGainCorr:
-            sigGcIn = psi_fix_resize(sigDiff[self.order], self.diffFmt, self.gcInFmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+            sigGcIn = psi_fix_resize(sigDiff, self.diffFmt, self.gcInFmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
             sigGcOut = psi_fix_mult(sigGcIn, self.gcInFmt,
                                   self.gc, self.gcCoefFmt,
                                   self.outFmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
             return sigGcOut
         else:
-            return psi_fix_resize(sigDiff[self.order], self.diffFmt, self.outFmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
-
-
-
-
-
-
-
-
-
+            return psi_fix_resize(sigDiff, self.diffFmt, self.outFmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
 
+    ####################################################################################################################
+    # Private functions (do not call!)
+    ####################################################################################################################
+    def _TraceAccu(self, name : str, bits : np.ndarray):
+        # Integrators are calculated as unsigned integers (modulo 2^accuBits), trace them as fixed-point values
+        size = int(psi_fix_size(self.accuFmt))
+        if self.accuFmt.s == 1:
+            bits = np.where(bits >= (1 << (size - 1)), bits - (1 << size), bits)
+        self.trace(name, bits.astype(np.float64) * 2.0**-self.accuFmt.f)
@@ -10,6 +10,7 @@
 from psi_fix_pkg import *
 import numpy as np
 from math import *
+from typing import Callable
 
 ########################################################################################################################
 # Interpolating CIC model
@@ -28,7 +29,8 @@ class psi_fix_cic_int:
                         diffDelay : int,
                         inFmt : psi_fix_fmt_t,
                         outFmt : psi_fix_fmt_t,
-                        autoGainCorr : bool):
+                        autoGainCorr : bool,
+                        trace : Callable[[str, np.ndarray], None] = None):
         """
         Creation of a interpolating CIC model
         :param order: CIC order
@@ -37,6 +39,8 @@ class psi_fix_cic_int:
         :param inFmt: Input fixed-point format
         :param outFmt: Output fixed-point format
         :param autoGainCorr: True = CIC gain is automatically compensated, False = CIC gain is not compensated
+        :param trace: Optional callback trace(name, values) that is called with internal signals ("diff<n>" = comb outputs,
+                      "int<n>" = integrator outputs). If None (default), no tracing is done (see psi_fix_probe).
         """
         #Store Config
         self.inFmt = inFmt
@@ -45,6 +49,7 @@ class psi_fix_cic_int:
         self.ratio = ratio
         self.diffDelay = diffDelay
         self.autoGainCorr = autoGainCorr
+        self.trace = trace
         #Calculated constants
         self.cicGain = ((ratio*diffDelay)**order)/ratio
         self.cicAddBits = ceil(log2(self.cicGain))
@@ -67,7 +72,8 @@ class psi_fix_cic_int:
     def Process(self, inp : np.ndarray):
         """
         Process data using the CIC model object
-        :param inp: Input data
+        :param inp: Input data. Leading axes are independent channels (e.g. shape (trials, samples)), the filter is
+                    applied along the last axis.
         :return: Output data
         """
 
@@ -75,31 +81,28 @@ class psi_fix_cic_int:
         sig = psi_fix_from_real(inp, self.inFmt)
 
         # Do differentiation
-        sigDiff = []
-        sigDiff.append(sig)
+        sigDiff = sig
         for stage in range(self.order):
-            last = np.concatenate((np.zeros([self.diffDelay]), sigDiff[stage][0:-self.diffDelay]))
-            stageOut = psi_fix_sub(sigDiff[stage], self.diffFmt,
-                                 last, self.diffFmt, self.diffFmt)
-            sigDiff.append(stageOut)
+            last = np.concatenate((np.zeros(sig.shape[:-1] + (self.diffDelay,)), sigDiff[..., 0:-self.diffDelay]), axis=-1)
+            sigDiff = psi_fix_sub(sigDiff, self.diffFmt,
+                                  last, self.diffFmt, self.diffFmt)
+            if self.trace is not None:
+                self.trace("diff{}".format(stage+1), sigDiff)
 
         # Insert Zeros
-        diffOut = sigDiff[-1]
-        interpol = np.zeros((self.ratio,diffOut.size))
-        interpol[0] = diffOut
-        interpol = np.reshape(interpol, (1,interpol.size), "F")[0]
-
-        # Do integration in integer to avoid fixed point precision problems
-        sigInt = []
-        sigInt.append(np.array(psi_fix_get_bits_as_int(interpol, self.accuFmt), dtype=object))
+        interpol = np.zeros(sigDiff.shape[:-1] + (sigDiff.shape[-1]*self.ratio,))
+        interpol[..., ::self.ratio] = sigDiff
+
+        # Do integration in integer to avoid fixed point precision problems (stages are calculated in place). Each
+        # integrator is a cumulative sum along the last axis, the modulo can be applied afterwards.
+        intOut = np.array(psi_fix_get_bits_as_int(interpol, self.accuFmt), dtype=object)
+        del interpol
+        mod = 1 << int(psi_fix_size(self.accuFmt))
         for stage in range(self.order):
-            stageOut = np.zeros(interpol.size, dtype=object)
-            integrator = int(0)
-            for i in range(interpol.size):
-                integrator = (integrator + sigInt[stage][i]) % (1 << int(psi_fix_size(self.accuFmt)))
-                stageOut[i] = integrator
-            sigInt.append(stageOut)
-        intOut = sigInt[-1]
+            np.cumsum(intOut, axis=-1, out=intOut)
+            intOut %= mod
+            if self.trace is not None:
+                self._TraceAccu("int{}".format(stage+1), intOut)
 
         # Do decimation and shift
         addFracPlaces = self.shiftOutFmt.f - self.accuFmt.f
@@ -121,12 +124,12 @@ class psi_fix_cic_int:
         else:
             return psi_fix_resize(sigSft, self.shiftOutFmt, self.outFmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
 
-
-
-
-
-
-
-
-
-
+    ####################################################################################################################
+    # Private functions (do not call!)
+    ####################################################################################################################
+    def _TraceAccu(self, name : str, bits : np.ndarray):
+        # Integrators are calculated as unsigned integers (modulo 2^accuBits), trace them as fixed-point values
+        size = int(psi_fix_size(self.accuFmt))
+        if self.accuFmt.s == 1:
+            bits = np.where(bits >= (1 << (size - 1)), bits - (1 << size), bits)
+        self.trace(name, bits.astype(np.float64) * 2.0**-self.accuFmt.f)
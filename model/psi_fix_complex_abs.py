@@ -35,7 +35,21 @@ class psi_fix_complex_abs:
         #Input quantization
         i_fix = psi_fix_from_real(dataI, self._inFmt)
         q_fix = psi_fix_from_real(dataQ, self._inFmt)
+        return self._ProcessFix(i_fix, q_fix)
 
+    def ProcessComplex(self, data) -> np.ndarray:
+        """
+        Processing function for complex data
+        :param data: Input data as complex array or packed integer I/Q buffer (see psi_fix_cplx_unpack)
+        :return: absolute value (as integer bits for packed input)
+        """
+        i_fix, q_fix = psi_fix_cplx_unpack(data, self._inFmt)
+        res = self._ProcessFix(i_fix, q_fix)
+        if psi_fix_cplx_is_packed(data):
+            return psi_fix_get_bits_as_int(res, self._outFmt)
+        return res
+
+    def _ProcessFix(self, i_fix : np.ndarray, q_fix : np.ndarray) -> np.ndarray:
         #Input normalization (to range +/- 1.0)
         i_norm = psi_fix_shift_right(i_fix, self._inFmt, self._inFmt.i, self._inFmt.i, self._inFmtNorm)
         q_norm = psi_fix_shift_right(q_fix, self._inFmt, self._inFmt.i, self._inFmt.i, self._inFmtNorm)
@@ -19,7 +19,17 @@ class psi_fix_complex_addsub:
         aqf = psi_fix_from_real(aq, self.inAFmt)
         bif = psi_fix_from_real(bi, self.inBFmt)
         bqf = psi_fix_from_real(bq, self.inBFmt)
+        return self._ProcessFix(aif, aqf, bif, bqf, addSub)
 
+    # Complex data as complex arrays or packed integer I/Q buffers (see psi_fix_cplx_unpack), returns the result in
+    # the same representation as a
+    def ProcessComplex(self, a, b, addSub):
+        aif, aqf = psi_fix_cplx_unpack(a, self.inAFmt)
+        bif, bqf = psi_fix_cplx_unpack(b, self.inBFmt)
+        sumI, sumQ = self._ProcessFix(aif, aqf, bif, bqf, addSub)
+        return psi_fix_cplx_pack(sumI, sumQ, self.outFmt, psi_fix_cplx_is_packed(a))
+
+    def _ProcessFix(self, aif, aqf, bif, bqf, addSub):
         #Summations
         if addSub==1:
             sumI = psi_fix_add(aif, self.inAFmt, bif, self.inBFmt, self.outFmt, self.rnd, self.sat)
@@ -56,7 +56,25 @@ class psi_fix_complex_mult:
         aqf = psi_fix_from_real(aq, self.inAFmt)
         bif = psi_fix_from_real(bi, self.inBFmt)
         bqf = psi_fix_from_real(bq, self.inBFmt)
+        return self._ProcessFix(aif, aqf, bif, bqf)
 
+    def ProcessComplex(self, a, b):
+        """
+        Process complex data using the complex multiplication model
+
+        :param a: Input A as complex array or packed integer I/Q buffer (see psi_fix_cplx_unpack)
+        :param b: Input B as complex array or packed integer I/Q buffer (see psi_fix_cplx_unpack)
+        :return: Result in the same representation as input A
+        """
+        aif, aqf = psi_fix_cplx_unpack(a, self.inAFmt)
+        bif, bqf = psi_fix_cplx_unpack(b, self.inBFmt)
+        sumI, sumQ = self._ProcessFix(aif, aqf, bif, bqf)
+        return psi_fix_cplx_pack(sumI, sumQ, self.outFmt, psi_fix_cplx_is_packed(a))
+
+    ####################################################################################################################
+    # Private functions (do not call!)
+    ####################################################################################################################
+    def _ProcessFix(self, aif, aqf, bif, bqf):
         # Multiplications
         multIQ = psi_fix_mult(aif, self.inAFmt, bqf, self.inBFmt, self.internalFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
         multQI = psi_fix_mult(aqf, self.inAFmt, bif, self.inBFmt, self.internalFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
@@ -45,18 +45,36 @@ class psi_fix_cordic_abs_pl:
         :param inpQ: Imaginary-part of the input
         :return: Result (absolute value)
         """
-        x = psi_fix_abs(psi_fix_from_real(inpI, self.inFmt), self.inFmt, self.internalFmt, self.round, self.sat)
-        y = psi_fix_resize(psi_fix_from_real(inpQ, self.inFmt), self.inFmt, self.internalFmt, self.round, self.sat)
+        return self._ProcessFix(psi_fix_from_real(inpI, self.inFmt), psi_fix_from_real(inpQ, self.inFmt))
+
+    def ProcessComplex(self, inp):
+        """
+        Process complex data using the model object
+        :param inp: Input as complex array or packed integer I/Q buffer (see psi_fix_cplx_unpack)
+        :return: Result (absolute value, as integer bits for packed input)
+        """
+        res = self._ProcessFix(*psi_fix_cplx_unpack(inp, self.inFmt))
+        if psi_fix_cplx_is_packed(inp):
+            return psi_fix_get_bits_as_int(res, self.outFmt)
+        return res
+
+    ####################################################################################################################
+    # Private functions (do not call!)
+    ####################################################################################################################
+    def _ProcessFix(self, inpI, inpQ):
+        x = psi_fix_abs(inpI, self.inFmt, self.internalFmt, self.round, self.sat)
+        y = psi_fix_resize(inpQ, self.inFmt, self.internalFmt, self.round, self.sat)
         for i in range(0, self.iterations):
             sftFmt = psi_fix_fmt_t(1, self.internalFmt.i-i, self.internalFmt.f+i)
-            x_sft = psi_fix_from_real(x / 2 ** i, sftFmt)
-            y_sft = psi_fix_from_real(y / 2 ** i, sftFmt)
-            x_sub = psi_fix_sub(x, self.internalFmt, y_sft, sftFmt, self.internalFmt, self.round, self.sat)
-            x_add = psi_fix_add(x, self.internalFmt, y_sft, sftFmt, self.internalFmt, self.round, self.sat)
-            x_next = np.where(y < 0, x_sub, x_add)
-            y_sub = psi_fix_sub(y, self.internalFmt, x_sft, sftFmt, self.internalFmt, self.round, self.sat)
-            y_add = psi_fix_add(y, self.internalFmt, x_sft, sftFmt, self.internalFmt, self.round, self.sat)
-            y_next = np.where(y < 0, y_add, y_sub)
+            # Only the branch taken is calculated: a - b is calculated as a + (-b), the operand format has one integer
+            # bit more than sftFmt so -b cannot overflow. The shifted operands are negated in place.
+            opFmt = psi_fix_fmt_t(1, sftFmt.i+1, sftFmt.f)
+            x_sft = psi_fix_from_real(x / 2 ** i, sftFmt, out=np.empty(np.shape(x)))
+            y_sft = psi_fix_from_real(y / 2 ** i, sftFmt, out=np.empty(np.shape(y)))
+            np.negative(y_sft, out=y_sft, where=y < 0)
+            np.negative(x_sft, out=x_sft, where=y >= 0)
+            x_next = psi_fix_add(x, self.internalFmt, y_sft, opFmt, self.internalFmt, self.round, self.sat)
+            y_next = psi_fix_add(y, self.internalFmt, x_sft, opFmt, self.internalFmt, self.round, self.sat)
             x = x_next
             y = y_next
         return psi_fix_resize(x, self.internalFmt, self.outFmt, self.round, self.sat)
@@ -9,6 +9,7 @@
 ########################################################################################################################
 from psi_fix_pkg import *
 import numpy as np
+from typing import Callable
 
 ########################################################################################################################
 # Rotating CORDIC (Polar to Cartesian)
@@ -33,7 +34,8 @@ class psi_fix_cordic_rot:
                         iterations : int,
                         gainComp : bool,
                         round : psi_fix_rnd_t,
-                        sat : psi_fix_sat_t):
+                        sat : psi_fix_sat_t,
+                        trace : Callable[[str, np.ndarray], None] = None):
         """
         Constructor of a rotating CORDIC model.
 
@@ -50,6 +52,8 @@ class psi_fix_cordic_rot:
         :param gainComp: True=CORDIC gain is compensated internally, False = CORDIC gain is not compensated
         :param round: Rounding mode at the output
         :param sat: Saturation mode at the output
+        :param trace: Optional callback trace(name, values) that is called with internal signals ("x<i>", "y<i>" and
+                      "z<i>" after iteration i). If None (default), no tracing is done (see psi_fix_probe).
         """
         #Checks
         if inAngleFmt.s == 1:           raise ValueError("psi_fix_cordic_rot: InAngleFmt_g must be unsigned")
@@ -66,10 +70,13 @@ class psi_fix_cordic_rot:
         self.iterations = iterations
         self.round = round
         self.sat = sat
+        self.trace = trace
         self.angleIntFmt = angleIntFmt
         self.gainComp = gainComp
         self.gainCompCoef = psi_fix_from_real(1/self.CordicGain, self.GAIN_COMP_FMT)
         self.angleIntExtFmt = psi_fix_fmt_t(angleIntFmt.s, max(angleIntFmt.i, 1), angleIntFmt.f)
+        self.operandFmt = psi_fix_fmt_t(1, internalFmt.i+1, internalFmt.f)
+        self.angleOperandFmt = psi_fix_fmt_t(1, angleIntFmt.i+1, angleIntFmt.f)
         #Angle table for up to 32 iterations
         self.angleTable = psi_fix_from_real(self.ATAN_TABLE, angleIntFmt)
 
@@ -98,7 +105,7 @@ class psi_fix_cordic_rot:
 
         #Initialization - always map to quadrant one
         x = psi_fix_resize(inpAbs, self.inAbsFmt, self.internalFmt, self.round, self.sat)
-        y = 0
+        y = np.zeros(np.shape(x))
         z = psi_fix_resize(inpAngle, self.inAngleFmt, self.angleIntFmt, self.round, psi_fix_sat_t.wrap)
         quad = psi_fix_resize(inpAngle, self.inAngleFmt, self.QUAD_FMT, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
 
@@ -110,6 +117,10 @@ class psi_fix_cordic_rot:
             x = x_next
             y = y_next
             z = z_next
+            if self.trace is not None:
+                self.trace("x{}".format(i), x)
+                self.trace("y{}".format(i), y)
+                self.trace("z{}".format(i), z)
 
         #Quadrant correction
         yInv = psi_fix_neg(y, self.internalFmt, self.internalFmt, self.round, self.sat)
@@ -130,29 +141,22 @@ class psi_fix_cordic_rot:
     ####################################################################################################################
     # Private Methods (do not call!)
     ####################################################################################################################
+    # Only the branch taken is calculated per iteration: a - b is calculated as a + (-b) with b in the operand format
+    # (one integer bit more, so -b cannot overflow). The exact result and hence the wrapped output are the same. The
+    # shifted operand is calculated into a new array and negated in place (no array is allocated for the other branch).
     def _CordicStepX(self, xLast, yLast, zLast, shift : int):
-        yShifted = psi_fix_shift_right(yLast, self.internalFmt, shift, self.iterations-1, self.internalFmt)
-        sub = psi_fix_sub(xLast, self.internalFmt, yShifted, self.internalFmt, self.internalFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        add = psi_fix_add(xLast, self.internalFmt, yShifted, self.internalFmt, self.internalFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        return np.where(zLast > 0, sub, add)
+        yShifted = psi_fix_shift_right(yLast, self.internalFmt, shift, self.iterations-1, self.internalFmt,
+                                       out=np.empty(np.shape(yLast)))
+        np.negative(yShifted, out=yShifted, where=zLast > 0)
+        return psi_fix_add(xLast, self.internalFmt, yShifted, self.operandFmt, self.internalFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
 
     def _CordicStepY(self, xLast, yLast, zLast, shift: int):
-        xShifted = psi_fix_shift_right(xLast, self.internalFmt, shift, self.iterations - 1, self.internalFmt)
-        add = psi_fix_add(yLast, self.internalFmt, xShifted, self.internalFmt, self.internalFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        sub = psi_fix_sub(yLast, self.internalFmt, xShifted, self.internalFmt, self.internalFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        out = np.where(zLast > 0, add, sub)
-        return out
+        xShifted = psi_fix_shift_right(xLast, self.internalFmt, shift, self.iterations - 1, self.internalFmt,
+                                       out=np.empty(np.shape(xLast)))
+        np.negative(xShifted, out=xShifted, where=zLast <= 0)
+        return psi_fix_add(yLast, self.internalFmt, xShifted, self.operandFmt, self.internalFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
 
     def _CordicStepZ(self, zLast, iteration : int):
-        add = psi_fix_add(zLast, self.angleIntFmt, self.angleTable[iteration], self.angleIntFmt, self.angleIntFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        sub = psi_fix_sub(zLast, self.angleIntFmt, self.angleTable[iteration], self.angleIntFmt, self.angleIntFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        return np.where(zLast > 0, sub, add)
-
-
-
-
-
-
-
-
-
+        angle = np.full(np.shape(zLast), self.angleTable[iteration])
+        np.negative(angle, out=angle, where=zLast > 0)
+        return psi_fix_add(zLast, self.angleIntFmt, angle, self.angleOperandFmt, self.angleIntFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
@@ -9,6 +9,7 @@
 ########################################################################################################################
 from psi_fix_pkg import *
 import numpy as np
+from typing import Callable
 
 ########################################################################################################################
 # Vectoring CORDIC (Cartesian to Polar)
@@ -32,7 +33,8 @@ class psi_fix_cordic_vect:
                         iterations : int,
                         gainComp : bool,
                         round : psi_fix_rnd_t,
-                        sat : psi_fix_sat_t):
+                        sat : psi_fix_sat_t,
+                        trace : Callable[[str, np.ndarray], None] = None):
         """
         Constructor of a vectoring CORDIC model.
         :param inFmt: Input fixed-point format
@@ -44,6 +46,8 @@ class psi_fix_cordic_vect:
         :param gainComp: True=CORDIC gain is compensated internally, False = CORDIC gain is not compensated
         :param round: Rounding mode at the output
         :param sat: Saturation mode at the output
+        :param trace: Optional callback trace(name, values) that is called with internal signals ("x<i>", "y<i>" and
+                      "z<i>" after iteration i). If None (default), no tracing is done (see psi_fix_probe).
         """
         #Checks
         if inFmt.s != 1:                raise ValueError("psi_fix_cordic_vect: InFmt_g must be signed")
@@ -59,11 +63,14 @@ class psi_fix_cordic_vect:
         self.iterations = iterations
         self.round = round
         self.sat = sat
+        self.trace = trace
         self.angleFmt = angleFmt
         self.angleIntFmt = angleIntFmt
         self.gainComp = gainComp
         self.gainCompCoef = psi_fix_from_real(1/self.CordicGain, self.GAIN_COMP_FMT)
         self.angleIntExtFmt = psi_fix_fmt_t(angleIntFmt.s, max(angleIntFmt.i, 1), angleIntFmt.f)
+        self.operandFmt = psi_fix_fmt_t(1, internalFmt.i+1, internalFmt.f)
+        self.angleOperandFmt = psi_fix_fmt_t(1, angleIntFmt.i+1, angleIntFmt.f)
         #Angle table for up to 32 iterations
         self.angleTable = psi_fix_from_real(self.ATAN_TABLE, angleIntFmt)
 
@@ -89,9 +96,26 @@ class psi_fix_cordic_vect:
         :param inpQ: Imaginary-part of the input
         :return: Output as tuple (abs, angle)
         """
+        return self._ProcessFix(psi_fix_from_real(inpI, self.inFmt), psi_fix_from_real(inpQ, self.inFmt))
+
+    def ProcessComplex(self, inp):
+        """
+        Run the bittrue model on complex data
+        :param inp: Input as complex array or packed integer I/Q buffer (see psi_fix_cplx_unpack)
+        :return: Output as tuple (abs, angle), as integer bits for packed input
+        """
+        xOut, zOut = self._ProcessFix(*psi_fix_cplx_unpack(inp, self.inFmt))
+        if psi_fix_cplx_is_packed(inp):
+            return (psi_fix_get_bits_as_int(xOut, self.outFmt), psi_fix_get_bits_as_int(zOut, self.angleFmt))
+        return (xOut, zOut)
+
+    ####################################################################################################################
+    # Private Methods (do not call!)
+    ####################################################################################################################
+    def _ProcessFix(self, inpI, inpQ):
         #always map to quadrant one
-        x = psi_fix_abs(psi_fix_from_real(inpI, self.inFmt), self.inFmt, self.internalFmt, self.round, self.sat)
-        y = psi_fix_abs(psi_fix_from_real(inpQ, self.inFmt), self.inFmt, self.internalFmt, self.round, self.sat)
+        x = psi_fix_abs(inpI, self.inFmt, self.internalFmt, self.round, self.sat)
+        y = psi_fix_abs(inpQ, self.inFmt, self.internalFmt, self.round, self.sat)
         z = 0
         for i in range(0, self.iterations):
             x_next = self._CordicStepX(x, y, i)
@@ -100,6 +124,10 @@ class psi_fix_cordic_vect:
             x = x_next
             y = y_next
             z = z_next
+            if self.trace is not None:
+                self.trace("x{}".format(i), x)
+                self.trace("y{}".format(i), y)
+                self.trace("z{}".format(i), z)
         zQ1 = psi_fix_resize(z, self.angleIntFmt, self.angleFmt, self.round, self.sat)
         zQ2 = psi_fix_sub(0.5, self.angleIntExtFmt, z, self.angleIntFmt, self.angleFmt, self.round, self.sat)
         zQ3 = psi_fix_add(0.5, self.angleIntExtFmt, z, self.angleIntFmt, self.angleFmt, self.round, self.sat)
@@ -114,31 +142,22 @@ class psi_fix_cordic_vect:
             xOut = psi_fix_resize(x, self.internalFmt, self.outFmt, self.round, self.sat)
         return (xOut, zOut)
 
-    ####################################################################################################################
-    # Private Methods (do not call!)
-    ####################################################################################################################
+    # Only the branch taken is calculated per iteration: a - b is calculated as a + (-b) with b in the operand format
+    # (one integer bit more, so -b cannot overflow). The exact result and hence the wrapped output are the same. The
+    # shifted operand is calculated into a new array and negated in place (no array is allocated for the other branch).
     def _CordicStepX(self, xLast, yLast, shift : int):
-        yShifted = psi_fix_shift_right(yLast, self.internalFmt, shift, self.iterations-1, self.internalFmt)
-        sub = psi_fix_sub(xLast, self.internalFmt, yShifted, self.internalFmt, self.internalFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        add = psi_fix_add(xLast, self.internalFmt, yShifted, self.internalFmt, self.internalFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        return np.where(yLast < 0, sub, add)
+        yShifted = psi_fix_shift_right(yLast, self.internalFmt, shift, self.iterations-1, self.internalFmt,
+                                       out=np.empty(np.shape(yLast)))
+        np.negative(yShifted, out=yShifted, where=yLast < 0)
+        return psi_fix_add(xLast, self.internalFmt, yShifted, self.operandFmt, self.internalFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
 
     def _CordicStepY(self, xLast, yLast, shift: int):
-        xShifted = psi_fix_shift_right(xLast, self.internalFmt, shift, self.iterations - 1, self.internalFmt)
-        add = psi_fix_add(yLast, self.internalFmt, xShifted, self.internalFmt, self.internalFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        sub = psi_fix_sub(yLast, self.internalFmt, xShifted, self.internalFmt, self.internalFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        out = np.where(yLast < 0, add, sub)
-        return out
+        xShifted = psi_fix_shift_right(xLast, self.internalFmt, shift, self.iterations - 1, self.internalFmt,
+                                       out=np.empty(np.shape(xLast)))
+        np.negative(xShifted, out=xShifted, where=yLast >= 0)
+        return psi_fix_add(yLast, self.internalFmt, xShifted, self.operandFmt, self.internalFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
 
     def _CordicStepZ(self, zLast, yLast, iteration : int):
-        add = psi_fix_add(zLast, self.angleIntFmt, self.angleTable[iteration], self.angleIntFmt, self.angleIntFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        sub = psi_fix_sub(zLast, self.angleIntFmt, self.angleTable[iteration], self.angleIntFmt, self.angleIntFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        return np.where(yLast < 0, sub, add)
-
-
-
-
-
-
-
-
+        angle = np.full(np.shape(yLast), self.angleTable[iteration])
+        np.negative(angle, out=angle, where=yLast < 0)
+        return psi_fix_add(zLast, self.angleIntFmt, angle, self.angleOperandFmt, self.angleIntFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
@@ -53,20 +53,20 @@ class psi_fix_dds_18b:
         """
         Synthesize a signal from phase-step/phase-offset arrays
 
-        :param phaseStep: Array with phase step value for each sample
-        :param phaseOffset: Array with phase offset value for each sample
+        :param phaseStep: Array with phase step value for each sample. Leading axes are independent channels (e.g.
+                          shape (channels, samples)), the phase is accumulated along the last axis.
+        :param phaseOffset: Array with phase offset value for each sample (same shape as phaseStep)
         :return: Synthesized signals as tuple (sin, cos)
         """
-        if phaseStep.size != phaseOffset.size:
-            raise ValueError("psi_fix_dds_18b: Process() phaserStep and phaseOffset arrays must be of same size")
+        if np.shape(phaseStep) != np.shape(phaseOffset):
+            raise ValueError("psi_fix_dds_18b: Process() phaserStep and phaseOffset arrays must be of same shape")
         #Calculate inputs
         phaseStepFix = psi_fix_from_real(phaseStep, self.phaseFmt)
         phaseOffsetFix = psi_fix_from_real(phaseOffset, self.phaseFmt)
-        numOfSamples = phaseStepFix.size
         #Generate phases (use integer to prevent floating point precision errors)
-        phaseSteps = np.ones(numOfSamples,dtype=np.int64)*psi_fix_get_bits_as_int(phaseStepFix, self.phaseFmt)
-        phaseSteps[0] = 0 #start at zero
-        accumulator = np.cumsum(phaseSteps,dtype=np.int64) + psi_fix_get_bits_as_int(phaseOffsetFix, self.phaseFmt)
+        phaseSteps = np.ones(np.shape(phaseStepFix),dtype=np.int64)*psi_fix_get_bits_as_int(phaseStepFix, self.phaseFmt)
+        phaseSteps[..., 0] = 0 #start at zero
+        accumulator = np.cumsum(phaseSteps,axis=-1,dtype=np.int64) + psi_fix_get_bits_as_int(phaseOffsetFix, self.phaseFmt)
         accuWrapped = accumulator % 2**psi_fix_size(self.phaseFmt)
         accuPhase = psi_fix_from_bits_as_int(accuWrapped, self.phaseFmt)
         #Generate sine wave
@@ -10,7 +10,7 @@
 from psi_fix_pkg import *
 import numpy as np
 from psi_fix_pkg import *
-from typing import Tuple, Union
+from typing import Tuple, Union, Callable
 from psi_fix_mov_avg import psi_fix_mov_avg
 
 ########################################################################################################################
@@ -21,7 +21,8 @@ class psi_fix_demod_real2cplx:
     ####################################################################################################################
     # Constructor
     ####################################################################################################################
-    def __init__(self, inFmt: psi_fix_fmt_t, outFmt : psi_fix_fmt_t, coefBits : int, ratio_num: int, ratio_den : int, debug : bool = False):
+    def __init__(self, inFmt: psi_fix_fmt_t, outFmt : psi_fix_fmt_t, coefBits : int, ratio_num: int, ratio_den : int,
+                 trace : Callable[[str, np.ndarray], None] = None, reuseBuffers : bool = False):
         """
         Constructor for the demodulator model object
         :param inFmt: Input fixed-point format
@@ -29,58 +30,82 @@ class psi_fix_demod_real2cplx:
         :param coefBits: Number of bits to use for the coefficients of the sin/cos demodulation table
         :param ratio_num: Ratio Fsample/Fsignal (must be integer)
         :param ratio_den: Ratio denominator
-        :param debug: Debugging mode
+        :param trace: Optional callback trace(name, values) that is called with internal signals ("cpt" = table
+                      pointer, "mult_i"/"mult_q" = multiplier outputs). If None (default), no tracing is done
+                      (see psi_fix_probe).
+        :param reuseBuffers: True = intermediate buffers are kept and reused by the next call (reduces allocations when
+                             processing equally sized blocks), False (default) = buffers are freed after each call
         """
         self.inFmt = inFmt
         self.outFmt = outFmt
         self.ratio_num = ratio_num
         self.ratio_den = ratio_den
-        self._debug = debug
+        self.trace = trace
         coefUnusedIntBits = np.floor(np.log2(ratio_num))
         self.coefFmt = psi_fix_fmt_t(1, 0-coefUnusedIntBits, coefBits+coefUnusedIntBits-1)
         #self.multFmt = psi_fix_fmt_t(1, self.inFmt.i+self.coefFmt.i, self.outFmt.f+np.ceil(np.log2(ratio_num/ratio_den)) + 2) #truncation error does only lead to 1/4 LSB error on output
         self.multFmt = psi_fix_fmt_t(1, self.inFmt.i+self.coefFmt.i, self.outFmt.f+np.ceil(np.log2(ratio_num)) + 2) #truncation error does only lead to 1/4 LSB error on output
-        self.movAvg = psi_fix_mov_avg(self.multFmt, self.outFmt, ratio_num, psi_fix_mov_avg.GAINCORR_NONE, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+        self.movAvg = psi_fix_mov_avg(self.multFmt, self.outFmt, ratio_num, psi_fix_mov_avg.GAINCORR_NONE, psi_fix_rnd_t.round, psi_fix_sat_t.sat,
+                                      reuseBuffers)
+        self._ws = psi_fix_workspace(reuseBuffers)
+        #Sin/Cos tables (constant, so they are only calculated once). Row 0 = sin (I-path), row 1 = cos (Q-path)
+        scale = (1.0-2.0**-self.coefFmt.f)/self.ratio_num
+        phases = 2.0 * np.pi * np.arange(0, self.ratio_num) / self.ratio_num
+        self.sinTable = psi_fix_from_real(np.sin(phases) * scale, self.coefFmt)
+        self.cosTable = psi_fix_from_real(np.cos(phases) * scale, self.coefFmt)
+        self._coefTable = np.stack((self.sinTable, self.cosTable))
+        #NCO counter state (value before the first sample of the next block)
+        self._cptState = 0
 
     ####################################################################################################################
     # Public Methods and Properties
     ####################################################################################################################
-    def Process(self, inData : np.ndarray, phOffset : Union[np.ndarray,float]) -> Tuple[np.ndarray, np.ndarray]:
+    def Reset(self):
+        """
+        Reset the NCO counter and the moving average state to zero
+        """
+        self._cptState = 0
+        self.movAvg.Reset()
+
+    def Process(self, inData : np.ndarray, phOffset : Union[np.ndarray,float],
+                continueState : bool = False) -> Tuple[np.ndarray, np.ndarray]:
         """
         Demodulate date using the model object
-        :param inData: Input signal to demodulate
-        :param phOffset: Offset within the demodulation coefficient table
+        :param inData: Input signal to demodulate. For multi-channel data pass an array of shape (channels, samples),
+                       all channels share the same NCO counter.
+        :param phOffset: Offset within the demodulation coefficient table (scalar, per sample or per channel and sample)
+        :param continueState: False (default) = the NCO counter and the moving average start at zero,
+                              True = continue from the state at the end of the last call (for block-wise processing).
+                              The result is the same as processing the concatenated blocks at once.
         :return: Demodulated signal as tuple (I, Q)
         """
         # resize real number to Fixed Point
         dataFix = psi_fix_from_real(inData, self.inFmt, err_sat=True)
+        samples = dataFix.shape[-1]
 
         #Limit the phase offset
         phaseOffset = np.minimum(phOffset, self.ratio_num-1).astype("int32")
 
         #ROM pointer
         #Generate phases (use integer to prevent floating point precision errors)
-        phaseSteps = np.ones(inData.size,dtype=np.int64)
+        if not continueState:
+            self.Reset()
+        phaseSteps = np.ones(samples,dtype=np.int64)
         phaseSteps[0] = 1-self.ratio_den #start at zero
-        cpt = (phaseOffset + np.cumsum(phaseSteps+self.ratio_den-1, dtype=np.int64)) % self.ratio_num
-        #Get Sin/Cos value
-        scale = (1.0-2.0**-self.coefFmt.f)/self.ratio_num
-        sinTable = psi_fix_from_real(np.sin(2.0 * np.pi * np.arange(0, self.ratio_num) / self.ratio_num) * scale, self.coefFmt)
-        cosTable = psi_fix_from_real(np.cos(2.0 * np.pi * np.arange(0, self.ratio_num) / self.ratio_num) * scale, self.coefFmt)
+        cpt = (phaseOffset + self._cptState + np.cumsum(phaseSteps+self.ratio_den-1, dtype=np.int64)) % self.ratio_num
+        self._cptState = (self._cptState + self.ratio_den * samples) % self.ratio_num
 
-        #I-Path
-        multI = psi_fix_mult(dataFix, self.inFmt, sinTable[cpt], self.coefFmt, self.multFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        resI = self.movAvg.Process(multI)
-        #Q-Path
-        multQ = psi_fix_mult(dataFix, self.inFmt, cosTable[cpt], self.coefFmt, self.multFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        resQ = self.movAvg.Process(multQ)
+        #I-Path and Q-Path are processed together as stacked array (row 0 = I, row 1 = Q)
+        stkShape = (2,) + np.broadcast_shapes(dataFix.shape, cpt.shape)
+        coefs = self._coefTable[:, cpt].reshape((2,) + (1,)*(len(stkShape)-1-cpt.ndim) + cpt.shape)
+        mult = psi_fix_mult(np.broadcast_to(dataFix, stkShape), self.inFmt,
+                            np.broadcast_to(coefs, stkShape), self.coefFmt,
+                            self.multFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap, out=self._ws.Get("mult", stkShape))
+        res = self.movAvg.Process(mult, continueState=continueState)
 
-        if self._debug:
-            for i in range(10):
-                print("I{:3} IN {:10} TAB {:10} MULT {:10} CPT {:x}".format(i,
-                    psi_fix_to_hex(dataFix[i], self.inFmt),
-                    psi_fix_to_hex(sinTable[cpt[i]], self.coefFmt),
-                    psi_fix_to_hex(multI[i], self.multFmt),
-                    cpt[i]))
+        if self.trace is not None:
+            self.trace("cpt", cpt)
+            self.trace("mult_i", mult[0])
+            self.trace("mult_q", mult[1])
 
-        return resI, resQ
+        return res[0], res[1]
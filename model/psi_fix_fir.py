@@ -46,7 +46,8 @@ class psi_fix_fir:
     def Filter(self, inp : np.ndarray, decimRate : int, coefficients : np.ndarray):
         """
         Filter data without detection of saturation
-        :param inp: Input data
+        :param inp: Input data. Leading axes are independent channels (e.g. shape (trials, samples)), the filter is
+                    applied along the last axis.
         :param decimRate: Decimation ratio of the FIR filter
         :param coefficients: filter coefficients
         :return: Output data
@@ -57,7 +58,8 @@ class psi_fix_fir:
     def FilterSatDetect(self, inp : np.ndarray, decimRate : int, coefficients : np.ndarray):
         """
         Filter data with detection of saturation
-        :param inp: Input data
+        :param inp: Input data. Leading axes are independent channels (e.g. shape (trials, samples)), the filter is
+                    applied along the last axis.
         :param decimRate: Decimation ratio of the FIR filter
         :param coefficients: Filter coefficients
         :return: Output data as tuple (sat, outp) where SAT is a boolean that indicates saturation and OUTP is the
@@ -69,14 +71,14 @@ class psi_fix_fir:
         inp = psi_fix_from_real(inp, self.inFmt)
         coefs = psi_fix_from_real(coefficients, self.coefFmt)
         #Filter and round
-        res = lfilter(coefs, 1, inp)
+        res = lfilter(coefs, 1, inp, axis=-1)
         resRnd = psi_fix_resize(res, self.accuFmt, self.roundFmt, psi_fix_rnd_t.round)
         #Decimate
-        resDec = resRnd[::decimRate]
+        resDec = resRnd[..., ::decimRate]
         #Check saturation
-        sat = np.zeros(resDec.size)
+        sat = np.zeros(resDec.shape)
         sat = np.where(resDec > psi_fix_upper_bound(self.outFmt), 1, sat)
-        sat = np.where(resDec < psi_fix_upper_bound(self.outFmt), 1, sat)
+        sat = np.where(resDec < psi_fix_lower_bound(self.outFmt), 1, sat)
         #output
         outp = psi_fix_resize(resDec, self.roundFmt, self.outFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.sat)#No rounding since no fractional bits must be removed
         return (sat, outp)
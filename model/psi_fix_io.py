@@ -0,0 +1,415 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+
+########################################################################################################################
+# Imports
+########################################################################################################################
+from psi_fix_pkg import *
+import numpy as np
+import json
+import os
+import itertools
+import warnings
+from typing import Iterable, Iterator, Tuple, List
+
+########################################################################################################################
+# Stimuli/Response File I/O
+########################################################################################################################
+#
+# Files use the integer text format consumed by the VHDL textio testbenches: One line per sample, columns separated by
+# spaces and each value written as integer representation of the fixed-point number (see psi_fix_get_bits_as_int).
+# Lines starting with "#" are header lines and ignored when reading.
+
+ROWS_PER_CHUNK = 1 << 20    # Rows formatted with one formatting operation
+READ_BLOCK_SIZE = 1 << 24   # Characters read from a file with one read operation
+
+def psi_fix_write_columns(filename : str,
+                          columns : Iterable[Tuple[np.ndarray, psi_fix_fmt_t]],
+                          header : str = None) -> None:
+    """
+    Write fixed-point data to a stimuli/response text file
+    :param filename: File to write
+    :param columns: List of (array, format) tuples, one per column. All arrays must have the same size. If the format
+                    is None, the values are written as they are (they must be integers then, e.g. for control signals).
+    :param header: Optional header line (written with a leading "# ", like numpy.savetxt does)
+    """
+    data = psi_fix_columns_to_int(columns)
+    with open(filename, "w+") as f:
+        if header is not None:
+            f.write("# {}\n".format(header))
+        _WriteIntRows(f, data)
+
+def psi_fix_read_columns(filename : str,
+                         fmts : Iterable[psi_fix_fmt_t]) -> List[np.ndarray]:
+    """
+    Read fixed-point data from a stimuli/response text file
+    :param filename: File to read
+    :param fmts: Format of each column. Pass None for columns that shall be returned as integers.
+    :return: List of arrays, one per column
+    """
+    fmts = list(fmts)
+    chunks = list(psi_fix_iter_columns(filename, fmts))
+    if len(chunks) == 0:
+        return psi_fix_int_to_columns(np.zeros((0, len(fmts)), dtype=np.int64), fmts)
+    return [np.concatenate(c) for c in zip(*chunks)]
+
+def psi_fix_iter_columns(filename : str,
+                         fmts : Iterable[psi_fix_fmt_t],
+                         chunkRows : int = ROWS_PER_CHUNK) -> Iterator[List[np.ndarray]]:
+    """
+    Read a stimuli/response text file chunk by chunk (e.g. for simulator output files larger than the available RAM)
+    :param filename: File to read
+    :param fmts: Format of each column. Pass None for columns that shall be returned as integers.
+    :param chunkRows: Maximum number of rows per chunk
+    :return: Iterator over chunks, each chunk is a list of arrays (one per column)
+    """
+    fmts = list(fmts)
+    for data in _IterIntRows(filename, len(fmts), chunkRows):
+        yield psi_fix_int_to_columns(data, fmts)
+
+def psi_fix_columns_to_int(columns : Iterable[Tuple[np.ndarray, psi_fix_fmt_t]]) -> np.ndarray:
+    """
+    Convert fixed-point columns to one integer array of shape (rows, columns)
+    :param columns: List of (array, format) tuples, one per column (format None = values are integers already)
+    :return: Integer array
+    """
+    columns = list(columns)
+    sizes = set(np.size(c) for c, _ in columns)
+    if len(sizes) != 1:
+        raise ValueError("psi_fix_columns_to_int: All columns must have the same size, got {}".format(sorted(sizes)))
+    data = np.empty((sizes.pop(), len(columns)), dtype=np.int64)
+    for idx, (values, fmt) in enumerate(columns):
+        if fmt is None:
+            data[:, idx] = np.asarray(values).reshape(-1)
+        else:
+            data[:, idx] = np.asarray(psi_fix_get_bits_as_int(np.asarray(values).reshape(-1), fmt))
+    return data
+
+def psi_fix_int_to_columns(data : np.ndarray, fmts : Iterable[psi_fix_fmt_t]) -> List[np.ndarray]:
+    """
+    Convert an integer array of shape (rows, columns) to fixed-point columns (inverse of psi_fix_columns_to_int)
+    :param data: Integer array
+    :param fmts: Format of each column (None = return integers)
+    :return: List of arrays, one per column
+    """
+    return [data[:, idx] if fmt is None else psi_fix_from_bits_as_int(data[:, idx], fmt)
+            for idx, fmt in enumerate(fmts)]
+
+########################################################################################################################
+# Model vs. HDL Comparison
+########################################################################################################################
+class psi_fix_comparer:
+    """
+    Compare expected (model) against actual (simulation) fixed-point values. Data can be added in chunks, so files
+    larger than the available RAM can be compared (see psi_fix_compare_files).
+
+    Errors are counted in LSBs of the format given: mismatches holds the number of samples that differ, firstMismatch
+    the index of the first differing sample (None if all samples match) and histogram maps LSB errors (actual - expected)
+    to their number of occurrences.
+    """
+
+    def __init__(self, fmt : psi_fix_fmt_t = None, name : str = ""):
+        """
+        Constructor
+        :param fmt: Format of the data compared (None = data are integers, e.g. read from files without conversion)
+        :param name: Name used in the report
+        """
+        self.fmt = fmt
+        self.name = name
+        self.samples = 0
+        self.mismatches = 0
+        self.firstMismatch = None
+        self.histogram = {}
+
+    def Add(self, expected : np.ndarray, actual : np.ndarray) -> None:
+        """
+        Compare the next chunk of data
+        :param expected: Expected values
+        :param actual: Actual values (same size as expected)
+        """
+        expected = np.asarray(expected).reshape(-1)
+        actual = np.asarray(actual).reshape(-1)
+        if expected.size != actual.size:
+            raise ValueError("psi_fix_comparer: Sizes of expected ({}) and actual ({}) data differ"
+                             .format(expected.size, actual.size))
+        if self.fmt is None:
+            err = actual.astype(np.int64) - expected.astype(np.int64)
+        else:
+            err = np.rint((actual - expected) * 2.0**self.fmt.f).astype(np.int64)
+        idx = np.flatnonzero(err)
+        if idx.size > 0:
+            if self.firstMismatch is None:
+                self.firstMismatch = self.samples + int(idx[0])
+            values, counts = np.unique(err[idx], return_counts=True)
+            for v, c in zip(values.tolist(), counts.tolist()):
+                self.histogram[v] = self.histogram.get(v, 0) + c
+        self.histogram[0] = self.histogram.get(0, 0) + expected.size - idx.size
+        self.samples += expected.size
+        self.mismatches += idx.size
+
+    def Passed(self) -> bool:
+        """
+        Check if all samples compared so far match
+        :return: True if there was no mismatch
+        """
+        return self.mismatches == 0
+
+    def Report(self) -> str:
+        """
+        Get a human readable summary of the comparison
+        :return: Report text
+        """
+        if self.Passed():
+            return "{}: {} samples, no mismatch".format(self.name, self.samples)
+        errors = ", ".join(["{:+d} LSB: {}".format(e, self.histogram[e]) for e in sorted(self.histogram) if e != 0])
+        return "{}: {} of {} samples mismatch, first at index {} ({})".format(
+            self.name, self.mismatches, self.samples, self.firstMismatch, errors)
+
+def psi_fix_compare_files(expectedFile : str,
+                          actualFile : str,
+                          fmts : Iterable[psi_fix_fmt_t],
+                          names : Iterable[str] = None,
+                          chunkRows : int = ROWS_PER_CHUNK) -> List[psi_fix_comparer]:
+    """
+    Compare two stimuli/response text files column by column. Both files are streamed chunk by chunk.
+    :param expectedFile: File containing the expected data (e.g. written by the model)
+    :param actualFile: File containing the actual data (e.g. written by the simulation)
+    :param fmts: Format of each column (None = compare the integer values)
+    :param names: Name of each column used in the reports (default: "column <n>")
+    :param chunkRows: Maximum number of rows per chunk
+    :return: One comparer per column (a ValueError is raised if the number of rows differs)
+    """
+    fmts = list(fmts)
+    names = ["column {}".format(i) for i in range(len(fmts))] if names is None else list(names)
+    comparers = [psi_fix_comparer(fmt, name) for fmt, name in zip(fmts, names)]
+    rows = 0
+    for exp, act in itertools.zip_longest(_IterIntRows(expectedFile, len(fmts), chunkRows),
+                                          _IterIntRows(actualFile, len(fmts), chunkRows)):
+        if exp is None or act is None or exp.shape != act.shape:
+            raise ValueError("psi_fix_compare_files: Number of rows in {} and {} differs (after row {})"
+                             .format(expectedFile, actualFile, rows))
+        for idx, c in enumerate(comparers):
+            if c.fmt is None:
+                c.Add(exp[:, idx], act[:, idx])
+            else:
+                c.Add(psi_fix_from_bits_as_int(exp[:, idx], c.fmt), psi_fix_from_bits_as_int(act[:, idx], c.fmt))
+        rows += exp.shape[0]
+    return comparers
+
+########################################################################################################################
+# Binary Capture Files
+########################################################################################################################
+class psi_fix_bin_file:
+    """
+    Compact binary container for fixed-point data (e.g. ADC captures or model outputs).
+
+    The file consists of a header (magic number, header length and a JSON description containing the fixed-point format
+    and the channel layout) followed by the raw integer representation of the samples (see psi_fix_get_bits_as_int)
+    using the smallest integer type that fits the format. The payload is accessed through numpy.memmap, so files
+    larger than the available RAM can be processed and no data is read before it is accessed.
+
+    Usage example:
+    psi_fix_bin_file.Write("capture.bin", data, psi_fix_fmt_t(1, 0, 15))
+    f = psi_fix_bin_file("capture.bin")
+    x = f.GetData(0, 1000)                          # fixed-point values of the first 1000 samples
+    f.ExportText("../testbench/xyz/Data/input.txt") # only written if the text file is outdated
+    """
+
+    ####################################################################################################################
+    # Constants
+    ####################################################################################################################
+    MAGIC = b"PSIFIXB1"
+    ALIGNMENT = 64
+
+    ####################################################################################################################
+    # Constructor
+    ####################################################################################################################
+    def __init__(self, filename : str, mode : str = "r"):
+        """
+        Open an existing binary file
+        :param filename: File to open
+        :param mode: "r" = read-only, "r+" = read/write access to the payload
+        """
+        self.filename = filename
+        with open(filename, "rb") as f:
+            if f.read(len(self.MAGIC)) != self.MAGIC:
+                raise ValueError("psi_fix_bin_file: {} is not a psi_fix binary file".format(filename))
+            hdrLen = int(np.frombuffer(f.read(4), dtype="<u4")[0])
+            hdr = json.loads(f.read(hdrLen).decode())
+        self.fmt = psi_fix_fmt_t(*hdr["fmt"])
+        self.channels = hdr["channels"]
+        self.samples = hdr["samples"]
+        self.interleaved = hdr["interleaved"]
+        shape = (self.samples, self.channels) if self.interleaved else (self.channels, self.samples)
+        self.codes = np.memmap(filename, dtype=np.dtype(hdr["dtype"]), mode=mode,
+                               offset=self._PayloadOffset(hdrLen), shape=shape)
+
+    ####################################################################################################################
+    # Public Methods
+    ####################################################################################################################
+    @classmethod
+    def Create(cls, filename : str, fmt : psi_fix_fmt_t, channels : int, samples : int,
+               interleaved : bool = False) -> "psi_fix_bin_file":
+        """
+        Create an empty (all zero) binary file and open it for writing
+        :param filename: File to create
+        :param fmt: Fixed-point format of the data
+        :param channels: Number of channels
+        :param samples: Number of samples per channel
+        :param interleaved: False = payload is stored as (channels, samples), True = as (samples, channels)
+        :return: File object opened with mode "r+"
+        """
+        hdr = json.dumps({"fmt" : [fmt.s, fmt.i, fmt.f], "dtype" : cls.CodeType(fmt).str, "channels" : channels,
+                          "samples" : samples, "interleaved" : interleaved}).encode()
+        payloadOffs = cls._PayloadOffset(len(hdr))
+        with open(filename, "wb") as f:
+            f.write(cls.MAGIC)
+            f.write(np.array(len(hdr), dtype="<u4").tobytes())
+            f.write(hdr)
+            f.write(b"\0" * (payloadOffs - f.tell()))
+            f.truncate(payloadOffs + channels * samples * cls.CodeType(fmt).itemsize)
+        return cls(filename, "r+")
+
+    @classmethod
+    def Write(cls, filename : str, data : np.ndarray, fmt : psi_fix_fmt_t,
+              interleaved : bool = False) -> "psi_fix_bin_file":
+        """
+        Write fixed-point data to a binary file
+        :param filename: File to write
+        :param data: Fixed-point values as array of shape (channels, samples) or (samples,) for one channel
+        :param fmt: Fixed-point format of the data
+        :param interleaved: False = payload is stored as (channels, samples), True = as (samples, channels)
+        :return: File object opened with mode "r+"
+        """
+        data = np.atleast_2d(data)
+        f = cls.Create(filename, fmt, data.shape[0], data.shape[1], interleaved)
+        for start in range(0, data.shape[1], ROWS_PER_CHUNK):
+            f.SetData(data[:, start:start+ROWS_PER_CHUNK], start)
+        f.codes.flush()
+        return f
+
+    @staticmethod
+    def CodeType(fmt : psi_fix_fmt_t) -> np.dtype:
+        """
+        Get the integer type used to store a given format
+        :param fmt: Fixed-point format
+        :return: Smallest (little endian) integer type the format fits into
+        """
+        for bits in (8, 16, 32, 64):
+            if psi_fix_size(fmt) <= bits:
+                return np.dtype("<{}{}".format("i" if fmt.s == 1 else "u", bits // 8))
+        raise ValueError("psi_fix_bin_file: Format {} exceeds 64 bits".format(fmt))
+
+    def GetData(self, start : int = 0, stop : int = None) -> np.ndarray:
+        """
+        Get fixed-point values of a range of samples
+        :param start: First sample
+        :param stop: Last sample + 1 (None = up to the end)
+        :return: Fixed-point values as array of shape (channels, stop-start)
+        """
+        return psi_fix_from_bits_as_int(self.GetCodes(start, stop).astype(np.int64), self.fmt)
+
+    def GetCodes(self, start : int = 0, stop : int = None) -> np.ndarray:
+        """
+        Get the integer representation of a range of samples (view into the file, no data is copied)
+        :param start: First sample
+        :param stop: Last sample + 1 (None = up to the end)
+        :return: Integer array of shape (channels, stop-start)
+        """
+        return self.codes[start:stop].T if self.interleaved else self.codes[:, start:stop]
+
+    def SetData(self, data : np.ndarray, start : int = 0) -> None:
+        """
+        Write fixed-point values to a range of samples (file must be opened with mode "r+")
+        :param data: Fixed-point values as array of shape (channels, samples)
+        :param start: First sample to write
+        """
+        data = np.atleast_2d(data)
+        if data.size > 0 and (np.min(data) < psi_fix_lower_bound(self.fmt) or np.max(data) > psi_fix_upper_bound(self.fmt)):
+            raise ValueError("psi_fix_bin_file: Values in the range [{}, {}] cannot be represented by format {}".format(
+                             np.min(data), np.max(data), self.fmt))
+        self.GetCodes(start, start + data.shape[1])[...] = psi_fix_get_bits_as_int(data, self.fmt)
+
+    def ExportText(self, filename : str, header : str = None, force : bool = False) -> bool:
+        """
+        Export the data to the integer text format of the textio testbenches (one column per channel, see
+        psi_fix_write_columns). The text file is only written if it does not exist or is older than the binary file.
+        :param filename: Text file to write
+        :param header: Optional header line
+        :param force: True = always write the text file
+        :return: True if the text file was written
+        """
+        if not force and os.path.isfile(filename) and os.path.getmtime(filename) >= os.path.getmtime(self.filename):
+            return False
+        with open(filename, "w+") as f:
+            if header is not None:
+                f.write("# {}\n".format(header))
+            for start in range(0, self.samples, ROWS_PER_CHUNK):
+                _WriteIntRows(f, self.GetCodes(start, start+ROWS_PER_CHUNK).T)
+        return True
+
+    ####################################################################################################################
+    # Private Methods (do not call!)
+    ####################################################################################################################
+    @classmethod
+    def _PayloadOffset(cls, hdrLen : int) -> int:
+        offs = len(cls.MAGIC) + 4 + hdrLen
+        return -(-offs // cls.ALIGNMENT) * cls.ALIGNMENT
+
+########################################################################################################################
+# Private Helpers (do not call!)
+########################################################################################################################
+def _WriteIntRows(f, data : np.ndarray):
+    # Write an integer array of shape (rows, columns), ROWS_PER_CHUNK rows are formatted at once
+    rowFmt = " ".join(["%d"] * data.shape[1]) + "\n"
+    for start in range(0, data.shape[0], ROWS_PER_CHUNK):
+        chunk = data[start:start+ROWS_PER_CHUNK]
+        f.write((rowFmt * chunk.shape[0]) % tuple(chunk.reshape(-1).tolist()))
+
+def _ValuesPerLine(text : str) -> np.ndarray:
+    # Number of values on each non-empty line of text. A value starts at a non-whitespace character after whitespace
+    # (characters <= " ") or at the start of the text.
+    chars = np.frombuffer(text.encode(), dtype=np.uint8)
+    space = np.empty(chars.size + 1, dtype=bool)
+    space[0] = True
+    np.less_equal(chars, ord(" "), out=space[1:])
+    starts = np.flatnonzero(space[:-1] > space[1:])
+    ends = np.searchsorted(starts, np.flatnonzero(chars == ord("\n")))
+    counts = np.diff(ends, prepend=0, append=starts.size)
+    return counts[counts > 0]
+
+def _IterIntRows(filename : str, columns : int, chunkRows : int) -> Iterator[np.ndarray]:
+    # Parse an integer text file, yields arrays of shape (chunkRows, columns), only the last one may be shorter.
+    # The file is read in blocks of READ_BLOCK_SIZE characters and parsed by numpy (np.fromstring), header lines are
+    # only filtered if a block contains any.
+    pending = np.zeros((0, columns), dtype=np.int64)
+    rest = ""
+    with open(filename, "r") as f:
+        while True:
+            block = f.read(READ_BLOCK_SIZE)
+            text = rest + block
+            if len(block) > 0:
+                # Only parse complete lines, the rest is parsed with the next block
+                lastLine = text.rfind("\n") + 1
+                text, rest = text[:lastLine], text[lastLine:]
+            if len(text) > 0:
+                if "#" in text:
+                    text = "\n".join([l for l in text.split("\n") if not l.lstrip().startswith("#")])
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error", DeprecationWarning)
+                    try:
+                        data = np.fromstring(text, dtype=np.int64, sep=" ")
+                    except DeprecationWarning:
+                        raise ValueError("Cannot parse {}: file contains non-integer values".format(filename))
+                if np.any(_ValuesPerLine(text) != columns):
+                    raise ValueError("Cannot parse {}: file does not contain {} columns".format(filename, columns))
+                pending = np.concatenate((pending, data.reshape(-1, columns)))
+            while pending.shape[0] >= chunkRows:
+                yield pending[:chunkRows]
+                pending = pending[chunkRows:]
+            if len(block) == 0:
+                break
+    if pending.shape[0] > 0:
+        yield pending
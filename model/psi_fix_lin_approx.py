@@ -250,7 +250,7 @@ class psi_fix_lin_approx:
 
     def GenerateEntity(self, path : str):
         """
-        Generate VHDL implementation
+        Generate VHDL implementation. The file is only written if its content changed.
 
         :param path: Path to write the generate code into
         """
@@ -272,29 +272,23 @@ class psi_fix_lin_approx:
         content = content.replace("<TABLE_SIZE>", str(self.cfg.points))
         content = content.replace("<TABLE_WIDTH>", str(psi_fix_size(self.cfg.gradFmt)+psi_fix_size(self.cfg.offsFmt)))
 
-        #Offset Strings
-        conv = "to_unsigned"
+        #Table lines (all lines are formatted at once)
+        offsConv = "to_unsigned"
         if self.cfg.offsFmt.s == 1:
-            conv = "to_signed"
-        offsStr = ["{}({}, {})".format(conv,
-                                       psi_fix_get_bits_as_int(v, self.cfg.offsFmt),
-                                       psi_fix_size(self.cfg.offsFmt))
-                   for v in self.offsTable]
-        #Gradient Strings
+            offsConv = "to_signed"
+        gradConv = offsConv
         if self.cfg.gradFmt.s == 1:
-            conv = "to_signed"
-        gradStr = ["{}({}, {})".format(conv,
-                                       psi_fix_get_bits_as_int(v, self.cfg.gradFmt),
-                                       psi_fix_size(self.cfg.gradFmt))
-                   for v in self.gradTable]
-        tableLines = ["\t\tstd_logic_vector({} & {}),".format(g, o) for g, o in zip(gradStr, offsStr)]
-        tableLines[-1] = tableLines[-1][:-1] #remove last comma
-        tableLinesAll = "\n".join(tableLines)
+            gradConv = "to_signed"
+        offsInt = np.asarray(psi_fix_get_bits_as_int(self.offsTable, self.cfg.offsFmt)).reshape(-1)
+        gradInt = np.asarray(psi_fix_get_bits_as_int(self.gradTable, self.cfg.gradFmt)).reshape(-1)
+        lineFmt = "\t\tstd_logic_vector({}(%d, {}) & {}(%d, {}))".format(gradConv, psi_fix_size(self.cfg.gradFmt),
+                                                                       offsConv, psi_fix_size(self.cfg.offsFmt))
+        tableValues = np.column_stack((gradInt, offsInt)).reshape(-1)
+        tableLinesAll = ",\n".join([lineFmt] * gradInt.size) % tuple(tableValues.tolist())
         content = content.replace("<TABLE_CONTENT>", tableLinesAll)
 
-        #write generated file
-        with open(path + "/" + entityName + ".vhd", "w+") as f:
-            f.write(content)
+        #write generated file (only if changed to prevent unnecessary recompilation)
+        psi_fix_write_if_changed(path + "/" + entityName + ".vhd", content)
 
     def GenerateTb(self,    path : str,
                             simPoints : int = 10000,
@@ -331,14 +325,13 @@ class psi_fix_lin_approx:
                 pass
 
             # write generated file
-            with open(path + "/" + entityName + "_tb.vhd", "w+") as f:
-                f.write(content)
+            psi_fix_write_if_changed(path + "/" + entityName + "_tb.vhd", content)
 
             # write stimuli/response
-            with open(path + "/" + "stimuli.txt", "w+") as f:
-                f.writelines([str(i) + "\n" for i in psi_fix_get_bits_as_int(input, self.cfg.inFmt)])
-            with open(path + "/" + "response.txt", "w+") as f:
-                f.writelines([str(i) + "\n" for i in psi_fix_get_bits_as_int(actualOut, self.cfg.outFmt)])
+            stimInt = np.asarray(psi_fix_get_bits_as_int(input, self.cfg.inFmt)).reshape(-1)
+            respInt = np.asarray(psi_fix_get_bits_as_int(actualOut, self.cfg.outFmt)).reshape(-1)
+            psi_fix_write_if_changed(path + "/" + "stimuli.txt", ("%d\n" * stimInt.size) % tuple(stimInt.tolist()))
+            psi_fix_write_if_changed(path + "/" + "response.txt", ("%d\n" * respInt.size) % tuple(respInt.tolist()))
 
     ####################################################################################################################
     # Private Methods (do not call!)
@@ -9,6 +9,7 @@
 ########################################################################################################################
 from psi_fix_pkg import *
 import numpy as np
+from typing import Callable
 
 ########################################################################################################################
 # Bittrue model if the First-Order IIR low-pass filter
@@ -25,7 +26,8 @@ class psi_fix_lowpass_iir_order1:
                         intFmt : psi_fix_fmt_t,
                         coefFmt : psi_fix_fmt_t,
                         rnd : psi_fix_rnd_t = psi_fix_rnd_t.round,
-                        sat : psi_fix_sat_t = psi_fix_sat_t.sat):
+                        sat : psi_fix_sat_t = psi_fix_sat_t.sat,
+                        trace : Callable[[str, np.ndarray], None] = None):
         """
         Constructor for the IIR model
         :param fSampleHz: Sample frequency in Hz
@@ -36,6 +38,8 @@ class psi_fix_lowpass_iir_order1:
         :param coefFmt: Coefficient format
         :param rnd: Rounding mode
         :param sat: Saturation Mode
+        :param trace: Optional callback trace(name, values) that is called with internal signals ("add" = sum before
+                      the output resize, "feedback"). If None (default), no tracing is done (see psi_fix_probe).
         """
         #Save formats
         self.inFmt = inFmt
@@ -44,6 +48,7 @@ class psi_fix_lowpass_iir_order1:
         self.coefFmt = coefFmt
         self.rnd = rnd
         self.sat = sat
+        self.trace = trace
 
         #Coefficient calculation
         alpha = self.CoefAlphaCalc(fSampleHz, fCutoffHz)
@@ -56,19 +61,29 @@ class psi_fix_lowpass_iir_order1:
     def Filter(self, data : np.ndarray):
         """
         Filter data using the model object
-        :param data: Input data
+        :param data: Input data. Leading axes are independent channels (e.g. shape (trials, samples)), the filter is
+                     applied along the last axis.
         :return: Output data
         """
         dataFix = psi_fix_from_real(data, self.inFmt)
         mulIn = psi_fix_mult(dataFix, self.inFmt, self.beta, self.coefFmt, self.intFmt, self.rnd, self.sat)
 
-        #Looping is not avoidable for a recorsive filter...
-        out = np.empty_like(data)
+        #Looping is not avoidable for a recorsive filter... (loop over the last axis, all channels at once)
+        out = np.empty(np.shape(mulIn))
+        if self.trace is not None:
+            addTrace = np.empty_like(mulIn)
+            fbTrace = np.empty_like(mulIn)
         fb = 0
-        for i, mulIn_i in enumerate(mulIn):
-            add = psi_fix_add(mulIn_i, self.intFmt, fb, self.intFmt, self.intFmt, sat=self.sat) #Rounding not required since fractional bits are not changed
+        for i in range(np.shape(mulIn)[-1]):
+            add = psi_fix_add(mulIn[..., i], self.intFmt, fb, self.intFmt, self.intFmt, sat=self.sat) #Rounding not required since fractional bits are not changed
             fb = psi_fix_mult(add, self.intFmt, self.alpha, self.coefFmt, self.intFmt, self.rnd, self.sat)
-            out[i] = psi_fix_resize(add, self.intFmt, self.outFmt, self.rnd, self.sat)
+            out[..., i] = psi_fix_resize(add, self.intFmt, self.outFmt, self.rnd, self.sat)
+            if self.trace is not None:
+                addTrace[..., i] = add
+                fbTrace[..., i] = fb
+        if self.trace is not None:
+            self.trace("add", addTrace)
+            self.trace("feedback", fbTrace)
         return out
 
     ####################################################################################################################
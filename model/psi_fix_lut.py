@@ -51,7 +51,8 @@ class psi_fix_lut:
                  path         : str,
                  entityName   : str):
         """
-        Generate VHDL Code. The generated file has the same name as the entity.
+        Generate VHDL Code. The generated file has the same name as the entity. The file is only written if its
+        content changed.
         :param path: Folder to write the generated VHDL file into
         :param entityName: Entity name of the VHDL file to generate (also used as file-name)
         :return: None
@@ -76,15 +77,11 @@ class psi_fix_lut:
         if self.coefFmt.s == 1:
             conv = "to_signed"
 
-        coefStr = ["{}({},{})".format(conv,
-                                      psi_fix_get_bits_as_int(v, self.coefFmt),
-                                      psi_fix_size(self.coefFmt))
-                   for v in self.table]
-        #modify table (transposition)
-        tableLines = ["std_logic_vector({}),".format(g) for g in coefStr]
-        tableLines[-1] = tableLines[-1][:-1] #remove last comma
-        content = content.replace("<TABLE_CONTENT>", "\n\t\t".join(tableLines))
+        coefInt = np.asarray(psi_fix_get_bits_as_int(self.table, self.coefFmt)).reshape(-1)
+        #modify table (transposition), all lines are formatted at once
+        lineFmt = "std_logic_vector({}(%d,{}))".format(conv, psi_fix_size(self.coefFmt))
+        tableLines = ",\n\t\t".join([lineFmt] * coefInt.size) % tuple(coefInt.tolist())
+        content = content.replace("<TABLE_CONTENT>", tableLines)
 
-        #write generated file
-        with open(path + "/" + entityName + ".vhd", "w+") as f:
-            f.write(content)
+        #write generated file (only if changed to prevent unnecessary recompilation)
+        psi_fix_write_if_changed(path + "/" + entityName + ".vhd", content)
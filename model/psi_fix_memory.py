@@ -0,0 +1,137 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+
+########################################################################################################################
+# Imports
+########################################################################################################################
+import functools
+import tracemalloc
+from typing import Callable, Iterable
+
+########################################################################################################################
+# Memory Report
+########################################################################################################################
+class psi_fix_memory_report:
+    """
+    Measures the peak memory allocated during model calls (based on tracemalloc, numpy arrays are included).
+
+    While the report is active (with-block), tracemalloc is running and the methods of the models passed to Watch() are
+    measured on every call. The peak is reported relative to the memory allocated when the call started, so it is the
+    additional memory the call requires (temporary data and result). Nested calls (e.g. a model calling another watched
+    model) are measured correctly. Note that tracemalloc slows down execution, so times measured at the same time are
+    not representative.
+
+    Usage example:
+    with psi_fix_memory_report() as mem:
+        mem.Watch(cic)
+        cic.Process(data)
+        mem.Measure("fir", fir.Filter, data, 1, coefs)
+    print(mem.Report())
+    """
+
+    ####################################################################################################################
+    # Constructor
+    ####################################################################################################################
+    def __init__(self):
+        self.stats = {}         # name -> [calls, max peak bytes, sum of peak bytes, last peak bytes]
+        self._watched = []      # (model, method name) of methods wrapped by Watch()
+        self._running = []      # Peak so far of the calls in progress (outermost first)
+        self._started = False   # True if tracemalloc was started by this object
+
+    ####################################################################################################################
+    # Public Methods
+    ####################################################################################################################
+    def __enter__(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        return self
+
+    def __exit__(self, excType, excValue, tb):
+        self.Unwatch()
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def Watch(self, model, methods : Iterable[str] = ("Process",)) -> None:
+        """
+        Measure all calls of some methods of a model object (until Unwatch() or the end of the with-block)
+        :param model: Model object
+        :param methods: Names of the methods to measure. They are reported as "<class>.<method>".
+        """
+        for method in methods:
+            func = getattr(model, method)
+            name = "{}.{}".format(type(model).__name__, method)
+            setattr(model, method, functools.wraps(func)(functools.partial(self.Measure, name, func)))
+            self._watched.append((model, method))
+
+    def Unwatch(self) -> None:
+        """
+        Stop measuring the methods passed to Watch()
+        """
+        for model, method in self._watched:
+            delattr(model, method)
+        self._watched = []
+
+    def Measure(self, name : str, func : Callable, *args, **kwargs):
+        """
+        Call a function and measure its peak memory
+        :param name: Name the call is reported under
+        :param func: Function to call
+        :param args: Arguments of the function
+        :param kwargs: Keyword arguments of the function
+        :return: Return value of the function
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("psi_fix_memory_report: Measure() must be called inside the with-block")
+        start, peak = tracemalloc.get_traced_memory()
+        if self._running:
+            self._running[-1] = max(self._running[-1], peak)
+        tracemalloc.reset_peak()
+        self._running.append(start)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            peak = max(self._running.pop(), tracemalloc.get_traced_memory()[1])
+            # The peak of this call is also reached by the calls it is nested in
+            if self._running:
+                self._running[-1] = max(self._running[-1], peak)
+            self._Record(name, peak - start)
+
+    def Peak(self, name : str) -> int:
+        """
+        Get the maximum peak memory of the calls recorded for a name
+        :param name: Name of the call (e.g. "psi_fix_cic_dec.Process")
+        :return: Peak memory in bytes
+        """
+        return self.stats[name][1]
+
+    def Reset(self) -> None:
+        """
+        Clear all statistics recorded so far
+        """
+        self.stats = {}
+
+    def Report(self) -> str:
+        """
+        Get a table of the peak memory per call, highest peak first
+        :return: Report text
+        """
+        entries = sorted(self.stats.items(), key=lambda e: e[1][1], reverse=True)
+        lines = ["{:<50} {:>9} {:>14} {:>14} {:>14}".format("call", "calls", "max [MB]", "mean [MB]", "last [MB]")]
+        for name, (calls, maxPeak, sumPeak, lastPeak) in entries:
+            lines.append("{:<50} {:>9} {:>14.3f} {:>14.3f} {:>14.3f}".format(
+                         name, calls, maxPeak/2**20, sumPeak/calls/2**20, lastPeak/2**20))
+        return "\n".join(lines)
+
+    ####################################################################################################################
+    # Private Methods (do not call!)
+    ####################################################################################################################
+    def _Record(self, name : str, peak : int):
+        entry = self.stats.setdefault(name, [0, 0, 0, 0])
+        entry[0] += 1
+        entry[1] = max(entry[1], peak)
+        entry[2] += peak
+        entry[3] = peak
@@ -10,6 +10,7 @@
 from psi_fix_pkg import *
 import numpy as np
 from psi_fix_pkg import *
+from typing import Callable
 
 ########################################################################################################################
 # Bittrue model of the Modulator
@@ -24,7 +25,8 @@ class psi_fix_mod_cplx2real:
                         IntFmt         : psi_fix_fmt_t,
                         OutFmt         : psi_fix_fmt_t,
                         ratio_num      : int,
-                        ratio_den      : int):
+                        ratio_den      : int,
+                        trace          : Callable[[str, np.ndarray], None] = None):
         """
         Constructor for the modulator model object
         :param InpFmt: Input fixed-point format
@@ -33,6 +35,8 @@ class psi_fix_mod_cplx2real:
         :param OutFmt: Output fixed-point format
         :param ratio_num: Ratio Fsample/Fcarrier (must be integer!)
         :param ratio_den: NCO counter offset (must be integer!)
+        :param trace: Optional callback trace(name, values) that is called with internal signals (e.g. NCO counter).
+                      If None (default), no tracing is done.
         """
         self.InpFmt     = InpFmt
         self.CoefFmt    = CoefFmt
@@ -40,51 +44,70 @@ class psi_fix_mod_cplx2real:
         self.OutFmt     = OutFmt
         self.ratio_num  = ratio_num
         self.ratio_den  = ratio_den
+        self.trace      = trace
+        #Internal formats
+        self.multFmt = psi_fix_fmt_t(self.InpFmt.s, 1+self.InpFmt.i+self.CoefFmt.i, self.InpFmt.f+self.CoefFmt.f)
+        self.addFmt = psi_fix_fmt_t(self.IntFmt.s, self.IntFmt.i+1, self.IntFmt.f)
+        #Sin/Cos tables (constant, so they are only calculated once)
+        scale = 1.0 - 2.0 ** -self.CoefFmt.f
+        phases = 2.0 * np.pi * np.arange(0, self.ratio_num) / self.ratio_num
+        self.sinTable = psi_fix_from_real(np.sin(phases) * scale, self.CoefFmt)
+        self.cosTable = psi_fix_from_real(np.cos(phases) * scale, self.CoefFmt)
+        #NCO counter state (value before the first sample of the next block)
+        self._cptState = 0
 
     ####################################################################################################################
     # Public Methods
     ####################################################################################################################
-    def Process(self, data_I_i: np.ndarray, data_Q_i : np.ndarray):
+    def Reset(self):
+        """
+        Reset the NCO counter to zero (i.e. the next call to Process() starts at the beginning of the table)
+        """
+        self._cptState = 0
+
+    def Process(self, data_I_i: np.ndarray, data_Q_i : np.ndarray, continuePhase : bool = False):
         """
         Modulate data
-        :param data_I_i: Real-part of the input signal
+        :param data_I_i: Real-part of the input signal. Leading axes are independent channels (e.g. shape
+                         (trials, samples)), all channels share the same NCO counter.
         :param data_Q_i: Imaginary-part of the input signal
+        :param continuePhase: False (default) = the NCO counter starts at zero,
+                              True = the NCO counter continues from the end of the last call (for block-wise processing)
         :return: Real output signal
         """
         # resize real number to Fixed Point
-        multFmt = psi_fix_fmt_t(self.InpFmt.s, 1+self.InpFmt.i+self.CoefFmt.i, self.InpFmt.f+self.CoefFmt.f)
-        addFmt = psi_fix_fmt_t(self.IntFmt.s, self.IntFmt.i+1, self.IntFmt.f)
         datInp = psi_fix_from_real(data_I_i, self.InpFmt, err_sat=True)
         datQua = psi_fix_from_real(data_Q_i, self.InpFmt, err_sat=True)
 
         # ROM pointer
         # Generate phases (use integer to prevent floating point precision errors)
-        phaseSteps = np.ones(data_I_i.size, dtype=np.int64)
-        phaseSteps[0] = 1  # start at zero
-        cptInt = np.cumsum(phaseSteps+self.ratio_den-1, dtype=np.int64) % self.ratio_num
-        cptIntOffs = cptInt
-        print(cptInt)
-        cpt = np.where(cptIntOffs > self.ratio_num - 1, cptIntOffs - self.ratio_num, cptIntOffs)
-        print(cpt)
-        # Get Sin/Cos value
-        scale = 1.0 - 2.0 ** -self.CoefFmt.f
-        sinTable = psi_fix_from_real(np.sin(2.0 * np.pi * np.arange(0, self.ratio_num) / self.ratio_num) * scale, self.CoefFmt)
-        cosTable = psi_fix_from_real(np.cos(2.0 * np.pi * np.arange(0, self.ratio_num) / self.ratio_num) * scale, self.CoefFmt)
+        if not continuePhase:
+            self.Reset()
+        samples = np.broadcast_shapes(np.shape(datInp), np.shape(datQua))[-1]
+        phaseSteps = np.full(samples, self.ratio_den, dtype=np.int64)
+        cpt = (self._cptState + np.cumsum(phaseSteps, dtype=np.int64)) % self.ratio_num
+        self._cptState = (self._cptState + self.ratio_den * samples) % self.ratio_num
+        if self.trace is not None:
+            self.trace("cpt", cpt)
 
         # process calculation
-        mult_i_s = psi_fix_mult(datInp, self.InpFmt, sinTable[cpt], self.CoefFmt, multFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        mult_q_s = psi_fix_mult(datQua, self.InpFmt, cosTable[cpt], self.CoefFmt, multFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
+        mult_i_s = psi_fix_mult(datInp, self.InpFmt, self.sinTable[cpt], self.CoefFmt, self.multFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
+        mult_q_s = psi_fix_mult(datQua, self.InpFmt, self.cosTable[cpt], self.CoefFmt, self.multFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
 
         #resize internal before add
-        mult_i_dff_s = psi_fix_resize(mult_i_s, multFmt, self.IntFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
-        mult_q_dff_s = psi_fix_resize(mult_q_s, multFmt, self.IntFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
+        mult_i_dff_s = psi_fix_resize(mult_i_s, self.multFmt, self.IntFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
+        mult_q_dff_s = psi_fix_resize(mult_q_s, self.multFmt, self.IntFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
 
         # adder
-        sum_s = psi_fix_add(mult_i_dff_s, self.IntFmt, mult_q_dff_s, self.IntFmt, addFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
+        sum_s = psi_fix_add(mult_i_dff_s, self.IntFmt, mult_q_dff_s, self.IntFmt, self.addFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
 
         #resize output
-        rf_s = psi_fix_resize(sum_s, addFmt, self.OutFmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+        rf_s = psi_fix_resize(sum_s, self.addFmt, self.OutFmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+
+        if self.trace is not None:
+            self.trace("mult_i", mult_i_s)
+            self.trace("mult_q", mult_q_s)
+            self.trace("sum", sum_s)
 
         rf_o = rf_s
         return rf_o
-
@@ -32,7 +32,8 @@ class psi_fix_mov_avg:
                  taps : int,
                  gaincorr : str = GAINCORR_EXACT,
                  rnd : psi_fix_rnd_t = psi_fix_rnd_t.round,
-                 sat : psi_fix_sat_t = psi_fix_sat_t.sat):
+                 sat : psi_fix_sat_t = psi_fix_sat_t.sat,
+                 reuseBuffers : bool = False):
         """
         Constructor for a moving average model object
         :param inFmt: Input fixed-point format
@@ -41,6 +42,8 @@ class psi_fix_mov_avg:
         :param gaincorr: Gain correction mode (see documentation for details). Use one of the constants provided.
         :param rnd: Rounding mode at the output
         :param sat: Saturatioin mode at the output
+        :param reuseBuffers: True = intermediate buffers are kept and reused by the next call (reduces allocations when
+                             processing equally sized blocks), False (default) = buffers are freed after each call
         """
         #Checks
         if gaincorr not in (self.GAINCORR_EXACT, self.GAINCORR_NONE, self.GAINCORR_ROUGH):
@@ -59,27 +62,55 @@ class psi_fix_mov_avg:
         self.gcInFmt = psi_fix_fmt_t(1, inFmt.i, min(24-inFmt.i, self.sumFmt.f+self.additionalBits))
         self.gcCoefFmt = psi_fix_fmt_t(0,1,16)
         self.gc = psi_fix_from_real(2.0**self.additionalBits/gain, self.gcCoefFmt)
+        self._ws = psi_fix_workspace(reuseBuffers)
+        #State for block-wise processing
+        self.Reset()
 
     ####################################################################################################################
     # Public Methods
     ####################################################################################################################
-    def Process(self, inData : np.ndarray) -> np.ndarray:
+    def Reset(self):
+        """
+        Reset the filter state (delay line and running sum) to zero
+        """
+        self._history = None
+        self._sum = None
+
+    def Process(self, inData : np.ndarray, continueState : bool = False) -> np.ndarray:
         """
         Process data using the model object
-        :param inData: Input data
+        :param inData: Input data. For multi-channel data pass an array of shape (channels, samples).
+        :param continueState: False (default) = the filter starts with an empty delay line,
+                              True = continue from the state at the end of the last call (for block-wise processing).
+                              The result is the same as processing the concatenated blocks at once.
         :return: Output data
         """
         # resize real number to Fixed Point
         dataFix = psi_fix_from_real(inData, self.inFmt)
+        samples = dataFix.shape[-1]
+
+        #Initialize state
+        if not continueState or self._history is None:
+            self._history = np.zeros(dataFix.shape[:-1] + (self.taps,))
+            self._sum = np.zeros(dataFix.shape[:-1] + (1,))
+        elif self._history.shape[:-1] != dataFix.shape[:-1]:
+            raise ValueError("psi_fix_mov_avg: Number of channels must not change when continueState=True is used")
 
-        #generate delayed version of the data
-        dataDel = np.concatenate((np.zeros(self.taps), dataFix[:-self.taps]))
+        #generate delayed version of the data (along the last axis, leading axes are independent channels)
+        dataExt = np.concatenate((self._history, dataFix), axis=-1,
+                                 out=self._ws.Get("dataExt", dataFix.shape[:-1] + (samples + self.taps,)))
+        dataDel = dataExt[..., :samples]
+        self._history = dataExt[..., samples:].copy()
 
         #differentiate
-        diff = psi_fix_sub(dataFix, self.inFmt, dataDel, self.inFmt, self.diffFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap) #rounding not required, saturation cannot occur!
+        diff = psi_fix_sub(dataFix, self.inFmt, dataDel, self.inFmt, self.diffFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap,
+                           out=self._ws.Get("diff", dataFix.shape)) #rounding not required, saturation cannot occur!
 
         #summation
-        sum = psi_fix_from_real(np.cumsum(diff), self.sumFmt) #is bittrue since neither rounding nor saturation are required
+        sum = np.cumsum(diff, axis=-1, out=self._ws.Get("sum", dataFix.shape))
+        sum = psi_fix_from_real(np.add(sum, self._sum, out=sum), self.sumFmt) #is bittrue since neither rounding nor saturation are required
+        if samples > 0:
+            self._sum = sum[..., -1:].copy()
 
         #Gain correction
         if self.gaincorr == self.GAINCORR_NONE:
@@ -87,7 +118,8 @@ class psi_fix_mov_avg:
         elif self.gaincorr == self.GAINCORR_ROUGH:
             return psi_fix_shift_right(sum, self.sumFmt, self.additionalBits, self.additionalBits, self.outFmt, self.rnd, self.sat)
         else:
-            roughCorr = psi_fix_shift_right(sum, self.sumFmt, self.additionalBits, self.additionalBits, self.gcInFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
+            roughCorr = psi_fix_shift_right(sum, self.sumFmt, self.additionalBits, self.additionalBits, self.gcInFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap,
+                                            out=self._ws.Get("roughCorr", dataFix.shape))
             return psi_fix_mult(roughCorr, self.gcInFmt, self.gc, self.gcCoefFmt, self.outFmt, self.rnd, self.sat)
 
 
@@ -11,6 +11,7 @@ from psi_fix_pkg import *
 import numpy as np
 from psi_fix_white_noise import psi_fix_white_noise
 from psi_fix_lin_approx import psi_fix_lin_approx
+from typing import Union, Iterable
 
 ########################################################################################################################
 # White Noise Generator Model
@@ -21,7 +22,13 @@ class psi_fix_noise_awgn:
     ####################################################################################################################
     # Constructor
     ####################################################################################################################
-    def __init__(self, outFmt : psi_fix_fmt_t, seed : int = 0xA38E3C1D):
+    def __init__(self, outFmt : psi_fix_fmt_t, seed : Union[int, Iterable[int]] = 0xA38E3C1D):
+        """
+        Constructor of the gaussian white noise generator model
+        :param outFmt: Output fixed-point format (must be [1,0,x])
+        :param seed: Seed of the underlying white noise generator. Pass a vector of seeds to generate multiple
+                     independent streams at once (see psi_fix_white_noise).
+        """
         if (outFmt.s == 0) or (outFmt.i > 0):
             raise Exception("psi_fix_noise_awgn: Output format must be [1,0,x]")
         if (outFmt.f > 19):
@@ -35,6 +42,11 @@ class psi_fix_noise_awgn:
     # Public functions
     ####################################################################################################################
     def Generate(self, samples : int) -> np.ndarray:
+        """
+        Generate noise
+        :param samples: Number of samples to generate
+        :return: Noise samples. For a vector of seeds, an array of shape (streams, samples) is returned.
+        """
 
         #Calculate random for each bit and concatenate to number
         noiseUniform = self.whiteNoiseGen.Generate(samples)
@@ -41,34 +41,55 @@ class psi_fix_phase_unwrap:
         self.sumFmt = psi_fix_fmt_t(1, max(outFmt.i+1, 1), inFmt.f)
         self.diffFmt = psi_fix_fmt_t(1, 0, inFmt.f) #only covers +/- 180°
         self.round = round
+        #State for block-wise processing
+        self.Reset()
 
     ####################################################################################################################
     # Public functions
     ####################################################################################################################
-    def Process(self, inPhase : np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    def Reset(self):
+        """
+        Reset the unwrapping state (last input sample and accumulated phase) to zero
+        """
+        self._lastIn = 0
+        self._val = 0
+
+    def Process(self, inPhase : np.ndarray, continueState : bool = False) -> Tuple[np.ndarray, np.ndarray]:
         """
         Process data using the model object
-        :param inPhase: input phase in Pi (1.0 = 180°)
+        :param inPhase: input phase in Pi (1.0 = 180°). Leading axes are independent channels (e.g. shape
+                        (trials, samples)), the phase is unwrapped along the last axis.
+        :param continueState: False (default) = unwrapping starts at zero,
+                              True = continue from the state at the end of the last call (for block-wise processing).
+                              The result is the same as processing the concatenated blocks at once.
         :return: (r, w)
                  r: Result unwrapped phase
                  w = boolean array containing True if output overflowed
         """
-        inShifted = np.roll(inPhase, 1)
-        inShifted[0] = 0
+        if not continueState:
+            self.Reset()
+        inPhase = np.asarray(inPhase)
+        if np.ndim(self._val) > 0 and np.shape(self._val) != inPhase.shape[:-1]:
+            raise ValueError("psi_fix_phase_unwrap: Number of channels must not change when continueState=True is used")
+        inShifted = np.concatenate((np.broadcast_to(np.expand_dims(self._lastIn, -1), inPhase.shape[:-1] + (1,)), inPhase[..., :-1]),
+                                   axis=-1)[..., :inPhase.shape[-1]]
         diff = psi_fix_sub(inPhase, self.inFmt,
                          inShifted, self.inFmt,
                          self.diffFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap) #Must wrap (to +/- 180°)
         outVal = np.empty_like(diff, inPhase.dtype)
         outWrap = np.empty_like(diff, dtype=bool)
-        val = 0
-        for idx, (d, i) in enumerate(zip(diff, inPhase)):
-            val = psi_fix_add(val, self.sumFmt, d, self.diffFmt, self.sumFmt)
-            wrap = False
-            if not psi_fix_in_range(val, self.sumFmt, self.outFmt, self.round):
-                val = psi_fix_resize(i, self.inFmt, self.sumFmt)
-                wrap = True
-            outVal[idx] = psi_fix_resize(val, self.sumFmt, self.outFmt, self.round);
-            outWrap[idx] = wrap
+        #Loop over the samples, all channels are processed at once
+        val = self._val
+        for idx in range(inPhase.shape[-1]):
+            val = psi_fix_add(val, self.sumFmt, diff[..., idx], self.diffFmt, self.sumFmt)
+            wrap = np.logical_not(psi_fix_in_range(val, self.sumFmt, self.outFmt, self.round))
+            if np.any(wrap):
+                val = np.where(wrap, psi_fix_resize(inPhase[..., idx], self.inFmt, self.sumFmt), val)
+            outVal[..., idx] = psi_fix_resize(val, self.sumFmt, self.outFmt, self.round)
+            outWrap[..., idx] = wrap
+        if inPhase.shape[-1] > 0:
+            self._lastIn = inPhase[..., -1].copy()
+            self._val = val
         return (outVal, outWrap)
 
 
@@ -0,0 +1,315 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+
+########################################################################################################################
+# Imports
+########################################################################################################################
+from psi_fix_pkg import *
+import numpy as np
+import queue
+import threading
+from fractions import Fraction
+from typing import Callable, Iterable, Iterator, List, Union
+
+########################################################################################################################
+# Streaming Pipeline
+########################################################################################################################
+class psi_fix_pipeline:
+    """
+    Streaming processing chain built from model instances.
+
+    Data is pushed through all stages in fixed-size blocks (along the last axis), so no full-length intermediate
+    signals are required. Each stage declares its input/output formats and its rate change, these are checked when
+    the pipeline is built.
+
+    Stages must produce the same result when called block-wise as when called with the whole signal. This is achieved
+    in one of two ways:
+    - The model keeps its state between calls itself (e.g. psi_fix_mov_avg.Process(x, continueState=True))
+    - The pipeline keeps the last "history" input samples of the stage and prepends them to the next block, the
+      corresponding output samples are discarded. This works for models with a finite impulse response that is
+      calculated bittrue (e.g. psi_fix_fir with history >= taps-1) and for memoryless models (history=0).
+
+    Data passed between stages is either an array or a tuple of arrays (e.g. (I, Q)). The formats of tuple data are
+    declared as tuple of formats, None is used for non fixed-point data (e.g. boolean flags).
+
+    With threaded=True, each stage runs in its own thread and stages are connected through bounded queues. Since NumPy
+    releases the GIL for most operations, this allows stages to overlap.
+
+    Usage example:
+    p = psi_fix_pipeline(inFmt, blockSize=4096, threaded=True)
+    p.Add("demod", lambda x: demod.Process(x, 0, continueState=True), inFmt, (demodFmt, demodFmt), reset=demod.Reset)
+    p.Add("cic", lambda iq: (cicI.Process(iq[0], True), cicQ.Process(iq[1], True)), (demodFmt, demodFmt),
+          (cicFmt, cicFmt), decimation=8, reset=lambda: (cicI.Reset(), cicQ.Reset()))
+    p.Add("fir", lambda iq: (fir.Filter(iq[0], 1, coefs), fir.Filter(iq[1], 1, coefs)), (cicFmt, cicFmt),
+          (firFmt, firFmt), history=len(coefs)-1)
+    p.Add("cordic", lambda iq: cordic.Process(*iq), (firFmt, firFmt), (absFmt, angleFmt))
+    p.Build()
+    absOut, angleOut = p.Process(data)
+    """
+
+    ####################################################################################################################
+    # Constructor
+    ####################################################################################################################
+    def __init__(self, inFmt,
+                 blockSize : int,
+                 threaded : bool = False,
+                 queueDepth : int = 4):
+        """
+        Constructor
+        :param inFmt: Fixed-point format of the pipeline input (tuple of formats for tuple data)
+        :param blockSize: Number of input samples processed per block
+        :param threaded: True = each stage runs in its own thread, False (default) = all stages run in the caller thread
+        :param queueDepth: Maximum number of blocks queued between two stages (threaded mode only)
+        """
+        if blockSize < 1:
+            raise ValueError("psi_fix_pipeline: blockSize must be >= 1")
+        if queueDepth < 1:
+            raise ValueError("psi_fix_pipeline: queueDepth must be >= 1")
+        self.inFmt = inFmt
+        self.blockSize = blockSize
+        self.threaded = threaded
+        self.queueDepth = queueDepth
+        self._stages = []   # type: List[_PipelineStage]
+        self._built = False
+
+    ####################################################################################################################
+    # Public Methods and Properties
+    ####################################################################################################################
+    def Add(self, name : str,
+            process : Callable,
+            inFmt,
+            outFmt,
+            decimation : int = 1,
+            interpolation : int = 1,
+            history : int = 0,
+            reset : Callable[[], None] = None) -> "psi_fix_pipeline":
+        """
+        Append a stage to the pipeline
+        :param name: Name of the stage (used in error messages)
+        :param process: Function that processes one block (array or tuple of arrays) and returns the output block
+        :param inFmt: Input format of the stage (tuple of formats for tuple data)
+        :param outFmt: Output format of the stage (tuple of formats for tuple data)
+        :param decimation: Decimation ratio of the stage
+        :param interpolation: Interpolation ratio of the stage
+        :param history: Number of input samples the pipeline prepends from the last block (0 = stage is memoryless or
+                        keeps its state itself). Must be a multiple of the decimation ratio.
+        :param reset: Function to call on Reset() (e.g. the Reset() method of the model)
+        :return: The pipeline (to allow chaining calls)
+        """
+        if decimation < 1 or interpolation < 1:
+            raise ValueError("psi_fix_pipeline: Stage {}: decimation and interpolation must be >= 1".format(name))
+        if history < 0 or history % decimation != 0:
+            raise ValueError("psi_fix_pipeline: Stage {}: history must be a non-negative multiple of the decimation "
+                             "ratio".format(name))
+        self._stages.append(_PipelineStage(name, process, inFmt, outFmt, decimation, interpolation, history, reset))
+        self._built = False
+        return self
+
+    def Build(self) -> None:
+        """
+        Check the pipeline. Raises ValueError if the output format of a stage does not fit into the input format of
+        the next stage or if the block size does not result in an integer number of samples for all stages.
+        """
+        if len(self._stages) == 0:
+            raise ValueError("psi_fix_pipeline: Pipeline has no stages")
+        srcFmt, srcName = self.inFmt, "input"
+        rate = Fraction(1)
+        for stage in self._stages:
+            if not self._FmtCompatible(srcFmt, stage.inFmt):
+                raise ValueError("psi_fix_pipeline: Output format {} of {} does not fit into input format {} of stage {}"
+                                 .format(self._FmtStr(srcFmt), srcName, self._FmtStr(stage.inFmt), stage.name))
+            stageIn = self.blockSize * rate
+            if stageIn.denominator != 1 or stageIn.numerator % stage.decimation != 0:
+                raise ValueError("psi_fix_pipeline: Stage {} receives blocks of {} samples, which is not a multiple of its "
+                                 "decimation ratio {}".format(stage.name, stageIn, stage.decimation))
+            rate *= Fraction(stage.interpolation, stage.decimation)
+            srcFmt, srcName = stage.outFmt, "stage " + stage.name
+        self._built = True
+
+    def Reset(self) -> None:
+        """
+        Reset the state of all stages (history kept by the pipeline and the models' reset functions)
+        """
+        for stage in self._stages:
+            stage.Reset()
+
+    def Process(self, data, continueState : bool = False):
+        """
+        Process a signal block-wise through the pipeline
+        :param data: Input signal (array or tuple of arrays, samples along the last axis). The number of samples must
+                     be a multiple of the block size, or the last (shorter) block must be compatible with all rates.
+        :param continueState: False (default) = all stages are reset before processing,
+                              True = continue from the state at the end of the last call
+        :return: Output signal (array or tuple of arrays)
+        """
+        if not continueState:
+            self.Reset()
+        samples = _First(data).shape[-1]
+        blocks = (_Map(lambda x: x[..., start:start+self.blockSize], data)
+                  for start in range(0, samples, self.blockSize))
+        outputs = list(self.Stream(blocks))
+        if len(outputs) == 0:
+            raise ValueError("psi_fix_pipeline: No input samples")
+        if isinstance(outputs[0], tuple):
+            return tuple(np.concatenate(o, axis=-1) for o in zip(*outputs))
+        return np.concatenate(outputs, axis=-1)
+
+    def Stream(self, blocks : Iterable) -> Iterator:
+        """
+        Process a stream of blocks through the pipeline (e.g. blocks read from a file). Processing continues from the
+        state at the end of the last call, call Reset() to start a new stream.
+        :param blocks: Iterable of input blocks (array or tuple of arrays, samples along the last axis)
+        :return: Iterator over the output blocks
+        """
+        if not self._built:
+            self.Build()
+        if self.threaded:
+            return self._StreamThreaded(blocks)
+        return self._StreamSequential(blocks)
+
+    ####################################################################################################################
+    # Private Methods (do not call!)
+    ####################################################################################################################
+    def _StreamSequential(self, blocks : Iterable) -> Iterator:
+        for block in blocks:
+            for stage in self._stages:
+                block = stage.Run(block)
+            yield block
+
+    def _StreamThreaded(self, blocks : Iterable) -> Iterator:
+        queues = [queue.Queue(self.queueDepth) for _ in range(len(self._stages) + 1)]
+        stop = threading.Event()
+
+        def Put(q, item) -> bool:
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def Get(q):
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            return _STOP
+
+        def Feed():
+            try:
+                for block in blocks:
+                    if not Put(queues[0], block):
+                        return
+                Put(queues[0], _END)
+            except BaseException as e:
+                Put(queues[0], _PipelineError(e))
+
+        def Work(idx : int):
+            while True:
+                item = Get(queues[idx])
+                if item is _STOP:
+                    return
+                if item is _END or isinstance(item, _PipelineError):
+                    Put(queues[idx+1], item)
+                    return
+                try:
+                    item = self._stages[idx].Run(item)
+                except BaseException as e:
+                    item = _PipelineError(e)
+                if not Put(queues[idx+1], item) or isinstance(item, _PipelineError):
+                    return
+
+        threads = [threading.Thread(target=Feed, daemon=True)] + \
+                  [threading.Thread(target=Work, args=(idx,), daemon=True) for idx in range(len(self._stages))]
+        for t in threads:
+            t.start()
+        try:
+            while True:
+                item = queues[-1].get()
+                if item is _END:
+                    return
+                if isinstance(item, _PipelineError):
+                    raise item.exception
+                yield item
+        finally:
+            # Also executed if the consumer stops iterating early, all threads terminate within one queue timeout
+            stop.set()
+            for t in threads:
+                t.join()
+
+    @classmethod
+    def _FmtCompatible(cls, src, dst) -> bool:
+        if isinstance(src, tuple) or isinstance(dst, tuple):
+            return isinstance(src, tuple) and isinstance(dst, tuple) and len(src) == len(dst) and \
+                   all(cls._FmtCompatible(s, d) for s, d in zip(src, dst))
+        if src is None or dst is None:
+            return src is None and dst is None
+        # All values representable in src must be representable in dst
+        return dst.s >= src.s and dst.i >= src.i and dst.f >= src.f
+
+    @classmethod
+    def _FmtStr(cls, fmt) -> str:
+        if isinstance(fmt, tuple):
+            return "(" + ", ".join(cls._FmtStr(f) for f in fmt) + ")"
+        return str(fmt)
+
+class _PipelineStage:
+    # One stage of a pipeline including the history kept for it
+
+    def __init__(self, name, process, inFmt, outFmt, decimation, interpolation, history, reset):
+        self.name = name
+        self.process = process
+        self.inFmt = inFmt
+        self.outFmt = outFmt
+        self.decimation = decimation
+        self.interpolation = interpolation
+        self.history = history
+        self.reset = reset
+        self._last = None
+
+    def Reset(self):
+        self._last = None
+        if self.reset is not None:
+            self.reset()
+
+    def Run(self, block):
+        samples = _First(block).shape[-1]
+        if samples % self.decimation != 0:
+            raise ValueError("psi_fix_pipeline: Stage {} received {} samples, which is not a multiple of its "
+                             "decimation ratio {}".format(self.name, samples, self.decimation))
+        if self.history > 0:
+            if self._last is None:
+                # Zeros correspond to the initial state of the model
+                self._last = _Map(lambda x: np.zeros(x.shape[:-1] + (self.history,), x.dtype), block)
+            ext = _Map(lambda h, x: np.concatenate((h, x), axis=-1), self._last, block)
+            self._last = _Map(lambda x: x[..., -self.history:], ext)
+            drop = self.history * self.interpolation // self.decimation
+            out = _Map(lambda x: x[..., drop:], self.process(ext))
+        else:
+            out = self.process(block)
+        expected = samples * self.interpolation // self.decimation
+        if _First(out).shape[-1] != expected:
+            raise ValueError("psi_fix_pipeline: Stage {} returned {} samples for {} input samples, expected {} (check "
+                             "the declared rates)".format(self.name, _First(out).shape[-1], samples, expected))
+        return out
+
+class _PipelineError:
+    # Exception forwarded through the queues of a threaded pipeline
+
+    def __init__(self, exception : BaseException):
+        self.exception = exception
+
+_END = object()     # End of stream marker
+_STOP = object()    # Returned by blocking queue accesses when the pipeline is stopped
+
+def _First(data) -> np.ndarray:
+    return np.asarray(data[0] if isinstance(data, tuple) else data)
+
+def _Map(func : Callable, *data) -> Union[np.ndarray, tuple]:
+    if isinstance(data[0], tuple):
+        return tuple(func(*[np.asarray(x) for x in items]) for items in zip(*data))
+    return func(*[np.asarray(x) for x in data])
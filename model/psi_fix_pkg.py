@@ -12,6 +12,12 @@ import numpy as np
 import os
 import sys
 import contextlib
+import functools
+import hashlib
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
 #Iimport en_cl_fix package
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + "/../../en_cl_fix/python/src")
 from en_cl_fix_pkg import *
@@ -95,90 +101,761 @@ def ClFix2PsiFix(arg):
         raise Exception("PsiFix2ClFix(): unsupported argument type")
 
 
+########################################################################################################################
+# Instrumentation
+########################################################################################################################
+_profiler = None    # Active psi_fix_profiler (None = profiling disabled)
+_sat_monitor = None # Active psi_fix_sat_monitor (None = saturation monitoring disabled)
+_parallel = None    # Active psi_fix_parallel (None = single-threaded execution)
+_compact = None     # Active psi_fix_compact_mode (None = results are float64 arrays)
+_hooks_active = 0   # Number of active hooks (of any kind)
+
+def _instrumented(func):
+    # Decorator for psi_fix_pkg functions, while no hook (profiler, monitor, etc.) is active it only adds one check per
+    # call
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _hooks_active == 0:
+            return func(*args, **kwargs)
+        return _HookedCall(func, args, kwargs)
+    return wrapper
+
+_signature = functools.lru_cache(maxsize=None)(inspect.signature)
+
+def _HookedCall(func, args, kwargs):
+    bound = _signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    sig = None
+    if _profiler is not None or _sat_monitor is not None:
+        sig = " ".join("{}={}".format(k, v) if isinstance(v, psi_fix_fmt_t) else v.name
+                       for k, v in bound.arguments.items() if isinstance(v, (psi_fix_fmt_t, Enum)))
+    if _sat_monitor is not None:
+        # Before the call because out may be one of the inputs
+        _sat_monitor._Record(func.__name__, sig, bound.arguments)
+    start = time.perf_counter()
+    if _parallel is None:
+        result = func(*args, **kwargs)
+    else:
+        result = _parallel._Run(func, bound.arguments)
+    seconds = time.perf_counter() - start
+    if _profiler is not None:
+        _profiler._Record(func.__name__, sig, bound.arguments, seconds)
+    if _compact is not None:
+        result = _compact._Wrap(func.__name__, result, bound.arguments)
+    return result
+
+class _psi_fix_hook:
+    # Common base of all hooks (profiler, saturation monitor, etc.): activation as context manager
+    _name = None
+
+    def __enter__(self):
+        global _hooks_active
+        self._outer = globals()[self._name]
+        globals()[self._name] = self
+        _hooks_active += 1
+        return self
+
+    def __exit__(self, *exc):
+        global _hooks_active
+        globals()[self._name] = self._outer
+        _hooks_active -= 1
+        return False
+
+class psi_fix_profiler(_psi_fix_hook):
+    """
+    Opt-in instrumentation of the psi_fix_pkg functions. While the profiler is active (with-block), call count, number
+    of elements processed and cumulative time are recorded per function and per signature (formats, rounding and
+    saturation mode). If profilers are nested, calls are only recorded by the innermost one.
+
+    Usage example:
+    with psi_fix_profiler() as prof:
+        model.Process(data)
+    print(prof.Report())
+    """
+    _name = "_profiler"
+
+    def __init__(self):
+        self.stats = {}     # (function name, signature) -> [calls, elements, seconds]
+
+    def Reset(self) -> None:
+        """
+        Clear all statistics recorded so far
+        """
+        self.stats = {}
+
+    def Report(self, sortBy : str = "time", top : int = None) -> str:
+        """
+        Get a table of the statistics recorded
+        :param sortBy: Column to sort by in descending order ("time", "calls" or "elements")
+        :param top: Only report the top N entries (None = all)
+        :return: Report text
+        """
+        col = {"calls" : 0, "elements" : 1, "time" : 2}[sortBy]
+        entries = sorted(self.stats.items(), key=lambda e: e[1][col], reverse=True)[:top]
+        totalTime = sum(v[2] for v in self.stats.values())
+        lines = ["{:<22} {:<60} {:>9} {:>12} {:>10} {:>6} {:>9}".format(
+                 "function", "signature", "calls", "elements", "time [s]", "%", "ns/elem")]
+        for (name, sig), (calls, elements, seconds) in entries:
+            lines.append("{:<22} {:<60} {:>9} {:>12} {:>10.4f} {:>6.1f} {:>9.1f}".format(
+                         name, sig, calls, elements, seconds, 100*seconds/max(totalTime, 1e-12),
+                         1e9*seconds/max(elements, 1)))
+        return "\n".join(lines)
+
+    def _Record(self, name : str, sig : str, args : dict, seconds : float):
+        entry = self.stats.setdefault((name, sig), [0, 0, 0.0])
+        entry[0] += 1
+        entry[1] += int(np.size(args["a"]))
+        entry[2] += seconds
+
+class psi_fix_sat_monitor(_psi_fix_hook):
+    """
+    Opt-in counting of saturation and wrap events. While the monitor is active (with-block), every psi_fix_pkg function
+    that can saturate or wrap counts (vectorized) the elements whose result does not fit the result format.
+
+    Events are recorded per stage. A stage is identified by the code location calling the psi_fix_pkg function (model
+    class, method and line) together with the function and its signature. ForModel() returns the counters of one model
+    class only. If monitors are nested, events are only recorded by the innermost one.
+
+    Usage example:
+    with psi_fix_sat_monitor() as mon:
+        model.Process(data)
+    if mon.Events() > 0:
+        print(mon.Report())
+    """
+    _name = "_sat_monitor"
+
+    # Exact result of each function before it is fitted into the result format
+    _EXACT = {"psi_fix_from_real"   : lambda a: a["a"],
+              "psi_fix_resize"      : lambda a: a["a"],
+              "psi_fix_add"         : lambda a: np.add(a["a"], a["b"]),
+              "psi_fix_sub"         : lambda a: np.subtract(a["a"], a["b"]),
+              "psi_fix_mult"        : lambda a: np.multiply(a["a"], a["b"]),
+              "psi_fix_abs"         : lambda a: np.abs(a["a"]),
+              "psi_fix_neg"         : lambda a: np.negative(a["a"]),
+              "psi_fix_shift_left"  : lambda a: np.multiply(a["a"], 2.0**np.asarray(a["shift"], dtype=np.float64)),
+              "psi_fix_shift_right" : lambda a: np.multiply(a["a"], 2.0**-np.asarray(a["shift"], dtype=np.float64))}
+
+    def __init__(self):
+        self.stats = {}     # (location, function name, signature) -> [elements, saturated, wrapped]
+
+    def Reset(self) -> None:
+        """
+        Clear all counters
+        """
+        self.stats = {}
+
+    def Events(self) -> int:
+        """
+        Get the total number of saturation and wrap events
+        :return: Number of elements saturated or wrapped
+        """
+        return sum(v[1] + v[2] for v in self.stats.values())
+
+    def ForModel(self, model) -> dict:
+        """
+        Get the counters of the stages of one model
+        :param model: Model object (or class)
+        :return: Dictionary (location, function name, signature) -> [elements, saturated, wrapped]
+        """
+        prefix = (model if isinstance(model, type) else type(model)).__name__ + "."
+        return {k : v for k, v in self.stats.items() if k[0].startswith(prefix)}
+
+    def Report(self, onlyEvents : bool = True) -> str:
+        """
+        Get a table of the counters, stages with most events first
+        :param onlyEvents: True = only report stages that saturated or wrapped
+        :return: Report text
+        """
+        entries = sorted(self.stats.items(), key=lambda e: e[1][1] + e[1][2], reverse=True)
+        lines = ["{:<40} {:<22} {:<60} {:>12} {:>10} {:>10}".format(
+                 "location", "function", "signature", "elements", "saturated", "wrapped")]
+        for (loc, name, sig), (elements, saturated, wrapped) in entries:
+            if saturated + wrapped > 0 or not onlyEvents:
+                lines.append("{:<40} {:<22} {:<60} {:>12} {:>10} {:>10}".format(
+                             loc, name, sig, elements, saturated, wrapped))
+        return "\n".join(lines)
+
+    def _Record(self, name : str, sig : str, args : dict):
+        if name not in self._EXACT:
+            return
+        exact = np.asarray(self._EXACT[name](args), dtype=np.float64)
+        # Round to the result format, from_real always rounds and saturates
+        fmt = args["r_fmt"]
+        offs = 0.5 if args.get("rnd", psi_fix_rnd_t.round) == psi_fix_rnd_t.round else 0.0
+        rounded = np.floor(exact * 2.0**fmt.f + offs) * 2.0**-fmt.f
+        events = int(np.count_nonzero((rounded > psi_fix_upper_bound(fmt)) | (rounded < psi_fix_lower_bound(fmt))))
+        entry = self.stats.setdefault((self._Location(), name, sig), [0, 0, 0])
+        entry[0] += exact.size
+        entry[1 if args.get("sat", psi_fix_sat_t.sat) == psi_fix_sat_t.sat else 2] += events
+
+    @staticmethod
+    def _Location() -> str:
+        # First code location outside psi_fix_pkg ("<class>.<method>:<line>" for methods)
+        frame = sys._getframe(1)
+        while frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+        owner = frame.f_locals.get("self", None)
+        prefix = "" if owner is None else type(owner).__name__ + "."
+        return "{}{}:{}".format(prefix, frame.f_code.co_name, frame.f_lineno)
+
+class psi_fix_parallel(_psi_fix_hook):
+    """
+    Opt-in multi-threaded execution of the element-wise psi_fix_pkg functions. While active (with-block), calls on
+    large arrays are split into chunks that are processed by a thread pool and written into a preallocated result.
+    NumPy releases the GIL for the calculations, so all cores are used without any change to the model code. Results
+    are identical to single-threaded execution.
+
+    Usage example:
+    with psi_fix_parallel(threads=16):
+        model.Process(data)
+    """
+    _name = "_parallel"
+
+    # Arguments that are processed element-wise (broadcast against each other)
+    _ARRAY_ARGS = ("a", "b", "shift")
+
+    def __init__(self, threads : int = None, chunkSize : int = 1 << 16, minSize : int = 1 << 18):
+        """
+        Constructor
+        :param threads: Number of threads (None = number of CPUs)
+        :param chunkSize: Number of elements per chunk (default fits double-precision chunks into the L2 cache)
+        :param minSize: Calls with fewer elements are executed single-threaded
+        """
+        self.threads = os.cpu_count() if threads is None else threads
+        self.chunkSize = chunkSize
+        self.minSize = max(minSize, chunkSize)
+        self._pool = None
+
+    def __enter__(self):
+        self._pool = ThreadPoolExecutor(self.threads)
+        return super().__enter__()
+
+    def __exit__(self, *exc):
+        super().__exit__(*exc)
+        self._pool.shutdown()
+        self._pool = None
+        return False
+
+    def _Run(self, func, args : dict):
+        arrays = {k : np.asarray(args[k]) for k in self._ARRAY_ARGS if k in args and np.ndim(args[k]) > 0}
+        shape = np.broadcast_shapes(*[a.shape for a in arrays.values()]) if arrays else ()
+        size = int(np.prod(shape, dtype=np.int64))
+        if size < self.minSize or self.threads <= 1:
+            return func(**args)
+        out = args.get("out", None)
+        if out is not None and (out.shape != shape or not out.flags.c_contiguous):
+            return func(**args)
+        flat = {k : np.broadcast_to(a, shape).reshape(-1) for k, a in arrays.items()}
+        bounds = list(range(0, size, self.chunkSize)) + [size]
+
+        def Chunk(idx : int):
+            chunkArgs = {k : a[bounds[idx]:bounds[idx+1]] for k, a in flat.items()}
+            if out is not None:
+                chunkArgs["out"] = result[bounds[idx]:bounds[idx+1]]
+            return func(**{**args, **chunkArgs})
+
+        if out is not None:
+            # Chunks are written directly into out
+            result = out.reshape(-1)
+            start = 0
+        else:
+            # First chunk determines the data type of the result
+            first = np.asarray(Chunk(0))
+            result = np.empty(size, first.dtype)
+            result[:bounds[1]] = first
+            start = 1
+
+        def Store(idx : int):
+            res = Chunk(idx)
+            if out is None:
+                result[bounds[idx]:bounds[idx+1]] = res
+
+        for _ in self._pool.map(Store, range(start, len(bounds)-1)):
+            pass
+        return out if out is not None else result.reshape(shape)
+
+class psi_fix_compact_mode(_psi_fix_hook):
+    """
+    Opt-in compact storage of fixed-point results. While active (with-block), array results of the psi_fix_pkg
+    functions are returned as psi_fix_compact (integer codes or float32) instead of float64 arrays if the result format
+    allows it. Compact arrays are promoted to float64 whenever they are used in calculations, so model code works
+    unchanged while the signals it holds need 2-8x less memory.
+
+    Usage example:
+    with psi_fix_compact_mode():
+        out = model.Process(data)   # out is psi_fix_compact if the output format has <= 32 bits
+    """
+    _name = "_compact"
+
+    def __init__(self, useFloat32 : bool = False):
+        """
+        Constructor
+        :param useFloat32: False (default) = results are stored as integer codes (formats up to 32 bits),
+                           True = results are stored as float32 (formats up to 24 bits)
+        """
+        self.useFloat32 = useFloat32
+
+    def _Wrap(self, name : str, result, args : dict):
+        fmt = args["a_fmt"] if name == "psi_fix_from_bits_as_int" else args.get("r_fmt", None)
+        if fmt is None or args.get("out", None) is not None or not isinstance(result, np.ndarray) or \
+           result.ndim == 0 or result.dtype != np.float64:
+            return result
+        dtype = psi_fix_compact.CodeType(fmt, self.useFloat32)
+        if dtype is None:
+            return result
+        # Results of psi_fix_pkg functions are valid values of their format, so no check is required
+        return psi_fix_compact._FromCodes(psi_fix_compact._Encode(result, fmt, dtype), fmt)
+
+########################################################################################################################
+# In-place calculation (out parameter)
+########################################################################################################################
+# Formats up to this width are calculated exactly in double precision (margin for rounding and wrapping). Results of
+# wider formats are calculated by en_cl_fix and copied to out.
+_IN_PLACE_MAX_BITS = 50
+
+def _Width(fmt : psi_fix_fmt_t):
+    return fmt.s + fmt.i + fmt.f
+
+def _SumWidth(a_fmt : psi_fix_fmt_t, b_fmt : psi_fix_fmt_t):
+    # Width of the exact sum/difference (operands aligned to the binary point)
+    return max(a_fmt.s, b_fmt.s) + max(a_fmt.i, b_fmt.i) + 1 + max(a_fmt.f, b_fmt.f)
+
+def _ToOut(result, out):
+    if out is None:
+        return result
+    out[...] = result
+    return out
+
+def _FitInPlace(out : np.ndarray, fracBits, r_fmt : psi_fix_fmt_t, rnd : psi_fix_rnd_t, sat : psi_fix_sat_t):
+    # Round and saturate/wrap exact values in out (with fracBits fractional bits) to r_fmt, same as en_cl_fix
+    if r_fmt.f < fracBits:
+        np.multiply(out, 2.0**r_fmt.f, out=out)
+        if rnd == psi_fix_rnd_t.round:
+            np.add(out, 0.5, out=out)
+        np.floor(out, out=out)
+        np.multiply(out, 2.0**-r_fmt.f, out=out)
+    lo = psi_fix_lower_bound(r_fmt)
+    if sat == psi_fix_sat_t.sat:
+        np.clip(out, lo, psi_fix_upper_bound(r_fmt), out=out)
+    else:
+        np.subtract(out, lo, out=out)
+        np.mod(out, 2.0**(r_fmt.s + r_fmt.i), out=out)
+        np.add(out, lo, out=out)
+    return out
+
+########################################################################################################################
+# Backends
+########################################################################################################################
+# The calculations of the psi_fix_pkg functions are executed by the selected backend. The backend is selected per
+# process (environment variable or psi_fix_set_backend()) or for a block of code (psi_fix_use_backend()). The default
+# backend ("inplace") calculates results by en_cl_fix and calculates in place if an out array is passed.
+_BACKEND_ENV = "PSI_FIX_BACKEND"                # Name of the backend selected at import (default: "inplace")
+_BACKEND_CHECK_ENV = "PSI_FIX_BACKEND_CHECK"    # N = every N-th call of the backend is checked against the reference
+
+class psi_fix_backend_ref:
+    """
+    Reference backend, all calculations are executed by en_cl_fix.
+
+    Other backends derive from this class and override the operations they implement faster, all other operations
+    fall back to the reference. Formats, rounding and saturation modes are passed as psi_fix types. Operations with an
+    out argument must write the result to out and return it if out is not None.
+    """
+
+    def FromReal(self, a, r_fmt : psi_fix_fmt_t, out : np.ndarray):
+        return _ToOut(cl_fix_from_real(a, PsiFix2ClFix(r_fmt), FixSaturate.Sat_s), out)
+
+    def FromBitsAsInt(self, a, a_fmt : psi_fix_fmt_t):
+        return cl_fix_from_bits_as_int(a, PsiFix2ClFix(a_fmt))
+
+    def GetBitsAsInt(self, a, a_fmt : psi_fix_fmt_t):
+        return cl_fix_get_bits_as_int(a, PsiFix2ClFix(a_fmt))
+
+    def Resize(self, a, a_fmt : psi_fix_fmt_t, r_fmt : psi_fix_fmt_t, rnd : psi_fix_rnd_t, sat : psi_fix_sat_t,
+               out : np.ndarray):
+        return _ToOut(cl_fix_resize(a, PsiFix2ClFix(a_fmt), PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd), PsiFix2ClFix(sat)),
+                      out)
+
+    def Add(self, a, a_fmt : psi_fix_fmt_t, b, b_fmt : psi_fix_fmt_t, r_fmt : psi_fix_fmt_t, rnd : psi_fix_rnd_t,
+            sat : psi_fix_sat_t, out : np.ndarray):
+        return _ToOut(cl_fix_add(a, PsiFix2ClFix(a_fmt), b, PsiFix2ClFix(b_fmt),
+                                 PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd), PsiFix2ClFix(sat)), out)
+
+    def Sub(self, a, a_fmt : psi_fix_fmt_t, b, b_fmt : psi_fix_fmt_t, r_fmt : psi_fix_fmt_t, rnd : psi_fix_rnd_t,
+            sat : psi_fix_sat_t, out : np.ndarray):
+        return _ToOut(cl_fix_sub(a, PsiFix2ClFix(a_fmt), b, PsiFix2ClFix(b_fmt),
+                                 PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd), PsiFix2ClFix(sat)), out)
+
+    def Mult(self, a, a_fmt : psi_fix_fmt_t, b, b_fmt : psi_fix_fmt_t, r_fmt : psi_fix_fmt_t, rnd : psi_fix_rnd_t,
+             sat : psi_fix_sat_t, out : np.ndarray):
+        return _ToOut(cl_fix_mult(a, PsiFix2ClFix(a_fmt), b, PsiFix2ClFix(b_fmt),
+                                  PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd), PsiFix2ClFix(sat)), out)
+
+    def Abs(self, a, a_fmt : psi_fix_fmt_t, r_fmt : psi_fix_fmt_t, rnd : psi_fix_rnd_t, sat : psi_fix_sat_t,
+            out : np.ndarray):
+        return _ToOut(cl_fix_abs(a, PsiFix2ClFix(a_fmt), PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd), PsiFix2ClFix(sat)), out)
+
+    def Neg(self, a, a_fmt : psi_fix_fmt_t, r_fmt : psi_fix_fmt_t, rnd : psi_fix_rnd_t, sat : psi_fix_sat_t,
+            out : np.ndarray):
+        return _ToOut(cl_fix_neg(a, PsiFix2ClFix(a_fmt), PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd), PsiFix2ClFix(sat)), out)
+
+    def Shift(self, a, a_fmt : psi_fix_fmt_t, shift, r_fmt : psi_fix_fmt_t, rnd : psi_fix_rnd_t, sat : psi_fix_sat_t,
+              out : np.ndarray):
+        # shift > 0 = left, shift < 0 = right
+        return _ToOut(cl_fix_shift(a, PsiFix2ClFix(a_fmt), shift, PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd),
+                                   PsiFix2ClFix(sat)), out)
+
+    def InRange(self, a, a_fmt : psi_fix_fmt_t, r_fmt : psi_fix_fmt_t, rnd : psi_fix_rnd_t):
+        return cl_fix_in_range(a, PsiFix2ClFix(a_fmt), PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd))
+
+class psi_fix_backend_fast(psi_fix_backend_ref):
+    """
+    Fast backend, results are calculated directly in double precision by numpy (in place if out is passed). This is
+    exact for formats up to 50 bits if the inputs are valid values of their formats. Wider formats and inputs that are
+    off the grid or out of the range of their format are calculated by the reference backend.
+    """
+
+    def Resize(self, a, a_fmt, r_fmt, rnd, sat, out):
+        a = np.asarray(a)
+        target = self._Target(out, _Width(a_fmt), r_fmt, (a, a_fmt))
+        if target is None:
+            return super().Resize(a, a_fmt, r_fmt, rnd, sat, out)
+        np.copyto(target, a)
+        return self._Result(_FitInPlace(target, a_fmt.f, r_fmt, rnd, sat), out)
+
+    def Add(self, a, a_fmt, b, b_fmt, r_fmt, rnd, sat, out):
+        a, b = np.asarray(a), np.asarray(b)
+        target = self._Target(out, _SumWidth(a_fmt, b_fmt), r_fmt, (a, a_fmt), (b, b_fmt))
+        if target is None:
+            return super().Add(a, a_fmt, b, b_fmt, r_fmt, rnd, sat, out)
+        np.add(a, b, out=target)
+        return self._Result(_FitInPlace(target, max(a_fmt.f, b_fmt.f), r_fmt, rnd, sat), out)
+
+    def Sub(self, a, a_fmt, b, b_fmt, r_fmt, rnd, sat, out):
+        a, b = np.asarray(a), np.asarray(b)
+        target = self._Target(out, _SumWidth(a_fmt, b_fmt), r_fmt, (a, a_fmt), (b, b_fmt))
+        if target is None:
+            return super().Sub(a, a_fmt, b, b_fmt, r_fmt, rnd, sat, out)
+        np.subtract(a, b, out=target)
+        return self._Result(_FitInPlace(target, max(a_fmt.f, b_fmt.f), r_fmt, rnd, sat), out)
+
+    def Mult(self, a, a_fmt, b, b_fmt, r_fmt, rnd, sat, out):
+        a, b = np.asarray(a), np.asarray(b)
+        target = self._Target(out, _Width(a_fmt) + _Width(b_fmt), r_fmt, (a, a_fmt), (b, b_fmt))
+        if target is None:
+            return super().Mult(a, a_fmt, b, b_fmt, r_fmt, rnd, sat, out)
+        np.multiply(a, b, out=target)
+        return self._Result(_FitInPlace(target, a_fmt.f + b_fmt.f, r_fmt, rnd, sat), out)
+
+    def Abs(self, a, a_fmt, r_fmt, rnd, sat, out):
+        a = np.asarray(a)
+        target = self._Target(out, _Width(a_fmt) + 1, r_fmt, (a, a_fmt))
+        if target is None:
+            return super().Abs(a, a_fmt, r_fmt, rnd, sat, out)
+        np.abs(a, out=target)
+        return self._Result(_FitInPlace(target, a_fmt.f, r_fmt, rnd, sat), out)
+
+    def Neg(self, a, a_fmt, r_fmt, rnd, sat, out):
+        a = np.asarray(a)
+        target = self._Target(out, _Width(a_fmt) + 1, r_fmt, (a, a_fmt))
+        if target is None:
+            return super().Neg(a, a_fmt, r_fmt, rnd, sat, out)
+        np.negative(a, out=target)
+        return self._Result(_FitInPlace(target, a_fmt.f, r_fmt, rnd, sat), out)
+
+    def Shift(self, a, a_fmt, shift, r_fmt, rnd, sat, out):
+        a, shift = np.asarray(a), np.asarray(shift)
+        # Empty shift arrays give empty results, the reference handles them
+        target = self._Target(out, _Width(a_fmt), r_fmt, (a, a_fmt), (shift, None)) if shift.size > 0 else None
+        if target is None:
+            return super().Shift(a, a_fmt, shift, r_fmt, rnd, sat, out)
+        np.multiply(a, np.exp2(shift.astype(np.float64)), out=target)
+        return self._Result(_FitInPlace(target, a_fmt.f + max(0, -np.min(shift)), r_fmt, rnd, sat), out)
+
+    @staticmethod
+    def _Target(out, exactWidth, r_fmt : psi_fix_fmt_t, *operands):
+        # Array to calculate the result in (out or a new array), None if the calculation is not exact in double
+        # precision (exactWidth = width of the exact result before rounding, operands = (array, format or None))
+        if max(exactWidth, _Width(r_fmt)) > _IN_PLACE_MAX_BITS or any(x.dtype == object for x, _ in operands):
+            return None
+        if not all(fmt is None or psi_fix_backend_fast._Valid(x, fmt) for x, fmt in operands):
+            return None
+        if out is None:
+            return np.empty(np.broadcast_shapes(*[x.shape for x, _ in operands]))
+        return out if out.dtype == np.float64 else None
+
+    # Elements checked at once by _Valid() (bounds the temporary memory of the check)
+    _VALID_CHUNK = 1 << 14
+
+    @staticmethod
+    def _Valid(x : np.ndarray, fmt : psi_fix_fmt_t) -> bool:
+        # True if all values are on the grid and in the range of the format (only then the widths above are exact)
+        if x.size == 0:
+            return True
+        if np.min(x) < psi_fix_lower_bound(fmt) or np.max(x) > psi_fix_upper_bound(fmt):
+            return False
+        flat = x.reshape(-1) if x.flags.c_contiguous else x.flat   # No copy of the whole array
+        buf = np.empty(min(x.size, psi_fix_backend_fast._VALID_CHUNK))
+        for start in range(0, x.size, buf.size):
+            chunk = buf[:min(buf.size, x.size - start)]
+            np.multiply(flat[start:start+chunk.size], 2.0**fmt.f, out=chunk)
+            if np.any(np.fmod(chunk, 1.0, out=chunk)):
+                return False
+        return True
+
+    @staticmethod
+    def _Result(target : np.ndarray, out):
+        # Scalar inputs give scalar results (as for en_cl_fix)
+        return target if out is not None or target.ndim > 0 else target[()]
+
+class psi_fix_backend_inplace(psi_fix_backend_fast):
+    """
+    Default backend: results are calculated by en_cl_fix, except if an out array is passed. Then the kernels of the
+    fast backend calculate the result in place in out, so out and psi_fix_workspace buffers do not require additional
+    memory for the result.
+    """
+
+    @staticmethod
+    def _Target(out, exactWidth, r_fmt : psi_fix_fmt_t, *operands):
+        if out is None:
+            return None
+        return psi_fix_backend_fast._Target(out, exactWidth, r_fmt, *operands)
+
+class psi_fix_backend_diff(psi_fix_backend_ref):
+    """
+    Differential backend to verify other backends: the backend under test calculates the results and every N-th call
+    is also calculated by the reference backend. BittruenessNotGuaranteed is raised on any mismatch.
+
+    The differential backend is also selected when the environment variable PSI_FIX_BACKEND_CHECK is set to N (the
+    backend selected by PSI_FIX_BACKEND is checked then).
+
+    Usage example:
+    with psi_fix_use_backend(psi_fix_backend_diff("fast", every=100)) as diff:
+        model.Process(data)
+    print(diff.checked)
+    """
+
+    def __init__(self, backend, every : int = 1):
+        """
+        Constructor
+        :param backend: Backend under test (object or registered name)
+        :param every: Check every N-th call (1 = all calls)
+        """
+        if every < 1:
+            raise ValueError("psi_fix_backend_diff: every must be >= 1")
+        self.backend = _Backend(backend)
+        self.reference = psi_fix_backend_ref()
+        self.every = every
+        self.calls = 0      # Number of calls executed
+        self.checked = 0    # Number of calls checked against the reference
+
+    def FromReal(self, *args):
+        return self._Call("FromReal", args)
+
+    def FromBitsAsInt(self, *args):
+        return self._Call("FromBitsAsInt", args)
+
+    def GetBitsAsInt(self, *args):
+        return self._Call("GetBitsAsInt", args)
+
+    def Resize(self, *args):
+        return self._Call("Resize", args)
+
+    def Add(self, *args):
+        return self._Call("Add", args)
+
+    def Sub(self, *args):
+        return self._Call("Sub", args)
+
+    def Mult(self, *args):
+        return self._Call("Mult", args)
+
+    def Abs(self, *args):
+        return self._Call("Abs", args)
+
+    def Neg(self, *args):
+        return self._Call("Neg", args)
+
+    def Shift(self, *args):
+        return self._Call("Shift", args)
+
+    def InRange(self, *args):
+        return self._Call("InRange", args)
+
+    # Operations without out argument
+    _NO_OUT = ("FromBitsAsInt", "GetBitsAsInt", "InRange")
+
+    def _Call(self, op : str, args : tuple):
+        self.calls += 1
+        if (self.calls - 1) % self.every != 0:
+            return getattr(self.backend, op)(*args)
+        # The reference is calculated first and without out, since out may be one of the inputs
+        refArgs = args if op in self._NO_OUT else args[:-1] + (None,)
+        ref = getattr(self.reference, op)(*refArgs)
+        result = getattr(self.backend, op)(*args)
+        self.checked += 1
+        if not np.array_equal(np.asarray(ref), np.asarray(result)):
+            raise BittruenessNotGuaranteed("psi_fix_backend_diff: {}.{}({}) differs from the reference in {} of {} "
+                                           "values".format(type(self.backend).__name__, op,
+                                           ", ".join(str(x) if isinstance(x, psi_fix_fmt_t) else x.name
+                                                     for x in args if isinstance(x, (psi_fix_fmt_t, Enum))),
+                                           np.count_nonzero(np.asarray(ref) != np.asarray(result)), np.size(ref)))
+        return result
+
+_backends = {"inplace" : psi_fix_backend_inplace(),
+             "reference" : psi_fix_backend_ref(),
+             "fast" : psi_fix_backend_fast()}
+
+def _Backend(backend) -> psi_fix_backend_ref:
+    # Resolve backend names
+    if isinstance(backend, str):
+        if backend not in _backends:
+            raise ValueError("psi_fix_pkg: Unknown backend {}, registered backends are {}".format(
+                             backend, ", ".join(_backends)))
+        return _backends[backend]
+    return backend
+
+def psi_fix_register_backend(name : str, backend : psi_fix_backend_ref) -> None:
+    """
+    Register a backend so it can be selected by name
+    :param name: Name of the backend
+    :param backend: Backend object (derived from psi_fix_backend_ref)
+    """
+    _backends[name] = backend
+
+def psi_fix_get_backend() -> psi_fix_backend_ref:
+    """
+    Get the backend currently selected
+    :return: Backend object
+    """
+    return _backend
+
+def psi_fix_set_backend(backend) -> psi_fix_backend_ref:
+    """
+    Select the backend used by all psi_fix_pkg functions of the process
+    :param backend: Backend object or registered name ("inplace", "reference", "fast" or names passed to
+                    psi_fix_register_backend)
+    :return: Backend selected before
+    """
+    global _backend
+    previous = _backend
+    _backend = _Backend(backend)
+    return previous
+
+@contextlib.contextmanager
+def psi_fix_use_backend(backend):
+    """
+    Select a backend for a block of code (with-block), the previous backend is restored at the end of the block
+    :param backend: Backend object or registered name
+    :return: Backend object
+    """
+    previous = psi_fix_set_backend(backend)
+    try:
+        yield _backend
+    finally:
+        psi_fix_set_backend(previous)
+
+_backend = _Backend(os.environ.get(_BACKEND_ENV, "inplace"))
+if os.environ.get(_BACKEND_CHECK_ENV):
+    _backend = psi_fix_backend_diff(_backend, int(os.environ[_BACKEND_CHECK_ENV]))
+
 ########################################################################################################################
 # Bittrue available in VHDL
 ########################################################################################################################
 def psi_fix_size(fmt : psi_fix_fmt_t) -> int:
     return cl_fix_width(PsiFix2ClFix(fmt))
 
+@_instrumented
 def psi_fix_from_real(a,
                       r_fmt : psi_fix_fmt_t,
-                      err_sat : bool = True):
+                      err_sat : bool = True,
+                      out : np.ndarray = None):
     # psi_fix specific implementation because of the err_sat parameter that does not exist in cl_fix
     if err_sat:
         if np.max(a) > psi_fix_upper_bound(r_fmt):
             raise ValueError("psi_fix_from_real: Number {} could not be represented by format {}".format(np.max(a), r_fmt))
         if np.min(a) < psi_fix_lower_bound(r_fmt):
             raise ValueError("psi_fix_from_real: Number {} could not be represented by format {}".format(np.min(a), r_fmt))
-    return cl_fix_from_real(a, PsiFix2ClFix(r_fmt), FixSaturate.Sat_s)
+    return _backend.FromReal(a, r_fmt, out)
 
+@_instrumented
 def psi_fix_from_bits_as_int(a : int, a_fmt : psi_fix_fmt_t):
-    return cl_fix_from_bits_as_int(a, PsiFix2ClFix(a_fmt))
+    return _backend.FromBitsAsInt(a, a_fmt)
 
+@_instrumented
 def psi_fix_get_bits_as_int(a, a_fmt : psi_fix_fmt_t):
-    return cl_fix_get_bits_as_int(a, PsiFix2ClFix(a_fmt))
+    return _backend.GetBitsAsInt(a, a_fmt)
 
+@_instrumented
 def psi_fix_resize(a, a_fmt : psi_fix_fmt_t,
                    r_fmt : psi_fix_fmt_t,
-                   rnd : psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat : psi_fix_sat_t = psi_fix_sat_t.wrap):
-    return cl_fix_resize(a, PsiFix2ClFix(a_fmt), PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd), PsiFix2ClFix(sat))
+                   rnd : psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat : psi_fix_sat_t = psi_fix_sat_t.wrap,
+                   out : np.ndarray = None):
+    return _backend.Resize(a, a_fmt, r_fmt, rnd, sat, out)
 
+@_instrumented
 def psi_fix_add(a, a_fmt : psi_fix_fmt_t,
                 b, b_fmt : psi_fix_fmt_t,
                 r_fmt : psi_fix_fmt_t,
-                rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat: psi_fix_sat_t = psi_fix_sat_t.wrap):
-    return cl_fix_add(a, PsiFix2ClFix(a_fmt),
-                      b, PsiFix2ClFix(b_fmt),
-                      PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd), PsiFix2ClFix(sat))
+                rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat: psi_fix_sat_t = psi_fix_sat_t.wrap,
+                out : np.ndarray = None):
+    return _backend.Add(a, a_fmt, b, b_fmt, r_fmt, rnd, sat, out)
 
+@_instrumented
 def psi_fix_sub(a, a_fmt : psi_fix_fmt_t,
                 b, b_fmt : psi_fix_fmt_t,
                 r_fmt : psi_fix_fmt_t,
-                rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat: psi_fix_sat_t = psi_fix_sat_t.wrap):
-    return cl_fix_sub(a, PsiFix2ClFix(a_fmt),
-                      b, PsiFix2ClFix(b_fmt),
-                      PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd), PsiFix2ClFix(sat))
+                rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat: psi_fix_sat_t = psi_fix_sat_t.wrap,
+                out : np.ndarray = None):
+    return _backend.Sub(a, a_fmt, b, b_fmt, r_fmt, rnd, sat, out)
 
 
+@_instrumented
 def psi_fix_mult(a, a_fmt : psi_fix_fmt_t,
                  b, b_fmt : psi_fix_fmt_t,
                  r_fmt : psi_fix_fmt_t,
-                 rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat: psi_fix_sat_t = psi_fix_sat_t.wrap):
-    return cl_fix_mult(a, PsiFix2ClFix(a_fmt),
-                       b, PsiFix2ClFix(b_fmt),
-                       PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd), PsiFix2ClFix(sat))
+                 rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat: psi_fix_sat_t = psi_fix_sat_t.wrap,
+                 out : np.ndarray = None):
+    return _backend.Mult(a, a_fmt, b, b_fmt, r_fmt, rnd, sat, out)
 
+@_instrumented
 def psi_fix_abs(a, a_fmt : psi_fix_fmt_t,
                 r_fmt : psi_fix_fmt_t,
-                rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat: psi_fix_sat_t = psi_fix_sat_t.wrap):
-    return cl_fix_abs(a, PsiFix2ClFix(a_fmt), PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd), PsiFix2ClFix(sat))
+                rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat: psi_fix_sat_t = psi_fix_sat_t.wrap,
+                out : np.ndarray = None):
+    return _backend.Abs(a, a_fmt, r_fmt, rnd, sat, out)
 
+@_instrumented
 def psi_fix_neg(a, a_fmt : psi_fix_fmt_t,
                 r_fmt : psi_fix_fmt_t,
-                rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat: psi_fix_sat_t = psi_fix_sat_t.wrap):
-    return cl_fix_neg(a, PsiFix2ClFix(a_fmt), PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd),PsiFix2ClFix(sat))
+                rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat: psi_fix_sat_t = psi_fix_sat_t.wrap,
+                out : np.ndarray = None):
+    return _backend.Neg(a, a_fmt, r_fmt, rnd, sat, out)
 
+@_instrumented
 def psi_fix_shift_left(a, a_fmt : psi_fix_fmt_t,
                        shift : int, max_shift : int,
                        r_fmt : psi_fix_fmt_t,
-                       rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat: psi_fix_sat_t = psi_fix_sat_t.wrap):
+                       rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat: psi_fix_sat_t = psi_fix_sat_t.wrap,
+                       out : np.ndarray = None):
     # psi_fix specific implementation because of slightly different signature (related to synthesis issues)
     if np.any(shift > max_shift):
         raise ValueError("psi_fix_shift_left: shift must be <= max_shift")
     if np.any(shift < 0):
         raise ValueError("psi_fix_shift_left: shift must be > 0")
-    return cl_fix_shift(a, PsiFix2ClFix(a_fmt), shift, PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd), PsiFix2ClFix(sat))
+    return _backend.Shift(a, a_fmt, shift, r_fmt, rnd, sat, out)
 
+@_instrumented
 def psi_fix_shift_right(a, a_fmt : psi_fix_fmt_t,
                         shift : int, max_shift : int,
                         r_fmt : psi_fix_fmt_t,
-                        rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat: psi_fix_sat_t = psi_fix_sat_t.wrap):
+                        rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc, sat: psi_fix_sat_t = psi_fix_sat_t.wrap,
+                        out : np.ndarray = None):
     # psi_fix specific implementation because of slightly different signature (related to synthesis issues)
     if np.any(shift > max_shift):
         raise ValueError("psi_fix_shift_right: shift must be <= max_shift")
     if np.any(shift < 0):
         raise ValueError("psi_fix_shift_right: shift must be > 0")
-    return cl_fix_shift(a, PsiFix2ClFix(a_fmt), -shift, PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd), PsiFix2ClFix(sat))
+    return _backend.Shift(a, a_fmt, -shift, r_fmt, rnd, sat, out)
 
 def psi_fix_upper_bound(r_fmt : psi_fix_fmt_t):
     return cl_fix_max_value(PsiFix2ClFix(r_fmt))
@@ -186,14 +863,209 @@ def psi_fix_upper_bound(r_fmt : psi_fix_fmt_t):
 def psi_fix_lower_bound(r_fmt : psi_fix_fmt_t):
     return cl_fix_min_value(PsiFix2ClFix(r_fmt))
 
+@_instrumented
 def psi_fix_in_range(a, a_fmt : psi_fix_fmt_t,
                      r_fmt : psi_fix_fmt_t,
                      rnd: psi_fix_rnd_t = psi_fix_rnd_t.trunc):
-    return cl_fix_in_range(a, PsiFix2ClFix(a_fmt), PsiFix2ClFix(r_fmt), PsiFix2ClFix(rnd))
+    return _backend.InRange(a, a_fmt, r_fmt, rnd)
 
 ########################################################################################################################
 # Python only (helpers)
 ########################################################################################################################
+class psi_fix_compact(np.lib.mixins.NDArrayOperatorsMixin):
+    """
+    Fixed-point array stored in a narrow data type: integer codes (int8/16/32 or uint8/16/32 for formats up to 32 bits)
+    or float32 (formats up to 24 bits, where float32 is exact). The values behave like a float64 array: NumPy functions,
+    operators and the psi_fix_pkg functions promote them to float64 when they are used in calculations.
+
+    Usage example:
+    capture = psi_fix_compact(data, psi_fix_fmt_t(1, 0, 15))   # 2 bytes per sample instead of 8
+    out = model.Process(capture)
+    """
+
+    def __init__(self, values, fmt : psi_fix_fmt_t, useFloat32 : bool = False):
+        """
+        Constructor
+        :param values: Values (must be representable by fmt)
+        :param fmt: Fixed-point format of the values
+        :param useFloat32: False (default) = store integer codes, True = store float32 values
+        """
+        dtype = self.CodeType(fmt, useFloat32)
+        if dtype is None:
+            raise ValueError("psi_fix_compact: Format {} is too wide for {} storage".format(
+                             fmt, "float32" if useFloat32 else "integer"))
+        values = np.asarray(values, dtype=np.float64)
+        codes = self._Encode(values, fmt, dtype)
+        if not np.array_equal(self._Decode(codes, fmt), values):
+            raise ValueError("psi_fix_compact: Values are not representable by format {}".format(fmt))
+        self.fmt = fmt
+        self.codes = codes
+
+    @staticmethod
+    def CodeType(fmt : psi_fix_fmt_t, useFloat32 : bool = False):
+        """
+        Get the data type used to store a format
+        :param fmt: Fixed-point format
+        :param useFloat32: False = integer codes, True = float32 values
+        :return: Numpy data type or None if the format is too wide
+        """
+        width = fmt.s + fmt.i + fmt.f
+        if useFloat32:
+            return np.dtype(np.float32) if width <= 24 else None
+        for bits in (8, 16, 32):
+            if width <= bits:
+                return np.dtype("{}int{}".format("" if fmt.s else "u", bits))
+        return None
+
+    def ToReal(self) -> np.ndarray:
+        """
+        Get the values as float64 array
+        :return: Values
+        """
+        return self._Decode(self.codes, self.fmt)
+
+    @property
+    def shape(self):
+        return self.codes.shape
+
+    @property
+    def ndim(self):
+        return self.codes.ndim
+
+    @property
+    def size(self):
+        return self.codes.size
+
+    @property
+    def dtype(self):
+        # Values behave like float64
+        return np.dtype(np.float64)
+
+    @property
+    def nbytes(self):
+        return self.codes.nbytes
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, idx):
+        codes = self.codes[idx]
+        if np.ndim(codes) == 0:
+            return float(self._Decode(codes, self.fmt))
+        return self._FromCodes(codes, self.fmt)
+
+    def __setitem__(self, idx, values):
+        values = np.asarray(values, dtype=np.float64)
+        codes = self._Encode(values, self.fmt, self.codes.dtype)
+        if not np.array_equal(self._Decode(codes, self.fmt), values):
+            raise ValueError("psi_fix_compact: Values are not representable by format {}".format(self.fmt))
+        self.codes[idx] = codes
+
+    def __repr__(self):
+        return "psi_fix_compact({}, {})".format(self.ToReal(), self.fmt)
+
+    def reshape(self, *shape):
+        return self._FromCodes(self.codes.reshape(*shape), self.fmt)
+
+    def ravel(self):
+        return self._FromCodes(self.codes.ravel(), self.fmt)
+
+    def copy(self):
+        return self._FromCodes(self.codes.copy(), self.fmt)
+
+    def astype(self, dtype):
+        return self.ToReal().astype(dtype)
+
+    def __array__(self, dtype=None):
+        values = self.ToReal()
+        return values if dtype is None else values.astype(dtype)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if any(isinstance(o, psi_fix_compact) for o in kwargs.get("out", ())):
+            return NotImplemented
+        return getattr(ufunc, method)(*_Promote(inputs), **kwargs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        return func(*_Promote(args), **_Promote(kwargs))
+
+    @classmethod
+    def _FromCodes(cls, codes : np.ndarray, fmt : psi_fix_fmt_t):
+        obj = cls.__new__(cls)
+        obj.fmt = fmt
+        obj.codes = codes
+        return obj
+
+    @staticmethod
+    def _Encode(values : np.ndarray, fmt : psi_fix_fmt_t, dtype) -> np.ndarray:
+        if dtype == np.float32:
+            return values.astype(np.float32)
+        return np.rint(values * 2.0**fmt.f).astype(dtype)
+
+    @staticmethod
+    def _Decode(codes : np.ndarray, fmt : psi_fix_fmt_t) -> np.ndarray:
+        if codes.dtype == np.float32:
+            return codes.astype(np.float64)
+        return codes * 2.0**-fmt.f
+
+def _Promote(value):
+    # Replace psi_fix_compact objects (also in lists/tuples/dicts) by float64 arrays
+    if isinstance(value, psi_fix_compact):
+        return value.ToReal()
+    if type(value) in (tuple, list):
+        return type(value)(_Promote(v) for v in value)
+    if type(value) is dict:
+        return {k : _Promote(v) for k, v in value.items()}
+    return value
+
+class psi_fix_workspace:
+    """
+    Arena of intermediate buffers that are reused across calls (e.g. by models processing equally sized blocks). Use
+    the buffers as out parameter of the psi_fix_pkg functions to avoid allocations. Buffers are only valid until the
+    next call requesting the same name, so they must not be returned to the caller.
+
+    Usage example (in a model):
+    self._ws = psi_fix_workspace()
+    ...
+    diff = psi_fix_sub(a, aFmt, b, bFmt, rFmt, out=self._ws.Get("diff", a.shape))
+    """
+
+    def __init__(self, enabled : bool = True):
+        """
+        Constructor
+        :param enabled: False = Get() always allocates a new buffer (buffers are not kept between calls)
+        """
+        self.enabled = enabled
+        self._buffers = {}
+
+    def Get(self, name : str, shape, dtype = np.float64) -> np.ndarray:
+        """
+        Get a buffer (content is undefined)
+        :param name: Name of the buffer
+        :param shape: Shape of the buffer
+        :param dtype: Data type of the buffer
+        :return: Buffer (reused if the buffer was requested with the same name, shape and type before)
+        """
+        shape = (int(shape),) if np.ndim(shape) == 0 else tuple(int(n) for n in shape)
+        buf = self._buffers.get(name, None)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype)
+            if self.enabled:
+                self._buffers[name] = buf
+        return buf
+
+    def Nbytes(self) -> int:
+        """
+        Get the memory held by the workspace
+        :return: Number of bytes
+        """
+        return sum(b.nbytes for b in self._buffers.values())
+
+    def Clear(self) -> None:
+        """
+        Release all buffers
+        """
+        self._buffers = {}
+
 
 def psi_fix_write_formats(fmts, names, filename):
     # Note: Do not convert to FixFormat. Rely on psi_fix_fmt_t.__str__ to format the string correctly.
@@ -202,3 +1074,81 @@ def psi_fix_write_formats(fmts, names, filename):
 def psi_fix_to_hex(a, a_fmt : psi_fix_fmt_t):
     return "0x{:x}".format(psi_fix_get_bits_as_int(a, a_fmt))
 
+def psi_fix_write_if_changed(filename : str, content : str) -> bool:
+    """
+    Write a (generated) text file only if its content changes. The timestamp of unchanged files is kept, so no
+    recompilation of generated VHDL code is triggered.
+    :param filename: File to write
+    :param content: File content
+    :return: True if the file was written, False if it was unchanged
+    """
+    # The bytes compared are written (no newline translation of text mode, which would change the file on Windows)
+    data = content.encode()
+    newHash = hashlib.sha256(data).digest()
+    if os.path.isfile(filename):
+        with open(filename, "rb") as f:
+            if hashlib.sha256(f.read()).digest() == newHash:
+                return False
+    with open(filename, "wb") as f:
+        f.write(data)
+    return True
+
+def psi_fix_cplx_is_packed(a) -> bool:
+    """
+    Check if complex data is passed as packed integer buffer (interleaved I/Q bits) or as complex array
+    :param a: Complex data
+    :return: True for packed integer buffers, False for complex arrays
+    """
+    a = np.asarray(a)
+    if np.issubdtype(a.dtype, np.integer):
+        return True
+    if np.iscomplexobj(a):
+        return False
+    raise TypeError("psi_fix_cplx_is_packed: complex data must be a complex array or a packed integer I/Q buffer, got {}".format(a.dtype))
+
+def psi_fix_cplx_unpack(a, a_fmt : psi_fix_fmt_t,
+                        err_sat : bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert complex data to fixed-point I and Q arrays. Quantization and range check are executed only once over the
+    whole data.
+    :param a: Complex array or packed integer buffer where the last axis contains interleaved I/Q values as returned
+              by psi_fix_get_bits_as_int (i.e. [i0, q0, i1, q1, ...])
+    :param a_fmt: Fixed-point format of I and Q
+    :param err_sat: True = raise an error for values that cannot be represented by a_fmt, False = saturate silently
+    :return: Tuple (I, Q) of fixed-point arrays
+    """
+    a = np.atleast_1d(a)
+    if psi_fix_cplx_is_packed(a):
+        if a.shape[-1] % 2 != 0:
+            raise ValueError("psi_fix_cplx_unpack: packed I/Q buffer must contain an even number of values")
+        minInt = psi_fix_get_bits_as_int(psi_fix_lower_bound(a_fmt), a_fmt)
+        maxInt = psi_fix_get_bits_as_int(psi_fix_upper_bound(a_fmt), a_fmt)
+        if a.size > 0 and (np.min(a) < minInt or np.max(a) > maxInt):
+            if err_sat:
+                raise ValueError("psi_fix_cplx_unpack: Packed I/Q buffer contains values that could not be represented by format {}".format(a_fmt))
+            a = np.clip(a, minInt, maxInt)
+        buf = psi_fix_from_bits_as_int(a, a_fmt)
+    else:
+        # Real view (interleaved I/Q) of the complex data, no copy is required for contiguous complex128 input
+        buf = psi_fix_from_real(np.ascontiguousarray(a, dtype=np.complex128).view(np.float64), a_fmt, err_sat)
+    return buf[..., 0::2], buf[..., 1::2]
+
+def psi_fix_cplx_pack(i, q, r_fmt : psi_fix_fmt_t, packed : bool):
+    """
+    Combine fixed-point I and Q arrays to complex data (inverse of psi_fix_cplx_unpack)
+    :param i: I values
+    :param q: Q values
+    :param r_fmt: Fixed-point format of I and Q
+    :param packed: True = return packed integer buffer (interleaved I/Q bits), False = return complex array
+    :return: Complex data
+    """
+    i, q = np.broadcast_arrays(np.atleast_1d(i), np.atleast_1d(q))
+    if packed:
+        buf = np.empty(i.shape[:-1] + (2*i.shape[-1],))
+        buf[..., 0::2] = i
+        buf[..., 1::2] = q
+        return np.asarray(psi_fix_get_bits_as_int(buf, r_fmt), dtype=np.int64)
+    out = np.empty(i.shape, dtype=np.complex128)
+    out.real = i
+    out.imag = q
+    return out
@@ -11,6 +11,7 @@ import numpy as np
 from typing import Union, Iterable
 from enum import Enum
 import os
+from psi_fix_pkg import *
 
 ########################################################################################################################
 # Types
@@ -18,6 +19,7 @@ import os
 class VhdlType(Enum):
     INTEGER = 0
     REAL = 1
+    STD_LOGIC_VECTOR = 2
 
 ########################################################################################################################
 # Main Class
@@ -29,13 +31,20 @@ class psi_fix_pkg_writer:
     Currently only the following types are supported:
     - Integer
     - Float (Real in VHDL)
+    - Fixed-point values (std_logic_vector in VHDL, written as hex literals if the width is a multiple of 4)
 
     Usage example:
     w = psi_fix_pkg_writer()
     w.AddConstant("AnyConstant_c", 3, VhdlType.INTEGER)
+    w.AddArray("AnyTable_c", [0.25, -0.5], VhdlType.STD_LOGIC_VECTOR, psi_fix_fmt_t(1, 0, 15))
     w.WritePkg("my_pkg", "../hdl")
     """
 
+    ####################################################################################################################
+    # Constants
+    ####################################################################################################################
+    ARRAY_CHUNK_SIZE = 65536    # Array elements formatted at once when writing the package
+
     ####################################################################################################################
     # Constructor
     ####################################################################################################################
@@ -51,35 +60,37 @@ class psi_fix_pkg_writer:
     ####################################################################################################################
     # Public Functions
     ####################################################################################################################
-    def AddConstant(self, name : str, value : Union[float, int], type : VhdlType) -> None:
+    def AddConstant(self, name : str, value : Union[float, int], type : VhdlType, fmt : psi_fix_fmt_t = None) -> None:
         """
         Add a constant to the package
         :param name: Name of the VHDL constant
         :param value: Value of the constant
         :param type: VHDL Type of the constant
+        :param fmt: Fixed-point format of the value (only required for VhdlType.STD_LOGIC_VECTOR)
         """
         self._checkName(name)
-        if type is VhdlType.INTEGER:
-            self._checkInt(value)
-        self._constants[name] = (type, value)
+        self._checkValue(value, type, fmt)
+        self._constants[name] = (type, value, fmt)
 
-    def AddArray(self, name : str, value : Union[Iterable, np.ndarray], type : VhdlType) -> None:
+    def AddArray(self, name : str, value : Union[Iterable, np.ndarray], type : VhdlType, fmt : psi_fix_fmt_t = None) -> None:
         """
         Add an array constant to the package
         :param name: Name of the VHDL constant
         :param value: Value of the constant (pass an array, even for size 1 arrays)
         :param type: VHDL Type of the constant
+        :param fmt: Fixed-point format of the values (only required for VhdlType.STD_LOGIC_VECTOR)
         """
         self._checkName(name)
         if not isinstance(value, np.ndarray):
             value = np.array(value)
-        if type is VhdlType.INTEGER:
-            self._checkInt(value)
-        self._arrays[name] = (type, value)
+        if value.size == 0:
+            raise ValueError("Array {} must contain at least one value".format(name))
+        self._checkValue(value, type, fmt)
+        self._arrays[name] = (type, value.reshape(-1), fmt)
 
     def WritePkg(self, pkg_name : str, directory : str, psi_common_lib : str = "work") -> None:
         """
-        Generate the VHDL package
+        Generate the VHDL package. Declarations are streamed to the file, so also huge arrays can be written.
         :param pkg_name: VHDL package name (used as file name too)
         :param directory: Target directory
         :param psi_common_lib: Name of the VHDL library psi_common_array_pkg is compiled into. This argumet is optional
@@ -96,48 +107,80 @@ class psi_fix_pkg_writer:
         #Replace Package name
         content = content.replace("<PACKAGE_NAME>", pkg_name)
         content = content.replace("<PSI_COMMON_LIB>", psi_common_lib)
+        contentBefore, contentAfter = content.split("<PACKAGE_DECLARATION>")
 
-        pkgDecl = ""
-        #Write constants
-        for name, (vhType, value) in self._constants.items():
-            if vhType == VhdlType.INTEGER:
-                t = "integer"
-            elif vhType == VhdlType.REAL:
-                t = "real"
-                value = self._convReal(value)
-            else:
-                raise ValueError("Illegel type for Constant {}".format(name))
-            pkgDecl += "\n\tconstant {} : {} := {};\n".format(name, t, value)
-
-        #Write arrays
-        for name, (vhType, value) in self._arrays.items():
-            if vhType == VhdlType.INTEGER:
-                t = "t_ainteger(0 to {})".format(len(value)-1)
-            elif vhType == VhdlType.REAL:
-                t = "t_areal(0 to {})".format(len(value)-1)
-                value = self._convReal(value)
-            else:
-                raise ValueError("Illegel type for Array {}".format(name))
-            pkgDecl += "\n\tconstant {} : {} := (\n".format(name, t)
-            for v in value[:-1]:
-                pkgDecl += "\t\t{},\n".format(v)
-            pkgDecl += "\t\t{});\n".format(value[-1])
-        content = content.replace("<PACKAGE_DECLARATION>", pkgDecl)
-
-        #Write File
         with open(directory + "/" + pkg_name + ".vhd", "w+") as f:
-            f.write(content)
+            f.write(contentBefore)
+
+            #Write constants
+            for name, (vhType, value, fmt) in self._constants.items():
+                if vhType == VhdlType.INTEGER:
+                    t = "integer"
+                    value = int(value)
+                elif vhType == VhdlType.REAL:
+                    t = "real"
+                    value = self._convReal(value)
+                elif vhType == VhdlType.STD_LOGIC_VECTOR:
+                    t = "std_logic_vector({} downto 0)".format(psi_fix_size(fmt)-1)
+                    value = self._formatValues(np.array([value]), vhType, fmt)
+                else:
+                    raise ValueError("Illegel type for Constant {}".format(name))
+                f.write("\n\tconstant {} : {} := {};\n".format(name, t, value))
+
+            #Write arrays
+            for name, (vhType, value, fmt) in self._arrays.items():
+                if vhType == VhdlType.INTEGER:
+                    t = "t_ainteger(0 to {})".format(len(value)-1)
+                elif vhType == VhdlType.REAL:
+                    t = "t_areal(0 to {})".format(len(value)-1)
+                elif vhType == VhdlType.STD_LOGIC_VECTOR:
+                    t = "{}_t".format(name)
+                    f.write("\n\ttype {} is array (0 to {}) of std_logic_vector({} downto 0);\n".format(t, len(value)-1, psi_fix_size(fmt)-1))
+                else:
+                    raise ValueError("Illegel type for Array {}".format(name))
+                f.write("\n\tconstant {} : {} := (\n".format(name, t))
+                for start in range(0, len(value), self.ARRAY_CHUNK_SIZE):
+                    stop = start + self.ARRAY_CHUNK_SIZE
+                    f.write("\t\t" + self._formatValues(value[start:stop], vhType, fmt))
+                    f.write(",\n" if stop < len(value) else ");\n")
+
+            f.write(contentAfter)
 
     ####################################################################################################################
     # Private Functions
     ####################################################################################################################
+    def _checkValue(self, value, type : VhdlType, fmt : psi_fix_fmt_t):
+        if type is VhdlType.INTEGER:
+            self._checkInt(value)
+        elif type is VhdlType.STD_LOGIC_VECTOR:
+            if fmt is None:
+                raise ValueError("For VhdlType.STD_LOGIC_VECTOR the fixed-point format must be passed")
+            value = np.asarray(value, dtype=float)
+            if np.any(psi_fix_from_real(value, fmt, err_sat=True) != value):
+                raise ValueError("For VhdlType.STD_LOGIC_VECTOR the values must be representable in format {}".format(fmt))
+
     def _checkInt(self, value):
-        if isinstance(value, Iterable):
-            for v in value:
-                self._checkInt(v)
+        value = np.asarray(value)
+        notInt = np.mod(value, 1) != 0
+        if np.any(notInt):
+            raise ValueError("For VhdlType.INTEGER an integer value must be passed, got {}".format(value[notInt].flat[0]))
+
+    def _formatValues(self, value : np.ndarray, type : VhdlType, fmt : psi_fix_fmt_t) -> str:
+        # All values are formatted with one formatting operation
+        if type is VhdlType.INTEGER:
+            elementFmt, value = "%d", value.astype(np.int64).tolist()
+        elif type is VhdlType.REAL:
+            elementFmt, value = "%r", self._convReal(value).tolist()
         else:
-            if np.mod(value, 1) != 0:
-                raise ValueError("For VhdlType.INTEGER an integer value must be passed, got {}".format(value))
+            width = int(psi_fix_size(fmt))
+            bits = np.asarray(psi_fix_get_bits_as_int(value, fmt), dtype=np.int64) & ((1 << width)-1)  #two's complement
+            if width % 4 == 0:
+                elementFmt, value = "x\"%0{}x\"".format(width // 4), bits.tolist()
+            else:
+                #Bit-string literal, all bits are extracted at once
+                chars = ((bits[:, np.newaxis] >> np.arange(width-1, -1, -1)) & 1).astype(np.uint8) + ord("0")
+                elementFmt, value = "\"%s\"", chars.view("S{}".format(width)).reshape(-1).astype(str).tolist()
+        return ",\n\t\t".join([elementFmt] * len(value)) % tuple(value)
 
     def _convReal(self, value) -> float:
         if isinstance(value, Iterable):
@@ -0,0 +1,179 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+
+########################################################################################################################
+# Imports
+########################################################################################################################
+import numpy as np
+import fnmatch
+from typing import Iterable, List, Tuple
+
+########################################################################################################################
+# Signal Probes
+########################################################################################################################
+class psi_fix_probe:
+    """
+    Probe for named internal signals (nodes) of models.
+
+    A probe object is passed as trace argument to the model constructor. The model calls it with (name, values) for
+    each of its internal nodes (e.g. CIC integrator outputs, CORDIC iteration states, IIR feedback). For nodes a probe
+    is attached to, streaming statistics (min/max/mean/RMS and optionally a histogram) and optionally a decimated
+    capture are collected. Memory usage does not depend on the length of the data processed, so long records can be
+    processed in multiple calls.
+
+    Usage example:
+    probe = psi_fix_probe()
+    probe.Attach("int*", histEdges=np.linspace(-1, 1, 65))
+    probe.Attach("int3", decimation=100, maxSamples=10000)
+    cic = psi_fix_cic_dec(..., trace=probe)
+    cic.Process(data)
+    print(probe.Report())
+    """
+
+    ####################################################################################################################
+    # Constructor
+    ####################################################################################################################
+    def __init__(self):
+        self._configs = []  # (pattern, histEdges, decimation, maxSamples), first match is used
+        self._nodes = {}    # name -> _ProbeNode (None = node not probed)
+
+    ####################################################################################################################
+    # Public Methods
+    ####################################################################################################################
+    def Attach(self, pattern : str = "*",
+               histEdges : Iterable[float] = None,
+               decimation : int = None,
+               maxSamples : int = 100000) -> None:
+        """
+        Attach the probe to nodes. Nodes matching multiple patterns use the configuration attached first.
+        :param pattern: Node name or shell-style pattern (e.g. "int*", default "*" = all nodes)
+        :param histEdges: Bin edges of the histogram (None = no histogram). Values outside are counted in the first
+                          or last bin.
+        :param decimation: Capture every N-th sample along the last axis (None = no capture)
+        :param maxSamples: Maximum number of samples captured (capture stops when reached)
+        """
+        if decimation is not None and decimation < 1:
+            raise ValueError("psi_fix_probe: decimation must be >= 1")
+        self._configs.append((pattern, None if histEdges is None else np.asarray(histEdges, dtype=np.float64),
+                              decimation, maxSamples))
+        # Nodes seen before are reassigned on their next call
+        self._nodes = {k : v for k, v in self._nodes.items() if v is not None}
+
+    def __call__(self, name : str, values : np.ndarray) -> None:
+        # Trace callback for models
+        if name not in self._nodes:
+            cfg = next((c for c in self._configs if fnmatch.fnmatchcase(name, c[0])), None)
+            self._nodes[name] = None if cfg is None else _ProbeNode(*cfg[1:])
+        node = self._nodes[name]
+        if node is not None:
+            node.Add(np.asarray(values, dtype=np.float64))
+
+    def Nodes(self) -> List[str]:
+        """
+        Get the names of all nodes the model(s) reported so far (probed or not)
+        :return: Sorted list of node names
+        """
+        return sorted(self._nodes)
+
+    def Stats(self, name : str) -> dict:
+        """
+        Get the statistics of a node
+        :param name: Node name
+        :return: Dictionary with the keys count, min, max, mean and rms
+        """
+        return self._Node(name).Stats()
+
+    def Histogram(self, name : str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the histogram of a node
+        :param name: Node name
+        :return: Tuple (counts, edges)
+        """
+        node = self._Node(name)
+        if node.histEdges is None:
+            raise ValueError("psi_fix_probe: No histogram attached to node {}".format(name))
+        return node.histCounts.copy(), node.histEdges.copy()
+
+    def Capture(self, name : str) -> np.ndarray:
+        """
+        Get the decimated capture of a node
+        :param name: Node name
+        :return: Captured samples (concatenated along the last axis)
+        """
+        node = self._Node(name)
+        if node.decimation is None:
+            raise ValueError("psi_fix_probe: No capture attached to node {}".format(name))
+        if len(node.capture) == 0:
+            return np.zeros(0)
+        return np.concatenate(node.capture, axis=-1)
+
+    def Reset(self) -> None:
+        """
+        Clear all statistics and captures (attached configurations are kept)
+        """
+        self._nodes = {}
+
+    def Report(self) -> str:
+        """
+        Get a table with the statistics of all probed nodes
+        :return: Report text
+        """
+        lines = ["{:<20} {:>12} {:>14} {:>14} {:>14} {:>14}".format("node", "count", "min", "max", "mean", "rms")]
+        for name in self.Nodes():
+            if self._nodes[name] is not None:
+                s = self._nodes[name].Stats()
+                lines.append("{:<20} {:>12} {:>14.6g} {:>14.6g} {:>14.6g} {:>14.6g}".format(
+                             name, s["count"], s["min"], s["max"], s["mean"], s["rms"]))
+        return "\n".join(lines)
+
+    ####################################################################################################################
+    # Private Methods (do not call!)
+    ####################################################################################################################
+    def _Node(self, name : str):
+        if self._nodes.get(name, None) is None:
+            raise KeyError("psi_fix_probe: Node {} was not probed".format(name))
+        return self._nodes[name]
+
+class _ProbeNode:
+    # Streaming statistics and capture of one node
+
+    def __init__(self, histEdges, decimation, maxSamples):
+        self.count = 0
+        self.sum = 0.0
+        self.sumSq = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.histEdges = histEdges
+        self.histCounts = None if histEdges is None else np.zeros(histEdges.size - 1, dtype=np.int64)
+        self.decimation = decimation
+        self.maxSamples = maxSamples
+        self.capture = []
+        self.captured = 0
+        self.samples = 0    # Samples seen along the last axis (for decimation phase)
+
+    def Add(self, values : np.ndarray):
+        values = np.atleast_1d(values)
+        if values.size == 0:
+            return
+        self.count += values.size
+        self.sum += float(np.sum(values))
+        self.sumSq += float(np.dot(values.reshape(-1), values.reshape(-1)))
+        self.min = min(self.min, float(np.min(values)))
+        self.max = max(self.max, float(np.max(values)))
+        if self.histEdges is not None:
+            clipped = np.clip(values.reshape(-1), self.histEdges[0], self.histEdges[-1])
+            self.histCounts += np.histogram(clipped, self.histEdges)[0]
+        if self.decimation is not None:
+            start = (-self.samples) % self.decimation
+            decimated = values[..., start::self.decimation][..., :self.maxSamples - self.captured]
+            if decimated.shape[-1] > 0:
+                self.capture.append(decimated.copy())
+                self.captured += decimated.shape[-1]
+        self.samples += values.shape[-1]
+
+    def Stats(self) -> dict:
+        n = max(self.count, 1)
+        return {"count" : self.count, "min" : self.min, "max" : self.max,
+                "mean" : self.sum / n, "rms" : np.sqrt(self.sumSq / n)}
@@ -0,0 +1,214 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+
+########################################################################################################################
+# Imports
+########################################################################################################################
+import numpy as np
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+from typing import Callable, Tuple, Union
+
+########################################################################################################################
+# Shared Memory Array
+########################################################################################################################
+class psi_fix_shared_array:
+    """
+    Numpy array stored in shared memory (multiprocessing.shared_memory).
+
+    Objects can be passed to worker processes, the worker attaches to the same memory (no data is copied). The object
+    that created the memory owns it and releases it on Close() (or when used as context manager).
+
+    Usage example:
+    with psi_fix_shared_array((channels, samples)) as inp:
+        inp.array[...] = ...
+        out = psi_fix_channel_shard(model).Process(inp)
+    """
+
+    ####################################################################################################################
+    # Constructor
+    ####################################################################################################################
+    def __init__(self, shape : Tuple[int, ...], dtype = np.float64):
+        """
+        Constructor, allocates shared memory
+        :param shape: Shape of the array
+        :param dtype: Data type of the array
+        """
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        size = int(np.prod(self.shape, dtype=np.int64)) * self.dtype.itemsize
+        self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self._owner = True
+        self.array = np.ndarray(self.shape, self.dtype, buffer=self._shm.buf)
+
+    @classmethod
+    def FromArray(cls, data : np.ndarray) -> "psi_fix_shared_array":
+        """
+        Create a shared memory array and copy data into it
+        :param data: Data to copy
+        :return: Shared memory array
+        """
+        data = np.asarray(data)
+        obj = cls(data.shape, data.dtype)
+        obj.array[...] = data
+        return obj
+
+    ####################################################################################################################
+    # Public Methods
+    ####################################################################################################################
+    def Close(self) -> None:
+        """
+        Release the array (the shared memory is freed if this object created it)
+        """
+        if self._shm is None:
+            return
+        self.array = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, tb):
+        self.Close()
+
+    def __reduce__(self):
+        # Pickled as reference to the shared memory, the receiving process attaches to it
+        return (_Attach, (self._shm.name, self.shape, self.dtype.str))
+
+def _Attach(name : str, shape : tuple, dtype : str) -> psi_fix_shared_array:
+    obj = psi_fix_shared_array.__new__(psi_fix_shared_array)
+    obj.shape = shape
+    obj.dtype = np.dtype(dtype)
+    obj._shm = shared_memory.SharedMemory(name=name)
+    obj._owner = False
+    obj.array = np.ndarray(shape, obj.dtype, buffer=obj._shm.buf)
+    return obj
+
+########################################################################################################################
+# Channel Sharding
+########################################################################################################################
+class psi_fix_channel_shard:
+    """
+    Runs a model on independent channels of a (channels, samples) array, distributed over worker processes.
+
+    The input is held in shared memory and every worker processes a contiguous range of channels. Results are written
+    directly into shared output arrays, so no data is pickled between the processes. This works with any model: the
+    processing method is either called once per channel (perChannel=True) or once per channel range for models that
+    support multi-channel data (perChannel=False, e.g. psi_fix_mov_avg).
+
+    The first channel is processed in the calling process to determine the output shape(s), all models and methods
+    returning an array or a tuple of arrays (e.g. (I, Q)) are supported.
+
+    Usage example:
+    cic = psi_fix_cic_dec(3, 10, 1, inFmt, outFmt, True)
+    out = psi_fix_channel_shard(cic).Process(data)          # data.shape = (channels, samples)
+    fir = psi_fix_fir(inFmt, outFmt, coefFmt)
+    out = psi_fix_channel_shard(fir, "Filter").Process(data, decimRate, coefs)
+    """
+
+    ####################################################################################################################
+    # Constructor
+    ####################################################################################################################
+    def __init__(self, model,
+                 method : str = "Process",
+                 perChannel : bool = True,
+                 processes : int = None):
+        """
+        Constructor
+        :param model: Model object (a copy is used by each worker process)
+        :param method: Name of the model method to call (e.g. "Process" or "Filter")
+        :param perChannel: True (default) = the method is called with one channel (1-D array) at a time,
+                           False = the method is called with a range of channels (2-D array)
+        :param processes: Number of worker processes (None = number of CPUs, 1 = run in the calling process)
+        """
+        self.model = model
+        self.method = method
+        self.perChannel = perChannel
+        self.processes = os.cpu_count() if processes is None else processes
+
+    ####################################################################################################################
+    # Public Methods
+    ####################################################################################################################
+    def Process(self, data : Union[np.ndarray, psi_fix_shared_array], *args,
+                out : Union[psi_fix_shared_array, Tuple[psi_fix_shared_array, ...]] = None):
+        """
+        Process all channels
+        :param data: Input data of shape (channels, samples). Pass a psi_fix_shared_array to avoid copying the input
+                     into shared memory.
+        :param args: Additional arguments passed to the model method (same for all channels)
+        :param out: Optional shared memory array(s) the result is written to (shape (channels, ...) per output). If
+                    None, the result is returned as normal numpy array(s).
+        :return: Output data (array or tuple of arrays with the channel as first axis), out if passed
+        """
+        shared = [] # Shared memory arrays allocated here
+        try:
+            if isinstance(data, psi_fix_shared_array):
+                inp = data
+            else:
+                inp = psi_fix_shared_array.FromArray(data)
+                shared.append(inp)
+            channels = inp.shape[0]
+            if channels == 0:
+                raise ValueError("psi_fix_channel_shard: No channels passed")
+
+            #Process first channel locally to find the output shapes
+            first = _RunChannels(self.model, self.method, self.perChannel, inp.array, 0, 1, args)
+            isTuple = isinstance(first, tuple)
+            first = first if isTuple else (first,)
+            if out is None:
+                outputs = tuple(psi_fix_shared_array((channels,) + f.shape[1:], f.dtype) for f in first)
+                shared += outputs
+            else:
+                outputs = out if isinstance(out, tuple) else (out,)
+                if len(outputs) != len(first) or \
+                   any(o.shape != (channels,) + f.shape[1:] for o, f in zip(outputs, first)):
+                    raise ValueError("psi_fix_channel_shard: out does not match the model output, expected shapes {}"
+                                     .format([(channels,) + f.shape[1:] for f in first]))
+            for o, f in zip(outputs, first):
+                o.array[0:1] = f
+
+            #Distribute remaining channels
+            bounds = np.linspace(1, channels, min(self.processes, channels-1) + 1).astype(int)
+            tasks = [(self.model, self.method, self.perChannel, inp, outputs, start, stop, args)
+                     for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+            if self.processes <= 1 or len(tasks) <= 1:
+                for t in tasks:
+                    _ShardTask(t)
+            else:
+                with multiprocessing.Pool(len(tasks)) as pool:
+                    pool.map(_ShardTask, tasks, chunksize=1)
+
+            if out is not None:
+                return out
+            result = tuple(o.array.copy() for o in outputs)
+            return result if isTuple else result[0]
+        finally:
+            for s in shared:
+                s.Close()
+
+########################################################################################################################
+# Private Helpers (do not call!)
+########################################################################################################################
+def _RunChannels(model, method : str, perChannel : bool, data : np.ndarray, start : int, stop : int, args : tuple):
+    # Process channels [start, stop) and return the output(s) with the channel as first axis
+    func = getattr(model, method)
+    if not perChannel:
+        res = func(data[start:stop], *args)
+        return tuple(np.asarray(r) for r in res) if isinstance(res, tuple) else np.asarray(res)
+    results = [func(data[ch], *args) for ch in range(start, stop)]
+    if isinstance(results[0], tuple):
+        return tuple(np.stack([np.asarray(r[i]) for r in results]) for i in range(len(results[0])))
+    return np.stack([np.asarray(r) for r in results])
+
+def _ShardTask(task):
+    # Executed in the worker process
+    model, method, perChannel, inp, outputs, start, stop, args = task
+    res = _RunChannels(model, method, perChannel, inp.array, start, stop, args)
+    for o, r in zip(outputs, res if isinstance(res, tuple) else (res,)):
+        o.array[start:stop] = r
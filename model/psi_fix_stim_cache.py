@@ -0,0 +1,156 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+
+########################################################################################################################
+# Imports
+########################################################################################################################
+from psi_fix_pkg import *
+import numpy as np
+import hashlib
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+from enum import Enum
+from typing import Iterable
+
+########################################################################################################################
+# Stimuli Cache
+########################################################################################################################
+class psi_fix_stim_cache:
+    """
+    Cache for stimuli/response files generated by testbench scripts (preScripts).
+
+    The files are stored in a local cache directory under a key that is calculated from the content of the generating
+    script, the source files of the models used (including psi_fix_pkg and en_cl_fix_pkg) and the parameters passed.
+    If nothing changed, the files are copied from the cache instead of being recalculated.
+
+    The cache directory is taken from the environment variable PSI_FIX_CACHE_DIR (default: ~/.cache/psi_fix). Setting
+    the variable to an empty string disables the cache.
+
+    Usage example (preScript):
+    cache = psi_fix_stim_cache([STIM_DIR + "/input.txt", STIM_DIR + "/output.txt"],
+                               params={"samples" : SAMPLES, "inFmt" : inFmt}, models=["psi_fix_mov_avg"])
+    if cache.Restore():
+        sys.exit(0)
+    ... calculate and write files ...
+    cache.Store()
+    """
+
+    ####################################################################################################################
+    # Constants
+    ####################################################################################################################
+    CACHE_DIR_ENV = "PSI_FIX_CACHE_DIR"
+    DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "psi_fix")
+    MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+
+    ####################################################################################################################
+    # Constructor
+    ####################################################################################################################
+    def __init__(self, outputs : Iterable[str],
+                 params = None,
+                 models : Iterable[str] = None,
+                 script : str = None,
+                 cacheDir : str = None):
+        """
+        Constructor
+        :param outputs: Files generated by the script
+        :param params: Parameters the files depend on (besides the sources), e.g. a list or dict. Values can be numbers,
+                       strings, enums, psi_fix_fmt_t, numpy arrays or lists/tuples/dicts of these.
+        :param models: Names of the model modules used (e.g. ["psi_fix_mov_avg"]). psi_fix_pkg and en_cl_fix_pkg are
+                       always included. If None, all modules loaded from the model directory are used.
+        :param script: Generating script (default: the script currently executed)
+        :param cacheDir: Cache directory (default: see class description, empty string = cache disabled)
+        """
+        self.outputs = [os.path.abspath(o) for o in outputs]
+        self.cacheDir = os.environ.get(self.CACHE_DIR_ENV, self.DEFAULT_CACHE_DIR) if cacheDir is None else cacheDir
+        if script is None:
+            script = getattr(sys.modules["__main__"], "__file__", None)
+        self.key = self._CalcKey(script, models, params)
+
+    ####################################################################################################################
+    # Public Methods
+    ####################################################################################################################
+    def Enabled(self) -> bool:
+        """
+        Check if caching is enabled
+        :return: True if a cache directory is configured
+        """
+        return self.cacheDir != ""
+
+    def Restore(self) -> bool:
+        """
+        Copy the output files from the cache (if they are available)
+        :return: True if the files were restored, False if they must be generated
+        """
+        if not self.Enabled():
+            return False
+        entry = self._EntryFiles(os.path.join(self.cacheDir, self.key))
+        if not all(os.path.isfile(f) for f in entry):
+            return False
+        for src, dst in zip(entry, self.outputs):
+            shutil.copyfile(src, dst)
+        return True
+
+    def Store(self) -> None:
+        """
+        Copy the output files into the cache (call after the files were generated)
+        """
+        if not self.Enabled():
+            return
+        os.makedirs(self.cacheDir, exist_ok=True)
+        # Entries are written to a temporary directory first and renamed, so parallel runs never see partial entries
+        tmpDir = tempfile.mkdtemp(dir=self.cacheDir)
+        for src, dst in zip(self.outputs, self._EntryFiles(tmpDir)):
+            shutil.copyfile(src, dst)
+        try:
+            os.rename(tmpDir, os.path.join(self.cacheDir, self.key))
+        except OSError:
+            # Entry was stored by another process in the meantime
+            shutil.rmtree(tmpDir)
+
+    ####################################################################################################################
+    # Private Methods (do not call!)
+    ####################################################################################################################
+    def _EntryFiles(self, entryDir : str):
+        return [os.path.join(entryDir, "{}_{}".format(idx, os.path.basename(o))) for idx, o in enumerate(self.outputs)]
+
+    def _CalcKey(self, script : str, models : Iterable[str], params) -> str:
+        if models is None:
+            sources = [m.__file__ for m in list(sys.modules.values())
+                       if os.path.dirname(os.path.abspath(getattr(m, "__file__", None) or "")) == self.MODEL_DIR]
+        else:
+            sources = [os.path.join(self.MODEL_DIR, m + ".py") for m in models]
+        sources.append(os.path.join(self.MODEL_DIR, "psi_fix_pkg.py"))
+        clFix = importlib.util.find_spec("en_cl_fix_pkg")
+        if clFix is not None and clFix.origin is not None:
+            sources.append(clFix.origin)
+        if script is not None:
+            sources.append(script)
+        h = hashlib.sha256()
+        for src in sorted(set(os.path.abspath(s) for s in sources)):
+            with open(src, "rb") as f:
+                h.update(hashlib.sha256(f.read()).digest())
+        h.update(self._Serialize([os.path.basename(o) for o in self.outputs]))
+        h.update(self._Serialize(params))
+        h.update(np.__version__.encode())
+        return h.hexdigest()
+
+    @classmethod
+    def _Serialize(cls, value) -> bytes:
+        if isinstance(value, dict):
+            return b"{" + b",".join(cls._Serialize(k) + b":" + cls._Serialize(value[k])
+                                    for k in sorted(value, key=str)) + b"}"
+        if isinstance(value, (list, tuple)):
+            return b"[" + b",".join(cls._Serialize(v) for v in value) + b"]"
+        if isinstance(value, np.ndarray):
+            return "array({},{})".format(value.dtype.str, value.shape).encode() + \
+                   hashlib.sha256(np.ascontiguousarray(value).tobytes()).digest()
+        if isinstance(value, Enum):
+            return str(value).encode()
+        if isinstance(value, psi_fix_fmt_t):
+            return "psi_fix_fmt_t{}".format(value).encode()
+        return repr(value).encode()
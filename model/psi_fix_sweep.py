@@ -0,0 +1,183 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+
+########################################################################################################################
+# Imports
+########################################################################################################################
+import numpy as np
+import itertools
+import multiprocessing
+import time
+import traceback
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterable, List, NamedTuple, Union
+
+########################################################################################################################
+# Parameter Sweep
+########################################################################################################################
+class psi_fix_sweep_run(NamedTuple):
+    """
+    Result of one run of a parameter sweep
+    """
+    params : dict       # Constructor parameters of the run (without the constant ones)
+    output : Any        # Return value of the model method (None if the run failed)
+    seconds : float     # Execution time of the model method
+    error : str         # Traceback if the run failed, None otherwise
+
+class psi_fix_sweep:
+    """
+    Runs a model for many parameter sets, distributed over a pool of processes.
+
+    For each parameter set, a model object is constructed (constructor keyword arguments) and the processing method is
+    called with the inputs. Inputs are either a constant array (or tuple of arrays) used for all runs, or a function
+    generating the inputs from the parameters (executed in the worker process, so nothing is transferred). Constant
+    inputs and large outputs are transferred through shared memory instead of being pickled. Constant inputs are
+    read-only in the runs.
+
+    Functions passed (inputs, call) must be picklable, i.e. defined at module level (no lambdas).
+
+    Usage example:
+    def Chirp(params):
+        return psi_fix_from_real(sps.chirp(t, 0, TEND, FREQ_SAMPLE/params["ratio"]), inFmt, err_sat=False)
+    sweep = psi_fix_sweep(psi_fix_cic_dec, {"order" : [3, 4, 6], "ratio" : [5, 10, 5001]}, Chirp,
+                          constants={"diffDelay" : 2, "inFmt" : inFmt, "outFmt" : outFmt, "autoGainCorr" : True})
+    for run in sweep.Run():
+        print(run.params, run.seconds)
+    """
+
+    ####################################################################################################################
+    # Constants
+    ####################################################################################################################
+    SHARED_MIN_BYTES = 1 << 16  # Arrays smaller than this are pickled
+
+    ####################################################################################################################
+    # Constructor
+    ####################################################################################################################
+    def __init__(self, modelClass : type,
+                 grid : Union[dict, Iterable[dict]],
+                 inputs,
+                 constants : dict = None,
+                 method : str = "Process",
+                 call : Callable = None,
+                 processes : int = None):
+        """
+        Constructor
+        :param modelClass: Model class (e.g. psi_fix_cic_dec)
+        :param grid: Dictionary {parameter : list of values} (all combinations are run) or list of dictionaries
+                     (one run per dictionary)
+        :param inputs: Array or tuple of arrays passed to all runs, or function inputs(params) returning them
+        :param constants: Constructor parameters that are the same for all runs
+        :param method: Name of the model method called with the inputs (e.g. "Process" or "Filter")
+        :param call: Optional function call(model, params, *inputs) that is called instead of the method (e.g. if
+                     additional arguments are required)
+        :param processes: Number of worker processes (None = number of CPUs, 1 = run in the calling process)
+        """
+        self.modelClass = modelClass
+        if isinstance(grid, dict):
+            names = list(grid)
+            self.configs = [dict(zip(names, values)) for values in itertools.product(*[grid[n] for n in names])]
+        else:
+            self.configs = [dict(cfg) for cfg in grid]
+        self.inputs = inputs
+        self.constants = {} if constants is None else dict(constants)
+        self.method = method
+        self.call = call
+        self.processes = processes
+
+    ####################################################################################################################
+    # Public Methods
+    ####################################################################################################################
+    def Run(self) -> List[psi_fix_sweep_run]:
+        """
+        Execute all runs. Errors in individual runs do not abort the sweep, they are reported in the error field.
+        :return: List of results in the order of the parameter sets
+        """
+        shm = []
+        try:
+            inputs = self.inputs
+            if not callable(inputs):
+                inputs = _Pack(inputs if isinstance(inputs, tuple) else (inputs,), shm, self.SHARED_MIN_BYTES)
+            tasks = [(self.modelClass, self.constants, cfg, inputs, self.method, self.call, self.SHARED_MIN_BYTES)
+                     for cfg in self.configs]
+            if self.processes == 1:
+                results = [_RunTask(t) for t in tasks]
+            else:
+                with multiprocessing.Pool(self.processes) as pool:
+                    results = pool.map(_RunTask, tasks, chunksize=1)
+            return [psi_fix_sweep_run(cfg, _Unpack(output, unlink=True), seconds, error)
+                    for cfg, (output, seconds, error) in zip(self.configs, results)]
+        finally:
+            for s in shm:
+                s.close()
+                s.unlink()
+
+########################################################################################################################
+# Private Helpers (do not call!)
+########################################################################################################################
+class _SharedArray(NamedTuple):
+    # Descriptor of an array stored in shared memory
+    name : str
+    shape : tuple
+    dtype : str
+
+def _Pack(value, shm : list, minBytes : int):
+    # Replace large arrays by shared memory descriptors (segments created are appended to shm)
+    if type(value) in (tuple, list):
+        return type(value)(_Pack(v, shm, minBytes) for v in value)
+    if isinstance(value, np.ndarray) and value.nbytes >= minBytes and value.dtype != object:
+        s = shared_memory.SharedMemory(create=True, size=value.nbytes)
+        np.ndarray(value.shape, value.dtype, buffer=s.buf)[...] = value
+        shm.append(s)
+        return _SharedArray(s.name, value.shape, value.dtype.str)
+    return value
+
+def _Unpack(value, unlink : bool = False, attached : list = None):
+    # Replace shared memory descriptors by arrays (copies if unlink=True, views kept alive through attached otherwise)
+    if isinstance(value, _SharedArray):
+        s = shared_memory.SharedMemory(name=value.name)
+        view = np.ndarray(value.shape, np.dtype(value.dtype), buffer=s.buf)
+        if unlink:
+            arr = view.copy()
+            del view
+            s.close()
+            s.unlink()
+            return arr
+        view.flags.writeable = False
+        attached.append(s)
+        return view
+    if type(value) in (tuple, list):
+        return type(value)(_Unpack(v, unlink, attached) for v in value)
+    return value
+
+def _RunTask(task):
+    # Executed in the worker process
+    modelClass, constants, params, inputs, method, call, minBytes = task
+    attached = []
+    try:
+        try:
+            inp = inputs(params) if callable(inputs) else _Unpack(inputs, attached=attached)
+            if not isinstance(inp, tuple):
+                inp = (inp,)
+            model = modelClass(**constants, **params)
+            start = time.perf_counter()
+            if call is None:
+                output = getattr(model, method)(*inp)
+            else:
+                output = call(model, params, *inp)
+            seconds = time.perf_counter() - start
+            del inp
+        except Exception:
+            return None, 0.0, traceback.format_exc()
+        shm = []
+        output = _Pack(output, shm, minBytes)
+        for s in shm:
+            s.close()   # Segment is unlinked by the parent after copying
+        return output, seconds, None
+    finally:
+        for s in attached:
+            try:
+                s.close()
+            except BufferError:
+                pass    # Still referenced by the output (e.g. model returned its input), released with the process
@@ -9,6 +9,7 @@
 ########################################################################################################################
 from psi_fix_pkg import *
 import numpy as np
+from typing import Union, Iterable
 
 ########################################################################################################################
 # White Noise Generator Model
@@ -16,10 +17,22 @@ import numpy as np
 class psi_fix_white_noise:
 
 
+    ####################################################################################################################
+    # Constants
+    ####################################################################################################################
+    LFSR_BITS = 32
+    FB_TAPS = (31, 20, 26, 25)
+
     ####################################################################################################################
     # Constructor
     ####################################################################################################################
-    def __init__(self, outFmt : psi_fix_fmt_t, seed : int = 0xA38E3C1D):
+    def __init__(self, outFmt : psi_fix_fmt_t, seed : Union[int, Iterable[int]] = 0xA38E3C1D):
+        """
+        Constructor of the white noise generator model
+        :param outFmt: Output fixed-point format
+        :param seed: LFSR seed. Pass a vector of seeds to generate multiple independent streams at once (each stream
+                     is identical to the output of a generator with the corresponding single seed).
+        """
         if psi_fix_size(outFmt) > 32:
             raise Exception("psi_fix_white_noise: Output width cannot be larger than 32 bits")
         self.outFmt = outFmt
@@ -31,37 +44,44 @@ class psi_fix_white_noise:
     # Public functions
     ####################################################################################################################
     def Generate(self, samples : int) -> np.ndarray:
-
-        #Calculate random for each bit and concatenate to number
-        outVec = np.zeros(samples, dtype=np.int64)
+        """
+        Generate noise
+        :param samples: Number of samples to generate
+        :return: Noise samples. For a vector of seeds, an array of shape (streams, samples) is returned.
+        """
+        seeds = np.array(self.seed, dtype=np.int64).reshape(-1)
+
+        #Calculate random for each bit and concatenate to number (all streams and bits in parallel)
+        bitSeeds = (seeds[:, np.newaxis] + (1 << np.arange(self.outBits, dtype=np.int64))) & 0xFFFFFFFF
+        bits = self._GenerateBits(bitSeeds.reshape(-1), samples).reshape(seeds.size, self.outBits, samples)
+        outVec = np.zeros((seeds.size, samples), dtype=np.int64)
         for bitNr in range(self.outBits):
-            bitN = self._GenerateBit((self.seed + (1<<bitNr)) & 0xFFFFFFFF, samples)
-            outVec += bitN << bitNr
+            outVec += bits[:, bitNr].astype(np.int64) << bitNr
 
         #Signed Conversion
         if self.outFmt.s == 1:
             outVec = np.where(outVec >= 2**(self.outBits-1), outVec - 2**self.outBits, outVec)
 
         #Output
+        if np.ndim(self.seed) == 0:
+            outVec = outVec[0]
         return psi_fix_from_bits_as_int(outVec, self.outFmt)
 
 
     ####################################################################################################################
     # Private functions
     ####################################################################################################################
-    def _GenerateBit(self, seed : int, samples : int):
-        lfsr = seed
-        bitVec = np.empty(samples, dtype=np.int64)
-        fbTaps = [31,20,26,25]
-        for i in range(samples):
-            bitVec[i] = lfsr & 0x01
-            fbVals = np.array(lfsr & (2**np.array(fbTaps)), dtype=bool)
-            fbBit = np.sum(fbVals) % 2
-            lfsr = ((lfsr << 1) + fbBit) & 0xFFFFFFFF
-        return bitVec
-
-
-
-
-
-
+    def _GenerateBits(self, seeds : np.ndarray, samples : int):
+        # The output bit of the LFSR is its LSB and the LSB is always the last feedback bit. Therefore the output
+        # sequence b[n] follows the recursion b[n] = b[n-1-31] ^ b[n-1-20] ^ b[n-1-26] ^ b[n-1-25] and the seed provides
+        # b[-31] ... b[0]. Since the shortest lag is 21, blocks of 21 bits can be calculated at once for all LFSRs.
+        hist = self.LFSR_BITS - 1
+        minLag = 1 + min(self.FB_TAPS)
+        seq = np.empty((seeds.size, hist + max(samples, 1)), dtype=np.uint8)
+        seq[:, :self.LFSR_BITS] = (seeds[:, np.newaxis] >> np.arange(hist, -1, -1)) & 0x01
+        for start in range(self.LFSR_BITS, seq.shape[1], minLag):
+            stop = min(start + minLag, seq.shape[1])
+            seq[:, start:stop] = seq[:, start-1-self.FB_TAPS[0]:stop-1-self.FB_TAPS[0]]
+            for tap in self.FB_TAPS[1:]:
+                seq[:, start:stop] ^= seq[:, start-1-tap:stop-1-tap]
+        return seq[:, hist:hist+samples]
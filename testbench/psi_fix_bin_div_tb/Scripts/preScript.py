@@ -7,6 +7,7 @@ import sys
 sys.path.append("../../../model")
 import numpy as np
 from psi_fix_pkg import *
+from psi_fix_io import psi_fix_write_columns
 from psi_fix_bin_div import psi_fix_bin_div
 from matplotlib import pyplot
 import os
@@ -22,17 +23,6 @@ except FileExistsError:
     pass
 
 
-#############################################################
-# Functions
-#############################################################
-def WriteFile(signal, filePath, fracBits):
-    # Scale to fixed point
-    signal = (signal * pow(2, fracBits)).round()
-
-    # Write to File
-    with open(filePath, "w+") as f:
-        f.writelines(["{}\n".format(int(val)) for val in signal])
-
 #############################################################
 # Simulation
 #############################################################
@@ -64,8 +54,6 @@ if PLOT_ON:
 #############################################################
 # Write Files for Co sim
 #############################################################
-with open(STIM_DIR + "/input.txt", "w+") as f:
-    f.writelines(["{} {}\n".format(int(i), int(q)) for i, q in zip(psi_fix_get_bits_as_int(numF, numFmt), psi_fix_get_bits_as_int(denomF, denomFmt))])
-with open(STIM_DIR + "/output.txt", "w+") as f:
-    f.writelines(["{}\n".format(int(r)) for r in psi_fix_get_bits_as_int(res, outFmt)])
+psi_fix_write_columns(STIM_DIR + "/input.txt", [(numF, numFmt), (denomF, denomFmt)])
+psi_fix_write_columns(STIM_DIR + "/output.txt", [(res, outFmt)])
 
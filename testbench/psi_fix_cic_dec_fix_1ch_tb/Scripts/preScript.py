@@ -8,6 +8,7 @@ sys.path.append("../../../model")
 import numpy as np
 import scipy.signal as sps
 from psi_fix_pkg import *
+from psi_fix_io import psi_fix_write_columns
 from psi_fix_cic_dec import psi_fix_cic_dec
 from typing import NamedTuple
 import matplotlib.pyplot as plt
@@ -23,18 +24,6 @@ try:
 except FileExistsError:
     pass
 
-#############################################################
-# Functions
-#############################################################
-
-def WriteFile(signal, filePath, fracBits):
-    # Scale to fixed point
-    signal = (signal * pow(2, fracBits)).round()
-
-    # Write to File
-    with open(filePath, "w+") as f:
-        f.writelines(["{}\n".format(int(val)) for val in signal])
-
 #############################################################
 # Data Generation
 #############################################################
@@ -70,14 +59,12 @@ for cfg in configs:
 #############################################################
 for nr, sig in enumerate(inSig):
     cfg = configs[nr]
-    with open(STIM_DIR + "/input_o{}_r{}_dd{}_gc{}.txt".format(cfg.order, cfg.ratio, cfg.diffDel, cfg.gainCorr), "w+") as f:
-        for spl in sig:
-            f.write("{}\n".format(psi_fix_get_bits_as_int(spl, inFmt)))
+    psi_fix_write_columns(STIM_DIR + "/input_o{}_r{}_dd{}_gc{}.txt".format(cfg.order, cfg.ratio, cfg.diffDel, cfg.gainCorr),
+                          [(sig, inFmt)])
 
 for nr, sig in enumerate(outSig):
     cfg = configs[nr]
-    with open(STIM_DIR + "/output_o{}_r{}_dd{}_gc{}.txt".format(cfg.order, cfg.ratio, cfg.diffDel, cfg.gainCorr), "w+") as f:
-        for spl in sig:
-            f.write("{}\n".format(psi_fix_get_bits_as_int(spl, outFmt)))
+    psi_fix_write_columns(STIM_DIR + "/output_o{}_r{}_dd{}_gc{}.txt".format(cfg.order, cfg.ratio, cfg.diffDel, cfg.gainCorr),
+                          [(sig, outFmt)])
 
 
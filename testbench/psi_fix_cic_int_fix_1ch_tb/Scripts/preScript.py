@@ -8,6 +8,7 @@ sys.path.append("../../../model")
 import numpy as np
 import scipy.signal as sps
 from psi_fix_pkg import *
+from psi_fix_io import psi_fix_write_columns
 from psi_fix_cic_int import psi_fix_cic_int
 from typing import NamedTuple
 import matplotlib.pyplot as plt
@@ -53,14 +54,11 @@ for cfg in configs:
 #############################################################
 # Write files
 #############################################################
-with open(STIM_DIR + "/input.txt", "w+") as f:
-    for spl in inSig:
-        f.write("{}\n".format(psi_fix_get_bits_as_int(spl, inFmt)))
+psi_fix_write_columns(STIM_DIR + "/input.txt", [(inSig, inFmt)])
 
 for nr, sig in enumerate(outSig):
     cfg = configs[nr]
-    with open(STIM_DIR + "/output_o{}_r{}_dd{}_gc{}.txt".format(cfg.order, cfg.ratio, cfg.diffDel, cfg.gainCorr), "w+") as f:
-        for spl in sig:
-            f.write("{}\n".format(psi_fix_get_bits_as_int(spl, outFmt)))
+    psi_fix_write_columns(STIM_DIR + "/output_o{}_r{}_dd{}_gc{}.txt".format(cfg.order, cfg.ratio, cfg.diffDel, cfg.gainCorr),
+                          [(sig, outFmt)])
 
 
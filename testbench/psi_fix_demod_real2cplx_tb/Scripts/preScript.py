@@ -16,7 +16,6 @@ STIM_DIR = os.path.dirname(os.path.abspath(__file__)) + "/../Data"
 SAMPLES = 10000
 
 PLOT_ON = False
-DEBUG_ON = True
 
 try:
     os.mkdir(STIM_DIR)
@@ -65,7 +64,7 @@ for ratio_num in ratio_nums:
         phase = np.ones_like(sigFix)*0
         phase [100:1000] = 1
 
-        demod = psi_fix_demod_real2cplx(inFmt, outFmt, coefBits, ratio_num, ratio_den, DEBUG_ON)
+        demod = psi_fix_demod_real2cplx(inFmt, outFmt, coefBits, ratio_num, ratio_den)
         resI, resQ = demod.Process(sigFix, phase)
 
         #############################################################
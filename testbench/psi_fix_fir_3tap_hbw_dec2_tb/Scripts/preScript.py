@@ -7,6 +7,7 @@ import sys
 sys.path.append("../../../model")
 import numpy as np
 from psi_fix_pkg import *
+from psi_fix_io import psi_fix_write_columns
 from psi_fix_fir import psi_fix_fir
 from matplotlib import pyplot
 from scipy import signal
@@ -50,35 +51,11 @@ for ch in range(0, MAX_CHANNELS):
 
 for separate in [True, False]:
     for channels in [1,2,4]:
-        with open(STIM_DIR + "/inChannels{}Separate{}.txt".format(int(channels), separate), "w+") as f:
-            if separate:
-                for i in range(0,inData.shape[1],2):
-                    line = ""
-                    for ch in range(0,inData.shape[0]):
-                        line = line + "{} {} ".format(int(psi_fix_get_bits_as_int(inData[ch,i], inFmt)), int(psi_fix_get_bits_as_int(inData[ch,i+1], inFmt)))
-                    f.writelines(line+"\n")
-            else:
-                for i in range(0,inData.shape[1],2*channels):
-                    line = ""
-                    for ch in range(0,2*channels,2):
-                        line = line + "{} {} ".format(int(psi_fix_get_bits_as_int(inData[1,i+ch], inFmt)), int(psi_fix_get_bits_as_int(inData[1,i+ch+1], inFmt)))
-                    f.writelines(line+"\n")
-
-        with open(STIM_DIR + "/outChannels{}Separate{}.txt".format(int(channels), separate), "w+") as f:                
-            if separate:
-                for i in range(0,outData.shape[1]):
-                    line = ""
-                    for ch in range(0,outData.shape[0]):
-                        line = line + " {}".format(int(psi_fix_get_bits_as_int(outData[ch,i], outFmt)))
-                    f.writelines(line+"\n")
-            else:
-                for i in range(0,outData.shape[1],channels):
-                    line = ""
-                    for ch in range(0,channels):
-                        line = line + " {}".format(int(psi_fix_get_bits_as_int(outData[1,i+ch], outFmt)))
-                    f.writelines(line+"\n")
-
-                    
-                    
-
-
+        if separate:
+            inCols = [(inData[ch,k::2], inFmt) for ch in range(0,inData.shape[0]) for k in range(2)]
+            outCols = [(outData[ch], outFmt) for ch in range(0,outData.shape[0])]
+        else:
+            inCols = [(inData[1,k::2*channels], inFmt) for k in range(2*channels)]
+            outCols = [(outData[1,k::channels], outFmt) for k in range(channels)]
+        psi_fix_write_columns(STIM_DIR + "/inChannels{}Separate{}.txt".format(int(channels), separate), inCols)
+        psi_fix_write_columns(STIM_DIR + "/outChannels{}Separate{}.txt".format(int(channels), separate), outCols)
@@ -8,6 +8,7 @@ sys.path.append("../../../model")
 import numpy as np
 import scipy.signal as sps
 from psi_fix_pkg import *
+from psi_fix_io import psi_fix_write_columns
 from psi_fix_fir import psi_fix_fir
 import os
 
@@ -18,18 +19,6 @@ try:
 except FileExistsError:
     pass
 
-#############################################################
-# Functions
-#############################################################
-
-def WriteFile(signal, filePath, fracBits):
-    # Scale to fixed point
-    signal = (signal * pow(2, fracBits)).round()
-
-    # Write to File
-    with open(filePath, "w+") as f:
-        f.writelines(["{}\n".format(int(val)) for val in signal])
-
 #############################################################
 # Data Generation
 #############################################################
@@ -56,21 +45,10 @@ for i in range(2):
 #############################################################
 # Write files
 #############################################################
-with open(STIM_DIR + "/input.txt", "w+") as f:
-    inSigInt0 = psi_fix_get_bits_as_int(inSig[0], inFmt)
-    inSigInt1 = psi_fix_get_bits_as_int(inSig[1], inFmt)
-    for i in range(SAMPLES):
-        f.write("{} {}\n".format(inSigInt0[i], inSigInt1[i]))
-
-with open(STIM_DIR + "/coefs.txt", "w+") as f:
-    for c in coefsFix:
-        f.write("{}\n".format(psi_fix_get_bits_as_int(c, coefFmt)))
+psi_fix_write_columns(STIM_DIR + "/input.txt", [(inSig[0], inFmt), (inSig[1], inFmt)])
 
+psi_fix_write_columns(STIM_DIR + "/coefs.txt", [(coefsFix, coefFmt)])
 
-with open(STIM_DIR + "/output.txt", "w+") as f:
-    outSigInt0 = psi_fix_get_bits_as_int(outSig[0], outFmt)
-    outSigInt1 = psi_fix_get_bits_as_int(outSig[1], outFmt)
-    for i in range(outSig[0].size):
-        f.write("{} {}\n".format(outSigInt0[i], outSigInt1[i]))
+psi_fix_write_columns(STIM_DIR + "/output.txt", [(outSig[0], outFmt), (outSig[1], outFmt)])
 
 
@@ -8,6 +8,7 @@ sys.path.append("../../../model")
 import numpy as np
 from psi_fix_pkg import *
 from psi_fix_lowpass_iir_order1 import psi_fix_lowpass_iir_order1
+from psi_fix_stim_cache import psi_fix_stim_cache
 from matplotlib import pyplot as plt
 import scipy.signal as sps
 import os
@@ -36,6 +37,10 @@ fCutoff = 1e6
 FSTART = fCutoff/10
 FSTOP = fCutoff*10
 
+cache = psi_fix_stim_cache([STIM_DIR + "/input.txt", STIM_DIR + "/output.txt"],
+                           params=[SAMPLES, inFmt, outFmt, intFmt, coefFmt, fSample, fCutoff])
+if not PLOT_ON and cache.Restore():
+    sys.exit(0)
 
 t = np.arange(0, (SAMPLES-1)/fSample, 1/fSample)
 sig = sps.chirp(t, FSTART, t[-1], FSTOP, method="log")*0.999
@@ -62,5 +67,4 @@ if PLOT_ON:
 #############################################################
 np.savetxt(STIM_DIR + "/input.txt", psi_fix_get_bits_as_int(sigFix, inFmt), fmt="%i", header="input")
 np.savetxt(STIM_DIR + "/output.txt", psi_fix_get_bits_as_int(res, outFmt), fmt="%i", header="output")
-
-
+cache.Store()
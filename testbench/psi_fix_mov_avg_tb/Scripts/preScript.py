@@ -8,6 +8,7 @@ sys.path.append("../../../model")
 import numpy as np
 from psi_fix_pkg import *
 from psi_fix_mov_avg import psi_fix_mov_avg
+from psi_fix_stim_cache import psi_fix_stim_cache
 from matplotlib import pyplot as plt
 import scipy.signal as sps
 import os
@@ -32,6 +33,11 @@ outFmt = psi_fix_fmt_t(1, 1, 12)
 Taps = 7
 GcOptions = (psi_fix_mov_avg.GAINCORR_NONE, psi_fix_mov_avg.GAINCORR_ROUGH, psi_fix_mov_avg.GAINCORR_EXACT)
 
+cache = psi_fix_stim_cache([STIM_DIR + "/input.txt"] + [STIM_DIR + "/output_{}.txt".format(gc.lower()) for gc in GcOptions],
+                           params=[RAND_SAMPLES, sigDbg, inFmt, outFmt, Taps, GcOptions])
+if not PLOT_ON and cache.Restore():
+    sys.exit(0)
+
 np.random.seed(0)
 sigRand = np.random.randn(RAND_SAMPLES)*2-1
 
@@ -58,5 +64,4 @@ if PLOT_ON:
 np.savetxt(STIM_DIR + "/input.txt", psi_fix_get_bits_as_int(sigFix, inFmt), fmt="%i", header="input")
 for gc in GcOptions:
     np.savetxt(STIM_DIR + "/output_{}.txt".format(gc.lower()), psi_fix_get_bits_as_int(result[gc], outFmt), fmt="%i", header="result-I result-Q")
-
-
+cache.Store()
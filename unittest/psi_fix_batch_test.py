@@ -0,0 +1,114 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+import sys
+sys.path.append("../model")
+from psi_fix_pkg import *
+from psi_fix_cic_dec import psi_fix_cic_dec
+from psi_fix_cic_int import psi_fix_cic_int
+from psi_fix_fir import psi_fix_fir
+from psi_fix_lowpass_iir_order1 import psi_fix_lowpass_iir_order1
+from psi_fix_mov_avg import psi_fix_mov_avg
+from psi_fix_demod_real2cplx import psi_fix_demod_real2cplx
+from psi_fix_mod_cplx2real import psi_fix_mod_cplx2real
+from psi_fix_phase_unwrap import psi_fix_phase_unwrap
+from psi_fix_dds_18b import psi_fix_dds_18b
+from psi_fix_bin_div import psi_fix_bin_div
+from psi_fix_cordic_vect import psi_fix_cordic_vect
+from psi_fix_cordic_rot import psi_fix_cordic_rot
+
+import unittest
+
+########################################################################################################################
+# Test Cases
+########################################################################################################################
+FMT = psi_fix_fmt_t(1, 0, 15)
+TRIALS = (2, 3)
+
+def Batch(samples : int, fmt : psi_fix_fmt_t = FMT, low : float = -0.9, high : float = 0.9) -> np.ndarray:
+    np.random.seed(3)
+    return psi_fix_from_real(np.random.uniform(low, high, TRIALS + (samples,)), fmt)
+
+### Batch processing (leading axes are independent channels) ###
+class PsiFixBatchTest(unittest.TestCase):
+
+    def assertBatch(self, func, *inputs):
+        # Processing the batch at once must give the same result as processing each channel separately
+        batchRes = func(*inputs)
+        for idx in np.ndindex(TRIALS):
+            chRes = func(*[inp[idx] for inp in inputs])
+            if isinstance(chRes, tuple):
+                for b, c in zip(batchRes, chRes):
+                    self.assertTrue(np.array_equal(b[idx], c))
+            else:
+                self.assertTrue(np.array_equal(batchRes[idx], chRes))
+
+    def test_CicDec(self):
+        cic = psi_fix_cic_dec(3, 5, 2, FMT, FMT, True)
+        self.assertBatch(cic.Process, Batch(200))
+
+    def test_CicDecContinueState(self):
+        cic = psi_fix_cic_dec(3, 4, 1, FMT, FMT, True)
+        inp = Batch(250)
+        ref = cic.Process(inp)
+        res = np.concatenate([cic.Process(inp[..., :101]), cic.Process(inp[..., 101:], continueState=True)], axis=-1)
+        self.assertTrue(np.array_equal(ref, res))
+        with self.assertRaises(ValueError):
+            cic.Process(inp[0], continueState=True)
+
+    def test_CicInt(self):
+        cic = psi_fix_cic_int(3, 4, 1, FMT, FMT, True)
+        self.assertBatch(cic.Process, Batch(50))
+
+    def test_Fir(self):
+        fir = psi_fix_fir(FMT, FMT, psi_fix_fmt_t(1, 0, 17))
+        coefs = np.linspace(-0.3, 0.3, 9)
+        self.assertBatch(lambda x: fir.FilterSatDetect(x, 3, coefs), Batch(100))
+
+    def test_Iir(self):
+        iir = psi_fix_lowpass_iir_order1(100e6, 1e6, FMT, FMT, psi_fix_fmt_t(1, 0, 24), psi_fix_fmt_t(1, 0, 17))
+        self.assertBatch(iir.Filter, Batch(100))
+
+    def test_MovAvgDemod(self):
+        movAvg = psi_fix_mov_avg(FMT, FMT, 7)
+        self.assertBatch(movAvg.Process, Batch(100))
+        demod = psi_fix_demod_real2cplx(FMT, psi_fix_fmt_t(1, 0, 16), 25, 5, 1)
+        self.assertBatch(lambda x: demod.Process(x, 0), Batch(100))
+
+    def test_Mod(self):
+        mod = psi_fix_mod_cplx2real(FMT, psi_fix_fmt_t(1, 0, 17), psi_fix_fmt_t(1, 1, 20), FMT, 5, 1)
+        self.assertBatch(mod.Process, Batch(100), Batch(100) / 2)
+
+    def test_PhaseUnwrap(self):
+        unwrap = psi_fix_phase_unwrap(FMT, psi_fix_fmt_t(1, 2, 15), psi_fix_rnd_t.round)
+        self.assertBatch(unwrap.Process, Batch(300, low=-1, high=1))
+        # Block-wise processing
+        inp = Batch(300, low=-1, high=1)
+        ref = unwrap.Process(inp)
+        first = unwrap.Process(inp[..., :120])
+        second = unwrap.Process(inp[..., 120:], continueState=True)
+        self.assertTrue(np.array_equal(ref[0], np.concatenate((first[0], second[0]), axis=-1)))
+        self.assertTrue(np.array_equal(ref[1], np.concatenate((first[1], second[1]), axis=-1)))
+
+    def test_Dds(self):
+        dds = psi_fix_dds_18b(psi_fix_fmt_t(0, 0, 31))
+        self.assertBatch(dds.Process, Batch(100, psi_fix_fmt_t(0, 0, 31), 0.0, 0.1),
+                         Batch(100, psi_fix_fmt_t(0, 0, 31), 0.0, 0.9))
+
+    def test_BinDiv(self):
+        outFmt = psi_fix_fmt_t(1, 2, 10)
+        self.assertBatch(lambda n, d: psi_fix_bin_div(n, FMT, d, FMT, outFmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.sat),
+                         Batch(50), Batch(50, low=0.3, high=0.9))
+
+    def test_Cordic(self):
+        vect = psi_fix_cordic_vect(FMT, psi_fix_fmt_t(0, 1, 16), psi_fix_fmt_t(1, 1, 22), psi_fix_fmt_t(0, 0, 15),
+                                   psi_fix_fmt_t(1, 0, 18), 13, True, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
+        self.assertBatch(vect.Process, Batch(50, low=-0.6, high=0.6), Batch(50, low=-0.6, high=0.6))
+        rot = psi_fix_cordic_rot(psi_fix_fmt_t(0, 0, 15), psi_fix_fmt_t(0, 0, 16), FMT, psi_fix_fmt_t(1, 1, 22),
+                                 psi_fix_fmt_t(1, -2, 20), 15, True, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+        self.assertBatch(rot.Process, Batch(50, psi_fix_fmt_t(0, 0, 15), 0.0, 0.9),
+                         Batch(50, psi_fix_fmt_t(0, 0, 16), 0.0, 0.99))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+import sys
+sys.path.append("../model")
+sys.path.append("../benchmark")
+from psi_fix_pkg import *
+from psi_fix_benchmark import PkgBenchmarks, PKG_WIDTHS
+
+import re
+import unittest
+
+########################################################################################################################
+# Test Cases
+########################################################################################################################
+def Formats(text : str) -> dict:
+    # "a=(1, 1, 6) r_fmt=(1, 2, 4) round sat" -> {"a" : "(1, 1, 6)", "r" : "(1, 2, 4)"}
+    return dict(re.findall(r"\b([abr])(?:_fmt)?=(\([^)]*\))", text))
+
+def Modes(text : str) -> str:
+    return text.rsplit(")", 1)[-1].strip()
+
+### psi_fix_benchmark ###
+class PsiFixBenchmarkTest(unittest.TestCase):
+
+    def test_PkgFormats(self):
+        # Every benchmark must call the function with the formats and modes it reports in its configuration
+        benchmarks = list(PkgBenchmarks([16]))
+        self.assertEqual(len(PKG_WIDTHS), len({b.config for b in benchmarks if b.name == "psi_fix_add"}))
+        for b in benchmarks:
+            with psi_fix_profiler() as prof:
+                b.run()
+            sigs = [sig for name, sig in prof.stats if name == b.name]
+            self.assertEqual(1, len(sigs), b)
+            reported = Formats(b.config)
+            called = Formats(sigs[0])
+            self.assertTrue(len(called) > 0, b)
+            for key, fmt in called.items():
+                self.assertEqual(reported[key], fmt, "{} {}: called with {}".format(b.name, b.config, sigs[0]))
+            if Modes(sigs[0]) != "":
+                self.assertEqual(Modes(b.config), Modes(sigs[0]), b.name)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+import sys
+sys.path.append("../model")
+from psi_fix_pkg import *
+from psi_fix_mov_avg import psi_fix_mov_avg
+from psi_fix_demod_real2cplx import psi_fix_demod_real2cplx
+from psi_fix_mod_cplx2real import psi_fix_mod_cplx2real
+
+import unittest
+
+########################################################################################################################
+# Test Cases
+########################################################################################################################
+FMT = psi_fix_fmt_t(1, 0, 15)
+BLOCKS = [1, 3, 2, 17, 4, 40, 6, 27]   # Includes blocks shorter than the filters
+
+def Signal(samples : int, fmt : psi_fix_fmt_t = FMT) -> np.ndarray:
+    np.random.seed(4)
+    return psi_fix_from_real(np.random.uniform(-0.9, 0.9, samples), fmt)
+
+def Split(data : np.ndarray):
+    # Split along the last axis into blocks of the sizes in BLOCKS
+    return np.split(data, np.cumsum(BLOCKS)[:-1], axis=-1)
+
+### psi_fix_mov_avg ###
+class PsiFixMovAvgBlockTest(unittest.TestCase):
+
+    def test_Blocks(self):
+        inp = Signal(sum(BLOCKS))
+        for gaincorr in (psi_fix_mov_avg.GAINCORR_NONE, psi_fix_mov_avg.GAINCORR_ROUGH, psi_fix_mov_avg.GAINCORR_EXACT):
+            for taps in (5, 16):
+                movAvg = psi_fix_mov_avg(FMT, psi_fix_fmt_t(1, 0, 16), taps, gaincorr)
+                ref = movAvg.Process(inp)
+                movAvg.Reset()
+                res = [movAvg.Process(block, continueState=True) for block in Split(inp)]
+                self.assertTrue(np.array_equal(ref, np.concatenate(res)))
+
+    def test_MultiChannel(self):
+        inp = Signal(3 * sum(BLOCKS)).reshape(3, -1)
+        movAvg = psi_fix_mov_avg(FMT, FMT, 7, reuseBuffers=True)
+        ref = movAvg.Process(inp)
+        movAvg.Reset()
+        res = [movAvg.Process(block, continueState=True) for block in Split(inp)]
+        self.assertTrue(np.array_equal(ref, np.concatenate(res, axis=-1)))
+        with self.assertRaises(ValueError):
+            movAvg.Process(inp[:2], continueState=True)
+
+    def test_Reset(self):
+        inp = Signal(50)
+        movAvg = psi_fix_mov_avg(FMT, FMT, 8)
+        ref = movAvg.Process(inp)
+        movAvg.Process(inp[:13], continueState=True)
+        movAvg.Reset()
+        self.assertTrue(np.array_equal(ref, movAvg.Process(inp, continueState=True)))
+        # continueState=False always starts from the initial state
+        movAvg.Process(inp[:13])
+        self.assertTrue(np.array_equal(ref, movAvg.Process(inp)))
+
+### psi_fix_demod_real2cplx ###
+class PsiFixDemodBlockTest(unittest.TestCase):
+
+    def test_Blocks(self):
+        inp = Signal(sum(BLOCKS))
+        for ratioNum, ratioDen in [(5, 1), (7, 3)]:
+            demod = psi_fix_demod_real2cplx(FMT, psi_fix_fmt_t(1, 0, 16), 25, ratioNum, ratioDen)
+            refI, refQ = demod.Process(inp, 2)
+            demod.Reset()
+            res = [demod.Process(block, 2, continueState=True) for block in Split(inp)]
+            self.assertTrue(np.array_equal(refI, np.concatenate([i for i, _ in res])))
+            self.assertTrue(np.array_equal(refQ, np.concatenate([q for _, q in res])))
+
+    def test_Reset(self):
+        inp = Signal(50)
+        demod = psi_fix_demod_real2cplx(FMT, psi_fix_fmt_t(1, 0, 16), 25, 7, 3)
+        refI, refQ = demod.Process(inp, 0)
+        demod.Process(inp[:13], 0, continueState=True)
+        demod.Reset()
+        i, q = demod.Process(inp, 0, continueState=True)
+        self.assertTrue(np.array_equal(refI, i))
+        self.assertTrue(np.array_equal(refQ, q))
+
+### psi_fix_mod_cplx2real ###
+class PsiFixModBlockTest(unittest.TestCase):
+
+    def Model(self, ratioNum : int, ratioDen : int) -> psi_fix_mod_cplx2real:
+        return psi_fix_mod_cplx2real(psi_fix_fmt_t(1, 1, 15), psi_fix_fmt_t(1, 1, 23), psi_fix_fmt_t(1, 1, 23),
+                                     psi_fix_fmt_t(1, 1, 15), ratioNum, ratioDen)
+
+    def test_Blocks(self):
+        dataI = Signal(sum(BLOCKS))
+        dataQ = Signal(sum(BLOCKS))[::-1]
+        for ratioNum, ratioDen in [(5, 1), (7, 3)]:
+            mod = self.Model(ratioNum, ratioDen)
+            ref = mod.Process(dataI, dataQ)
+            mod.Reset()
+            res = [mod.Process(i, q, continuePhase=True) for i, q in zip(Split(dataI), Split(dataQ))]
+            self.assertTrue(np.array_equal(ref, np.concatenate(res)))
+
+    def test_Reset(self):
+        dataI = Signal(50)
+        mod = self.Model(7, 3)
+        ref = mod.Process(dataI, -dataI)
+        mod.Process(dataI[:13], -dataI[:13], continuePhase=True)
+        mod.Reset()
+        self.assertTrue(np.array_equal(ref, mod.Process(dataI, -dataI, continuePhase=True)))
+
+if __name__ == "__main__":
+    unittest.main()
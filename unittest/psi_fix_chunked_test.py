@@ -0,0 +1,90 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+import sys
+sys.path.append("../model")
+from psi_fix_pkg import *
+from psi_fix_io import psi_fix_bin_file
+from psi_fix_chunked import psi_fix_chunked
+from psi_fix_fir import psi_fix_fir
+from psi_fix_cic_dec import psi_fix_cic_dec
+from psi_fix_demod_real2cplx import psi_fix_demod_real2cplx
+
+import unittest
+import tempfile
+import os
+
+########################################################################################################################
+# Test Cases
+########################################################################################################################
+FMT = psi_fix_fmt_t(1, 0, 15)
+
+def Signal(shape) -> np.ndarray:
+    np.random.seed(2)
+    return psi_fix_from_real(np.random.uniform(-0.9, 0.9, shape), FMT)
+
+### psi_fix_chunked ###
+class PsiFixChunkedTest(unittest.TestCase):
+
+    def test_Operation(self):
+        outFmt = psi_fix_fmt_t(1, 0, 7)
+        inp = Signal((2, 1000))
+        with tempfile.TemporaryDirectory() as d:
+            mm = np.lib.format.open_memmap(os.path.join(d, "in.npy"), mode="w+", dtype=np.float64, shape=inp.shape)
+            mm[...] = inp
+            op = psi_fix_chunked(lambda a, b: psi_fix_add(a, FMT, b, FMT, outFmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat),
+                                 chunkSize=300)
+            out = op.Run((mm, inp[::-1]), os.path.join(d, "out.npy"))
+            self.assertIsInstance(out, np.memmap)
+            ref = psi_fix_add(inp, FMT, inp[::-1], FMT, outFmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+            self.assertTrue(np.array_equal(ref, np.load(os.path.join(d, "out.npy"))))
+            del out, mm
+
+    def test_BinFile(self):
+        outFmt = psi_fix_fmt_t(1, 1, 10)
+        inp = Signal((3, 777))
+        with tempfile.TemporaryDirectory() as d:
+            src = psi_fix_bin_file.Write(os.path.join(d, "in.bin"), inp, FMT)
+            dst = psi_fix_bin_file.Create(os.path.join(d, "out.bin"), outFmt, 3, 777)
+            psi_fix_chunked(lambda x: psi_fix_resize(x, FMT, outFmt, psi_fix_rnd_t.round), chunkSize=100).Run(src, dst)
+            ref = psi_fix_resize(inp, FMT, outFmt, psi_fix_rnd_t.round)
+            self.assertTrue(np.array_equal(ref, psi_fix_bin_file(os.path.join(d, "out.bin")).GetData()))
+            del src, dst
+
+    def test_ModelState(self):
+        inp = Signal((2, 1200))
+        cic = psi_fix_cic_dec(3, 4, 1, FMT, FMT, True)
+        ref = cic.Process(inp)
+        chunked = psi_fix_chunked(lambda x: cic.Process(x, continueState=True), chunkSize=100, decimation=4,
+                                  reset=cic.Reset)
+        self.assertTrue(np.array_equal(ref, chunked.Run(inp)))
+        self.assertTrue(np.array_equal(ref, chunked.Run(inp)))
+        # Tuple output (I, Q)
+        demod = psi_fix_demod_real2cplx(FMT, psi_fix_fmt_t(1, 0, 16), 25, 5, 1)
+        refI, refQ = demod.Process(inp, 0)
+        outI, outQ = psi_fix_chunked(lambda x: demod.Process(x, 0, continueState=True), chunkSize=128,
+                                     reset=demod.Reset).Run(inp)
+        self.assertTrue(np.array_equal(refI, outI))
+        self.assertTrue(np.array_equal(refQ, outQ))
+
+    def test_History(self):
+        coefs = np.linspace(-0.4, 0.4, 11)
+        fir = psi_fix_fir(FMT, FMT, psi_fix_fmt_t(1, 0, 17))
+        inp = Signal(1000)
+        res = psi_fix_chunked(lambda x: fir.Filter(x, 2, coefs), chunkSize=64, decimation=2, history=10).Run(inp)
+        self.assertTrue(np.array_equal(fir.Filter(inp, 2, coefs), res))
+
+    def test_Errors(self):
+        with self.assertRaises(ValueError):
+            psi_fix_chunked(lambda x: x, chunkSize=10, decimation=3)
+        op = psi_fix_chunked(lambda x: x, chunkSize=10)
+        with self.assertRaises(ValueError):
+            op.Run((np.zeros(10), np.zeros(11)))
+        with self.assertRaises(ValueError):
+            op.Run(np.zeros(10), np.zeros(9))
+        with self.assertRaises(ValueError):
+            op.Run(np.zeros(0))
+
+if __name__ == "__main__":
+    unittest.main()
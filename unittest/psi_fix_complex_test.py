@@ -0,0 +1,208 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+import sys
+sys.path.append("../model")
+from psi_fix_pkg import *
+from psi_fix_complex_mult import psi_fix_complex_mult
+from psi_fix_complex_addsub import psi_fix_complex_addsub
+from psi_fix_complex_abs import psi_fix_complex_abs
+from psi_fix_cordic_vect import psi_fix_cordic_vect
+from psi_fix_cordic_abs_pl import psi_fix_cordic_abs_pl
+
+import unittest
+
+########################################################################################################################
+# Test Cases
+########################################################################################################################
+FMT = psi_fix_fmt_t(1, 0, 15)
+
+def Signal(samples : int, seed : int, amplitude : float = 0.7) -> np.ndarray:
+    # Complex random signal, not quantized (ProcessComplex and Process must quantize the same way)
+    np.random.seed(seed)
+    return amplitude * (np.random.uniform(-1, 1, samples) + 1j*np.random.uniform(-1, 1, samples))
+
+def Packed(data : np.ndarray, fmt : psi_fix_fmt_t) -> np.ndarray:
+    # Packed integer I/Q buffer of the quantized data
+    return psi_fix_cplx_pack(psi_fix_from_real(data.real, fmt), psi_fix_from_real(data.imag, fmt), fmt, True)
+
+def OutOfRange(data : np.ndarray, fmt : psi_fix_fmt_t) -> Tuple[np.ndarray, np.ndarray]:
+    # Complex and packed data where only the Q value of the last sample is out of range (the range is checked over
+    # the whole packed buffer, not per I/Q array)
+    cplx = data.copy()
+    cplx[-1] = cplx[-1].real + 1j*(psi_fix_upper_bound(fmt) + 2.0**-fmt.f)
+    packed = Packed(data, fmt)
+    packed[-1] = psi_fix_get_bits_as_int(psi_fix_upper_bound(fmt), fmt) + 1
+    return cplx, packed
+
+class ProcessComplexTestBase(unittest.TestCase):
+
+    def assertArraysEqual(self, expected, actual):
+        self.assertEqual(len(expected), len(actual))
+        for exp, act in zip(expected, actual):
+            self.assertTrue(np.array_equal(exp, act))
+
+### psi_fix_complex_mult ###
+class PsiFixComplexMultTest(ProcessComplexTestBase):
+
+    def setUp(self):
+        self.bFmt = psi_fix_fmt_t(1, 0, 24)
+        self.model = psi_fix_complex_mult(FMT, self.bFmt, psi_fix_fmt_t(1, 1, 24), psi_fix_fmt_t(1, 0, 20),
+                                          psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+        self.a = Signal(100, 1)
+        self.b = Signal(100, 2)
+        self.i, self.q = self.model.Process(self.a.real, self.a.imag, self.b.real, self.b.imag)
+
+    def test_Complex(self):
+        res = self.model.ProcessComplex(self.a, self.b)
+        self.assertEqual(np.complex128, res.dtype)
+        self.assertArraysEqual([self.i, self.q], [res.real, res.imag])
+
+    def test_Packed(self):
+        res = self.model.ProcessComplex(Packed(self.a, FMT), Packed(self.b, self.bFmt))
+        self.assertArraysEqual([psi_fix_cplx_pack(self.i, self.q, self.model.outFmt, True)], [res])
+        # B may be passed as complex array, the representation of the result follows A
+        res = self.model.ProcessComplex(Packed(self.a, FMT), self.b)
+        self.assertArraysEqual([psi_fix_cplx_pack(self.i, self.q, self.model.outFmt, True)], [res])
+
+    def test_OutOfRange(self):
+        cplx, packed = OutOfRange(self.a, FMT)
+        with self.assertRaises(ValueError):
+            self.model.Process(cplx.real, cplx.imag, self.b.real, self.b.imag)
+        with self.assertRaises(ValueError):
+            self.model.ProcessComplex(cplx, self.b)
+        with self.assertRaises(ValueError):
+            self.model.ProcessComplex(packed, Packed(self.b, self.bFmt))
+        cplx, packed = OutOfRange(self.b, self.bFmt)
+        with self.assertRaises(ValueError):
+            self.model.ProcessComplex(self.a, cplx)
+        with self.assertRaises(ValueError):
+            self.model.ProcessComplex(Packed(self.a, FMT), packed)
+
+### psi_fix_complex_addsub ###
+class PsiFixComplexAddSubTest(ProcessComplexTestBase):
+
+    def setUp(self):
+        self.model = psi_fix_complex_addsub(FMT, FMT, FMT, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+        self.a = Signal(100, 1)
+        self.b = Signal(100, 2)
+
+    def test_Complex(self):
+        for addSub in (0, 1):
+            i, q = self.model.Process(self.a.real, self.a.imag, self.b.real, self.b.imag, addSub)
+            res = self.model.ProcessComplex(self.a, self.b, addSub)
+            self.assertArraysEqual([i, q], [res.real, res.imag])
+
+    def test_Packed(self):
+        for addSub in (0, 1):
+            i, q = self.model.Process(self.a.real, self.a.imag, self.b.real, self.b.imag, addSub)
+            res = self.model.ProcessComplex(Packed(self.a, FMT), Packed(self.b, FMT), addSub)
+            self.assertArraysEqual([psi_fix_cplx_pack(i, q, FMT, True)], [res])
+
+    def test_OutOfRange(self):
+        cplx, packed = OutOfRange(self.a, FMT)
+        with self.assertRaises(ValueError):
+            self.model.Process(cplx.real, cplx.imag, self.b.real, self.b.imag, 1)
+        with self.assertRaises(ValueError):
+            self.model.ProcessComplex(cplx, self.b, 1)
+        with self.assertRaises(ValueError):
+            self.model.ProcessComplex(packed, Packed(self.b, FMT), 1)
+        with self.assertRaises(ValueError):
+            self.model.ProcessComplex(Packed(self.a, FMT), packed, 0)
+
+### psi_fix_complex_abs ###
+class PsiFixComplexAbsTest(ProcessComplexTestBase):
+
+    def setUp(self):
+        self.model = psi_fix_complex_abs(FMT, psi_fix_fmt_t(0, 1, 15), psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+        self.data = Signal(100, 1)
+        self.ref = self.model.Process(self.data.real, self.data.imag)
+
+    def test_Complex(self):
+        self.assertArraysEqual([self.ref], [self.model.ProcessComplex(self.data)])
+
+    def test_Packed(self):
+        res = self.model.ProcessComplex(Packed(self.data, FMT))
+        self.assertArraysEqual([psi_fix_get_bits_as_int(self.ref, psi_fix_fmt_t(0, 1, 15))], [res])
+
+    def test_OutOfRange(self):
+        cplx, packed = OutOfRange(self.data, FMT)
+        with self.assertRaises(ValueError):
+            self.model.Process(cplx.real, cplx.imag)
+        with self.assertRaises(ValueError):
+            self.model.ProcessComplex(cplx)
+        with self.assertRaises(ValueError):
+            self.model.ProcessComplex(packed)
+
+    def test_Saturated(self):
+        # Data saturated by psi_fix_cplx_unpack(err_sat=False) gives the same result as saturating I and Q separately
+        data = Signal(100, 3, amplitude=1.5)
+        i, q = psi_fix_cplx_unpack(data, FMT, err_sat=False)
+        ref = self.model.Process(psi_fix_from_real(data.real, FMT, err_sat=False),
+                                 psi_fix_from_real(data.imag, FMT, err_sat=False))
+        self.assertArraysEqual([ref], [self.model.ProcessComplex(i + 1j*q)])
+        self.assertArraysEqual([psi_fix_get_bits_as_int(ref, psi_fix_fmt_t(0, 1, 15))],
+                               [self.model.ProcessComplex(psi_fix_cplx_pack(i, q, FMT, True))])
+
+### psi_fix_cordic_vect ###
+class PsiFixCordicVectTest(ProcessComplexTestBase):
+
+    def setUp(self):
+        self.model = psi_fix_cordic_vect(FMT, psi_fix_fmt_t(0, 1, 16), psi_fix_fmt_t(1, 1, 22), psi_fix_fmt_t(0, 0, 15),
+                                         psi_fix_fmt_t(1, 0, 18), 13, True, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
+        self.data = Signal(100, 1)
+        self.ref = self.model.Process(self.data.real, self.data.imag)
+
+    def test_Complex(self):
+        self.assertArraysEqual(self.ref, self.model.ProcessComplex(self.data))
+
+    def test_Packed(self):
+        expected = (psi_fix_get_bits_as_int(self.ref[0], self.model.outFmt),
+                    psi_fix_get_bits_as_int(self.ref[1], self.model.angleFmt))
+        self.assertArraysEqual(expected, self.model.ProcessComplex(Packed(self.data, FMT)))
+
+    def test_Batch(self):
+        # Leading axes are independent channels
+        data = np.stack([self.data, Signal(100, 2)])
+        absVal, angle = self.model.ProcessComplex(data)
+        for ch in range(2):
+            self.assertArraysEqual(self.model.ProcessComplex(data[ch]), (absVal[ch], angle[ch]))
+
+    def test_OutOfRange(self):
+        cplx, packed = OutOfRange(self.data, FMT)
+        with self.assertRaises(ValueError):
+            self.model.Process(cplx.real, cplx.imag)
+        with self.assertRaises(ValueError):
+            self.model.ProcessComplex(cplx)
+        with self.assertRaises(ValueError):
+            self.model.ProcessComplex(packed)
+
+### psi_fix_cordic_abs_pl ###
+class PsiFixCordicAbsPlTest(ProcessComplexTestBase):
+
+    def setUp(self):
+        self.outFmt = psi_fix_fmt_t(0, 2, 16)
+        self.model = psi_fix_cordic_abs_pl(FMT, self.outFmt, psi_fix_fmt_t(1, 2, 22), 13,
+                                           psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+        self.data = Signal(100, 1)
+        self.ref = self.model.Process(self.data.real, self.data.imag)
+
+    def test_Complex(self):
+        self.assertArraysEqual([self.ref], [self.model.ProcessComplex(self.data)])
+
+    def test_Packed(self):
+        res = self.model.ProcessComplex(Packed(self.data, FMT))
+        self.assertArraysEqual([psi_fix_get_bits_as_int(self.ref, self.outFmt)], [res])
+
+    def test_OutOfRange(self):
+        cplx, packed = OutOfRange(self.data, FMT)
+        with self.assertRaises(ValueError):
+            self.model.Process(cplx.real, cplx.imag)
+        with self.assertRaises(ValueError):
+            self.model.ProcessComplex(cplx)
+        with self.assertRaises(ValueError):
+            self.model.ProcessComplex(packed)
+
+if __name__ == "__main__":
+    unittest.main()
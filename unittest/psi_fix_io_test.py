@@ -0,0 +1,174 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+import sys
+sys.path.append("../model")
+from psi_fix_pkg import *
+from psi_fix_io import *
+
+import unittest
+import tempfile
+import os
+
+########################################################################################################################
+# Test Cases
+########################################################################################################################
+
+### psi_fix_write_columns / psi_fix_read_columns ###
+class PsiFixColumnsTest(unittest.TestCase):
+
+    def test_Write(self):
+        with tempfile.TemporaryDirectory() as d:
+            fileName = os.path.join(d, "data.txt")
+            psi_fix_write_columns(fileName, [(np.array([0.25, -0.5]), psi_fix_fmt_t(1, 2, 2)),
+                                             (np.array([3, 1]), None)], header="a b")
+            with open(fileName) as f:
+                self.assertEqual("# a b\n1 3\n-2 1\n", f.read())
+
+    def test_ReadWrite(self):
+        fmts = [psi_fix_fmt_t(1, 0, 15), psi_fix_fmt_t(0, 3, 4), None]
+        data = [np.array([0.5, -1.0, 2.0**-15]), np.array([0.0, 15.9375, 1.5]), np.array([0, 1, 7])]
+        with tempfile.TemporaryDirectory() as d:
+            fileName = os.path.join(d, "data.txt")
+            psi_fix_write_columns(fileName, zip(data, fmts), header="x")
+            result = psi_fix_read_columns(fileName, fmts)
+        for exp, act in zip(data, result):
+            self.assertEqual(list(exp), list(act))
+
+    def test_DifferentSizesError(self):
+        with self.assertRaises(ValueError):
+            psi_fix_columns_to_int([(np.zeros(3), None), (np.zeros(2), None)])
+
+    def test_IterChunks(self):
+        with tempfile.TemporaryDirectory() as d:
+            fileName = os.path.join(d, "data.txt")
+            with open(fileName, "w") as f:
+                f.write("# a b\n1 2\n3 4\n# c\n5 6\n7 8\n9 10\n")
+            chunks = list(psi_fix_iter_columns(fileName, [None, psi_fix_fmt_t(1, 4, 1)], chunkRows=2))
+        self.assertEqual([2, 2, 1], [len(c[0]) for c in chunks])
+        self.assertEqual([1, 3, 5, 7, 9], np.concatenate([c[0] for c in chunks]).tolist())
+        self.assertEqual([1, 2, 3, 4, 5], np.concatenate([c[1] for c in chunks]).tolist())
+
+    def test_ParseError(self):
+        with tempfile.TemporaryDirectory() as d:
+            fileName = os.path.join(d, "data.txt")
+            with open(fileName, "w") as f:
+                f.write("1 2\n3 x\n")
+            with self.assertRaises(ValueError):
+                psi_fix_read_columns(fileName, [None, None])
+
+    def test_RaggedRows(self):
+        # The total number of values is a multiple of the columns, but the lines are not
+        with tempfile.TemporaryDirectory() as d:
+            fileName = os.path.join(d, "data.txt")
+            for content in ["1 2 3\n4\n", "1\n2 3 4\n", "1 2\n3\n4\n", "# a b\n1 2 3\n\n4\n"]:
+                with open(fileName, "w") as f:
+                    f.write(content)
+                with self.assertRaises(ValueError, msg=content):
+                    psi_fix_read_columns(fileName, [None, None])
+            # Blank lines, other whitespace and a missing final newline are fine
+            with open(fileName, "w") as f:
+                f.write("1 2\n\n  3\t4 \r\n5 6")
+            self.assertEqual([[1, 3, 5], [2, 4, 6]], [c.tolist() for c in psi_fix_read_columns(fileName, [None, None])])
+
+### psi_fix_comparer / psi_fix_compare_files ###
+class PsiFixComparerTest(unittest.TestCase):
+
+    def test_Chunks(self):
+        c = psi_fix_comparer(psi_fix_fmt_t(1, 0, 2), "x")
+        c.Add([0.25, 0.5], [0.25, 0.5])
+        self.assertTrue(c.Passed())
+        c.Add([0.25, 0.5, -0.5], [0.0, 0.5, 0.0])
+        self.assertFalse(c.Passed())
+        self.assertEqual(5, c.samples)
+        self.assertEqual(2, c.mismatches)
+        self.assertEqual(2, c.firstMismatch)
+        self.assertEqual({-1: 1, 0: 3, 2: 1}, c.histogram)
+        self.assertEqual("x: 2 of 5 samples mismatch, first at index 2 (-1 LSB: 1, +2 LSB: 1)", c.Report())
+
+    def test_SizeError(self):
+        with self.assertRaises(ValueError):
+            psi_fix_comparer().Add([1, 2], [1])
+
+    def test_CompareFiles(self):
+        fmts = [psi_fix_fmt_t(1, 2, 2), None]
+        with tempfile.TemporaryDirectory() as d:
+            expName = os.path.join(d, "exp.txt")
+            actName = os.path.join(d, "act.txt")
+            psi_fix_write_columns(expName, [(np.arange(7) / 4, fmts[0]), (np.arange(7), None)], header="a b")
+            psi_fix_write_columns(actName, [(np.arange(7) / 4, fmts[0]), (np.array([0, 1, 2, 3, 4, 4, 6]), None)])
+            result = psi_fix_compare_files(expName, actName, fmts, ["a", "b"], chunkRows=3)
+            self.assertTrue(result[0].Passed())
+            self.assertEqual(7, result[0].samples)
+            self.assertEqual((1, 5, {0: 6, -1: 1}), (result[1].mismatches, result[1].firstMismatch, result[1].histogram))
+            psi_fix_write_columns(actName, [(np.zeros(6), fmts[0]), (np.zeros(6), None)])
+            with self.assertRaises(ValueError):
+                psi_fix_compare_files(expName, actName, fmts)
+
+### psi_fix_bin_file ###
+class PsiFixBinFileTest(unittest.TestCase):
+
+    def test_ReadWrite(self):
+        fmt = psi_fix_fmt_t(1, 0, 15)
+        data = np.array([[0.5, -1.0, 2.0**-15], [0.25, 0.0, -2.0**-15]])
+        for interleaved in (False, True):
+            with tempfile.TemporaryDirectory() as d:
+                fileName = os.path.join(d, "data.bin")
+                psi_fix_bin_file.Write(fileName, data, fmt, interleaved)
+                f = psi_fix_bin_file(fileName)
+                self.assertEqual(np.dtype(np.int16), f.codes.dtype)
+                self.assertEqual((2, 3), (f.channels, f.samples))
+                self.assertEqual(data.tolist(), f.GetData().tolist())
+                self.assertEqual(data[:, 1:].tolist(), f.GetData(1).tolist())
+                self.assertEqual([[16384, -32768], [8192, 0]], f.GetCodes(0, 2).tolist())
+                del f
+
+    def test_CodeType(self):
+        self.assertEqual(np.dtype(np.int8), psi_fix_bin_file.CodeType(psi_fix_fmt_t(1, 3, 4)))
+        self.assertEqual(np.dtype(np.uint16), psi_fix_bin_file.CodeType(psi_fix_fmt_t(0, 4, 5)))
+        self.assertEqual(np.dtype(np.int32), psi_fix_bin_file.CodeType(psi_fix_fmt_t(1, 1, 24)))
+
+    def test_ExportText(self):
+        fmt = psi_fix_fmt_t(1, 2, 2)
+        with tempfile.TemporaryDirectory() as d:
+            binName = os.path.join(d, "data.bin")
+            txtName = os.path.join(d, "data.txt")
+            f = psi_fix_bin_file.Write(binName, np.array([[0.25, -0.5], [1.0, 0.75]]), fmt)
+            self.assertTrue(f.ExportText(txtName, header="a b"))
+            with open(txtName) as t:
+                self.assertEqual("# a b\n1 4\n-2 3\n", t.read())
+            self.assertFalse(f.ExportText(txtName))
+            self.assertTrue(f.ExportText(txtName, force=True))
+            del f
+
+    def test_OutOfRange(self):
+        # Values out of the range of the format are not wrapped silently, the file is not modified
+        fmt = psi_fix_fmt_t(1, 0, 3)
+        with tempfile.TemporaryDirectory() as d:
+            fileName = os.path.join(d, "data.bin")
+            for data in ([[0.5, 1.0]], [[-1.125, 0.0]]):
+                with self.assertRaises(ValueError):
+                    psi_fix_bin_file.Write(fileName, np.array(data), fmt)
+            f = psi_fix_bin_file.Create(fileName, fmt, 1, 2)
+            with self.assertRaises(ValueError):
+                f.SetData(np.array([[0.25, 1.5]]))
+            self.assertEqual([[0, 0]], f.GetCodes().tolist())
+            f.SetData(np.array([[psi_fix_lower_bound(fmt), psi_fix_upper_bound(fmt)]]))
+            self.assertEqual([[-8, 7]], f.GetCodes().tolist())
+            f.SetData(np.zeros((1, 0)))
+            del f
+
+    def test_InvalidFile(self):
+        with tempfile.TemporaryDirectory() as d:
+            fileName = os.path.join(d, "data.bin")
+            with open(fileName, "wb") as f:
+                f.write(b"not a psi_fix file")
+            with self.assertRaises(ValueError):
+                psi_fix_bin_file(fileName)
+
+########################################################################################################################
+# Test Runner
+########################################################################################################################
+if __name__ == "__main__":
+    unittest.main()
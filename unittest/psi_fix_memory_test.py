@@ -0,0 +1,108 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+import sys
+sys.path.append("../model")
+from psi_fix_pkg import *
+from psi_fix_memory import psi_fix_memory_report
+from psi_fix_cic_dec import psi_fix_cic_dec
+from psi_fix_cordic_vect import psi_fix_cordic_vect
+
+import unittest
+
+########################################################################################################################
+# Test Cases
+########################################################################################################################
+MB = 2**20
+
+def Alloc(mb : int):
+    return np.ones(mb*MB//8).sum()
+
+class Outer:
+    def Process(self, inner):
+        Alloc(2)
+        return inner.Process(8)
+
+class Inner:
+    def Process(self, mb):
+        return Alloc(mb)
+
+### psi_fix_memory_report ###
+class PsiFixMemoryReportTest(unittest.TestCase):
+
+    def test_Measure(self):
+        with psi_fix_memory_report() as mem:
+            self.assertEqual(4*MB//8, mem.Measure("alloc", Alloc, 4))
+            mem.Measure("alloc", Alloc, 1)
+        self.assertGreaterEqual(mem.Peak("alloc"), 4*MB)
+        self.assertLess(mem.Peak("alloc"), 5*MB)
+        self.assertEqual(2, mem.stats["alloc"][0])
+        self.assertLess(mem.stats["alloc"][3], 2*MB)
+        self.assertIn("alloc", mem.Report())
+        with self.assertRaises(RuntimeError):
+            mem.Measure("alloc", Alloc, 1)
+
+    def test_Nested(self):
+        outer = Outer()
+        inner = Inner()
+        with psi_fix_memory_report() as mem:
+            mem.Watch(outer)
+            mem.Watch(inner)
+            outer.Process(inner)
+        self.assertGreaterEqual(mem.Peak("Inner.Process"), 8*MB)
+        self.assertLess(mem.Peak("Inner.Process"), 9*MB)
+        self.assertGreaterEqual(mem.Peak("Outer.Process"), 8*MB)
+        # Methods are restored at the end of the with-block
+        self.assertNotIn("Process", vars(outer))
+        outer.Process(inner)
+        self.assertEqual(1, mem.stats["Outer.Process"][0])
+
+    def test_CicStages(self):
+        # Stages are calculated in place, the memory does not grow with the order
+        fmt = psi_fix_fmt_t(1, 0, 15)
+        inp = psi_fix_from_real(np.random.uniform(-0.5, 0.5, 20000), fmt)
+        peaks = []
+        with psi_fix_memory_report() as mem:
+            for order in (2, 6):
+                cic = psi_fix_cic_dec(order, 10, 1, fmt, fmt, True)
+                mem.Measure(str(order), cic.Process, inp)
+                peaks.append(mem.Peak(str(order)))
+        self.assertLess(peaks[1], 1.5*peaks[0])
+
+    def Cordic(self, iterations : int) -> psi_fix_cordic_vect:
+        return psi_fix_cordic_vect(psi_fix_fmt_t(1, 0, 15), psi_fix_fmt_t(0, 1, 16), psi_fix_fmt_t(1, 1, 22),
+                                   psi_fix_fmt_t(0, 0, 15), psi_fix_fmt_t(1, 0, 18), iterations, True,
+                                   psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
+
+    def test_Cordic(self):
+        # Iterations replace their state, the memory does not grow with the number of iterations
+        inFmt = psi_fix_fmt_t(1, 0, 15)
+        np.random.seed(0)
+        i, q = [psi_fix_from_real(np.random.uniform(-0.7, 0.7, 10000), inFmt) for _ in range(2)]
+        with psi_fix_memory_report() as mem:
+            for iterations in (4, 16):
+                absVal, angle = mem.Measure(str(iterations), self.Cordic(iterations).Process, i, q)
+        self.assertTrue(np.allclose(np.abs(i + 1j*q), absVal, atol=1e-3))
+        self.assertLess(mem.Peak("16"), 1.2*mem.Peak("4"))
+
+    def test_CordicStep(self):
+        # Only the branch taken is allocated: compare against selecting between both branches by np.where
+        cordic = self.Cordic(13)
+        np.random.seed(0)
+        x = psi_fix_from_real(np.random.uniform(0.0, 0.7, 100000), cordic.internalFmt)
+        y = psi_fix_from_real(np.random.uniform(-0.7, 0.7, 100000), cordic.internalFmt)
+        def TwoBranchStepX(xLast, yLast, shift):
+            yShifted = psi_fix_shift_right(yLast, cordic.internalFmt, shift, cordic.iterations-1, cordic.internalFmt)
+            yShifted = np.where(yLast < 0, -yShifted, yShifted)
+            return psi_fix_add(xLast, cordic.internalFmt, yShifted, cordic.operandFmt, cordic.internalFmt,
+                               psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
+        # The fast backend adds in place, so the operands dominate the peak (not the temporaries of en_cl_fix)
+        with psi_fix_use_backend("fast"), psi_fix_memory_report() as mem:
+            res = mem.Measure("step", cordic._CordicStepX, x, y, 3)
+            ref = mem.Measure("twoBranch", TwoBranchStepX, x, y, 3)
+        self.assertTrue(np.array_equal(ref, res))
+        self.assertLess(mem.Peak("step"), mem.Peak("twoBranch") - 0.5*x.nbytes)
+
+if __name__ == "__main__":
+    unittest.main()
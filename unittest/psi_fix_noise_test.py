@@ -0,0 +1,65 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+import sys
+sys.path.append("../model")
+from psi_fix_pkg import *
+from psi_fix_white_noise import psi_fix_white_noise
+from psi_fix_noise_awgn import psi_fix_noise_awgn
+
+import unittest
+
+########################################################################################################################
+# Test Cases
+########################################################################################################################
+SEEDS = [0xA38E3C1D, 0x00000001, 0xFFFFFFFF, 0x12345678]
+
+def LfsrReference(outFmt : psi_fix_fmt_t, seed : int, samples : int) -> np.ndarray:
+    # Sample by sample implementation of the LFSR (one LFSR per output bit)
+    bits = psi_fix_size(outFmt)
+    outVec = np.zeros(samples, dtype=np.int64)
+    for bitNr in range(bits):
+        lfsr = (seed + (1 << bitNr)) & 0xFFFFFFFF
+        for i in range(samples):
+            outVec[i] += (lfsr & 0x01) << bitNr
+            fbBit = sum((lfsr >> tap) & 0x01 for tap in (31, 20, 26, 25)) % 2
+            lfsr = ((lfsr << 1) + fbBit) & 0xFFFFFFFF
+    if outFmt.s == 1:
+        outVec = np.where(outVec >= 2**(bits-1), outVec - 2**bits, outVec)
+    return psi_fix_from_bits_as_int(outVec, outFmt)
+
+### psi_fix_white_noise ###
+class PsiFixWhiteNoiseTest(unittest.TestCase):
+
+    def test_Reference(self):
+        for fmt in [psi_fix_fmt_t(1, 0, 15), psi_fix_fmt_t(0, 2, 5), psi_fix_fmt_t(1, 0, 31), psi_fix_fmt_t(0, 0, 1)]:
+            for seed in SEEDS:
+                res = psi_fix_white_noise(fmt, seed).Generate(100)
+                self.assertEqual((100,), res.shape)
+                self.assertTrue(np.array_equal(LfsrReference(fmt, seed, 100), res))
+
+    def test_MultiSeed(self):
+        fmt = psi_fix_fmt_t(1, 0, 11)
+        res = psi_fix_white_noise(fmt, SEEDS).Generate(70)
+        self.assertEqual((len(SEEDS), 70), res.shape)
+        for row, seed in zip(res, SEEDS):
+            self.assertTrue(np.array_equal(LfsrReference(fmt, seed, 70), row))
+
+    def test_ZeroLength(self):
+        fmt = psi_fix_fmt_t(1, 0, 15)
+        self.assertEqual((0,), psi_fix_white_noise(fmt).Generate(0).shape)
+        self.assertEqual((len(SEEDS), 0), psi_fix_white_noise(fmt, SEEDS).Generate(0).shape)
+
+### psi_fix_noise_awgn ###
+class PsiFixNoiseAwgnTest(unittest.TestCase):
+
+    def test_MultiSeed(self):
+        fmt = psi_fix_fmt_t(1, 0, 19)
+        res = psi_fix_noise_awgn(fmt, SEEDS).Generate(500)
+        self.assertEqual((len(SEEDS), 500), res.shape)
+        for row, seed in zip(res, SEEDS):
+            self.assertTrue(np.array_equal(psi_fix_noise_awgn(fmt, seed).Generate(500), row))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+import sys
+sys.path.append("../model")
+from psi_fix_pkg import *
+from psi_fix_pipeline import psi_fix_pipeline
+from psi_fix_fir import psi_fix_fir
+from psi_fix_mov_avg import psi_fix_mov_avg
+from psi_fix_demod_real2cplx import psi_fix_demod_real2cplx
+from psi_fix_cic_dec import psi_fix_cic_dec
+from psi_fix_phase_unwrap import psi_fix_phase_unwrap
+
+import unittest
+
+########################################################################################################################
+# Test Cases
+########################################################################################################################
+FMT = psi_fix_fmt_t(1, 0, 15)
+DEMOD_FMT = psi_fix_fmt_t(1, 0, 16)
+
+def Signal(samples : int) -> np.ndarray:
+    np.random.seed(1)
+    return psi_fix_from_real(np.random.uniform(-0.9, 0.9, samples), FMT)
+
+### psi_fix_pipeline ###
+class PsiFixPipelineTest(unittest.TestCase):
+
+    def test_FormatCheck(self):
+        p = psi_fix_pipeline(FMT, 16)
+        p.Add("a", lambda x: x, psi_fix_fmt_t(1, 1, 16), psi_fix_fmt_t(0, 0, 8))
+        p.Add("b", lambda x: x, psi_fix_fmt_t(1, 0, 8), psi_fix_fmt_t(1, 0, 8))
+        p.Build()
+        p.Add("c", lambda x: x, psi_fix_fmt_t(1, 0, 7), psi_fix_fmt_t(1, 0, 8))
+        with self.assertRaises(ValueError):
+            p.Build()
+        p = psi_fix_pipeline((FMT, FMT), 16)
+        p.Add("a", lambda x: x, (FMT, FMT, None), FMT)
+        with self.assertRaises(ValueError):
+            p.Build()
+
+    def test_RateCheck(self):
+        p = psi_fix_pipeline(FMT, 12)
+        p.Add("a", lambda x: x[::2], FMT, FMT, decimation=2)
+        p.Add("b", lambda x: x[::4], FMT, FMT, decimation=4)
+        with self.assertRaises(ValueError):
+            p.Build()
+        # Declared rate does not match the stage output
+        p = psi_fix_pipeline(FMT, 12)
+        p.Add("a", lambda x: x[::3], FMT, FMT, decimation=2)
+        with self.assertRaises(ValueError):
+            p.Process(Signal(24))
+
+    def test_History(self):
+        coefs = np.linspace(-0.5, 0.5, 15)
+        fir = psi_fix_fir(FMT, FMT, psi_fix_fmt_t(1, 0, 17))
+        inp = Signal(1000)
+        p = psi_fix_pipeline(FMT, 100)
+        p.Add("fir", lambda x: fir.Filter(x, 2, coefs), FMT, FMT, decimation=2, history=16)
+        self.assertTrue(np.array_equal(fir.Filter(inp, 2, coefs), p.Process(inp)))
+
+    def test_Chain(self):
+        inp = Signal(2400)
+        # Reference: processing of the whole signal
+        demod = psi_fix_demod_real2cplx(FMT, DEMOD_FMT, 25, 5, 1)
+        cic = psi_fix_cic_dec(3, 4, 1, DEMOD_FMT, DEMOD_FMT, True)
+        movAvg = psi_fix_mov_avg(DEMOD_FMT, DEMOD_FMT, 3)
+        unwrap = psi_fix_phase_unwrap(DEMOD_FMT, psi_fix_fmt_t(1, 3, 16), psi_fix_rnd_t.round)
+        i, q = demod.Process(inp, 0)
+        ref = unwrap.Process(movAvg.Process(cic.Process(i)))[0]
+        for threaded in (False, True):
+            p = psi_fix_pipeline(FMT, 240, threaded=threaded, queueDepth=2)
+            p.Add("demod", lambda x: demod.Process(x, 0, continueState=True)[0], FMT, DEMOD_FMT, reset=demod.Reset)
+            p.Add("cic", lambda x: cic.Process(x, continueState=True), DEMOD_FMT, DEMOD_FMT, decimation=4,
+                  reset=cic.Reset)
+            p.Add("avg", lambda x: movAvg.Process(x, continueState=True), DEMOD_FMT, DEMOD_FMT, reset=movAvg.Reset)
+            p.Add("unwrap", lambda x: unwrap.Process(x, continueState=True)[0], DEMOD_FMT, psi_fix_fmt_t(1, 3, 16),
+                  reset=unwrap.Reset)
+            self.assertTrue(np.array_equal(ref, p.Process(inp)))
+            # Process() starts from reset state again
+            self.assertTrue(np.array_equal(ref, p.Process(inp)))
+
+    def test_TupleData(self):
+        p = psi_fix_pipeline((FMT, FMT), 8, threaded=True)
+        p.Add("swap", lambda iq: (iq[1], iq[0]), (FMT, FMT), (FMT, FMT))
+        a, b = Signal(32), Signal(32) / 2
+        outB, outA = p.Process((a, b))
+        self.assertTrue(np.array_equal(a, outA))
+        self.assertTrue(np.array_equal(b, outB))
+
+    def test_ThreadedError(self):
+        def Fail(x):
+            raise RuntimeError("stage failed")
+        p = psi_fix_pipeline(FMT, 8, threaded=True, queueDepth=1)
+        p.Add("a", lambda x: x, FMT, FMT)
+        p.Add("b", Fail, FMT, FMT)
+        with self.assertRaises(RuntimeError):
+            p.Process(Signal(1000))
+
+if __name__ == "__main__":
+    unittest.main()
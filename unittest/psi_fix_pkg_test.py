@@ -6,8 +6,12 @@
 import sys
 sys.path.append("../model")
 from psi_fix_pkg import *
+from psi_fix_fir import psi_fix_fir
 
 import unittest
+import tempfile
+import tracemalloc
+import os
 
 ########################################################################################################################
 # Test Cases
@@ -606,9 +610,433 @@ class PsiFixInRangeTest(unittest.TestCase):
     def test_Rounding_InRange2(self):
         self.assertEqual(True, psi_fix_in_range(15.5, psi_fix_fmt_t(0,4,2), psi_fix_fmt_t(0,5,0), psi_fix_rnd_t.round))
 
+### psi_fix_cplx_unpack / psi_fix_cplx_pack ###
+class PsiFixCplxPackTest(unittest.TestCase):
+
+    def test_Unpack_Complex(self):
+        i, q = psi_fix_cplx_unpack(np.array([0.26+1.1j, -0.5-0.24j]), psi_fix_fmt_t(1, 2, 2))
+        self.assertEqual([0.25, -0.5], list(i))
+        self.assertEqual([1.0, -0.25], list(q))
+
+    def test_Unpack_Packed(self):
+        i, q = psi_fix_cplx_unpack(np.array([1, 4, -2, -1]), psi_fix_fmt_t(1, 2, 2))
+        self.assertEqual([0.25, -0.5], list(i))
+        self.assertEqual([1.0, -0.25], list(q))
+
+    def test_Unpack_OutOfRangeError(self):
+        with self.assertRaises(ValueError):
+            psi_fix_cplx_unpack(np.array([16, 0]), psi_fix_fmt_t(1, 2, 2))
+        with self.assertRaises(ValueError):
+            psi_fix_cplx_unpack(np.array([4.2+0j]), psi_fix_fmt_t(1, 2, 2))
+
+    def test_Pack(self):
+        self.assertEqual([1, 4, -2, -1], list(psi_fix_cplx_pack(np.array([0.25, -0.5]), np.array([1.0, -0.25]), psi_fix_fmt_t(1, 2, 2), True)))
+        self.assertEqual([0.25+1.0j, -0.5-0.25j], list(psi_fix_cplx_pack(np.array([0.25, -0.5]), np.array([1.0, -0.25]), psi_fix_fmt_t(1, 2, 2), False)))
+
+### psi_fix_write_if_changed ###
+class PsiFixWriteIfChangedTest(unittest.TestCase):
+
+    def test_WriteOnlyOnChange(self):
+        with tempfile.TemporaryDirectory() as d:
+            fileName = os.path.join(d, "test.vhd")
+            self.assertEqual(True, psi_fix_write_if_changed(fileName, "abc"))
+            self.assertEqual(False, psi_fix_write_if_changed(fileName, "abc"))
+            self.assertEqual(True, psi_fix_write_if_changed(fileName, "abcd"))
+            with open(fileName) as f:
+                self.assertEqual("abcd", f.read())
+
+    def test_Bytes(self):
+        # The file contains exactly the encoded content (no newline translation), so it is unchanged when rewritten
+        content = "-- \u00e4\nline\r\nend\n"
+        with tempfile.TemporaryDirectory() as d:
+            fileName = os.path.join(d, "test.vhd")
+            self.assertEqual(True, psi_fix_write_if_changed(fileName, content))
+            with open(fileName, "rb") as f:
+                self.assertEqual(content.encode(), f.read())
+            self.assertEqual(False, psi_fix_write_if_changed(fileName, content))
+
+### psi_fix_profiler ###
+class PsiFixProfilerTest(unittest.TestCase):
+
+    def test_Record(self):
+        fmt = psi_fix_fmt_t(1, 2, 2)
+        with psi_fix_profiler() as prof:
+            psi_fix_add(np.zeros(10), fmt, 0.5, fmt, fmt)
+            psi_fix_add(np.zeros(5), fmt, 0.5, fmt, fmt)
+            psi_fix_add(1.0, fmt, 0.5, fmt, fmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+        self.assertEqual(2, len(prof.stats))
+        calls, elements, _ = prof.stats[("psi_fix_add", "a_fmt=(1, 2, 2) b_fmt=(1, 2, 2) r_fmt=(1, 2, 2) trunc wrap")]
+        self.assertEqual((2, 15), (calls, elements))
+        calls, elements, _ = prof.stats[("psi_fix_add", "a_fmt=(1, 2, 2) b_fmt=(1, 2, 2) r_fmt=(1, 2, 2) round sat")]
+        self.assertEqual((1, 1), (calls, elements))
+        report = prof.Report(sortBy="elements").splitlines()
+        self.assertEqual(3, len(report))
+        self.assertIn("trunc wrap", report[1])
+
+    def test_Disabled(self):
+        fmt = psi_fix_fmt_t(1, 2, 2)
+        with psi_fix_profiler() as prof:
+            pass
+        psi_fix_resize(0.5, fmt, fmt)
+        self.assertEqual({}, prof.stats)
+
+    def test_Nested(self):
+        fmt = psi_fix_fmt_t(1, 2, 2)
+        with psi_fix_profiler() as outer:
+            with psi_fix_profiler() as inner:
+                psi_fix_neg(0.5, fmt, fmt)
+            psi_fix_abs(0.5, fmt, fmt)
+        self.assertEqual(["psi_fix_neg"], [k[0] for k in inner.stats])
+        self.assertEqual(["psi_fix_abs"], [k[0] for k in outer.stats])
+
+### psi_fix_sat_monitor ###
+class PsiFixSatMonitorTest(unittest.TestCase):
+
+    def _Stage(self, mon, name):
+        return [v for k, v in mon.stats.items() if k[1] == name]
+
+    def test_Events(self):
+        fmt = psi_fix_fmt_t(1, 1, 2)
+        with psi_fix_sat_monitor() as mon:
+            psi_fix_add(np.array([1.5, 1.0, -1.0]), fmt, np.array([0.5, 0.5, -1.25]), fmt, fmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.sat)
+            psi_fix_mult(np.array([1.5, 0.5]), fmt, np.array([1.5, 0.5]), fmt, fmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.wrap)
+            psi_fix_resize(np.array([1.875, 1.625]), psi_fix_fmt_t(1, 1, 3), fmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+            psi_fix_resize(np.array([1.875, 1.625]), psi_fix_fmt_t(1, 1, 3), fmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.sat)
+            psi_fix_shift_left(np.array([1.0, 1.0]), fmt, np.array([1, 0]), 1, fmt)
+        self.assertEqual([[3, 2, 0]], self._Stage(mon, "psi_fix_add"))
+        self.assertEqual([[2, 0, 1]], self._Stage(mon, "psi_fix_mult"))
+        self.assertEqual([[2, 1, 0], [2, 0, 0]], self._Stage(mon, "psi_fix_resize"))
+        self.assertEqual([[2, 0, 1]], self._Stage(mon, "psi_fix_shift_left"))
+        self.assertEqual(5, mon.Events())
+
+    def test_ModelStages(self):
+        class Model:
+            def Process(self, x):
+                return psi_fix_neg(x, psi_fix_fmt_t(1, 0, 2), psi_fix_fmt_t(1, 0, 2), psi_fix_rnd_t.trunc, psi_fix_sat_t.sat)
+        with psi_fix_sat_monitor() as mon:
+            Model().Process(np.array([-1.0, -0.5, 0.0]))
+            psi_fix_neg(np.array([-1.0]), psi_fix_fmt_t(1, 0, 2), psi_fix_fmt_t(1, 0, 2))
+        self.assertEqual(2, mon.Events())
+        stages = mon.ForModel(Model)
+        self.assertEqual(1, len(stages))
+        (loc, name, _), counters = list(stages.items())[0]
+        self.assertTrue(loc.startswith("Model.Process:"))
+        self.assertEqual([3, 1, 0], counters)
+        self.assertIn("Model.Process:", mon.Report().splitlines()[1])
+
+    def test_FirSatDetect(self):
+        # Positive and negative overflow at the output of the FIR must both be flagged
+        fir = psi_fix_fir(psi_fix_fmt_t(1, 0, 15), psi_fix_fmt_t(1, 0, 15), psi_fix_fmt_t(1, 0, 17))
+        inp = np.array([0.5, -0.9, -0.9, -0.9, 0.0, 0.9, 0.9, 0.2, 0.0])
+        with psi_fix_sat_monitor() as mon:
+            sat, outp = fir.FilterSatDetect(inp, 1, [0.625, 0.625])
+        self.assertEqual([0, 0, 1, 1, 0, 0, 1, 0, 0], list(sat))
+        self.assertEqual(-1.0, outp[2])
+        self.assertEqual(psi_fix_upper_bound(psi_fix_fmt_t(1, 0, 15)), outp[6])
+        self.assertEqual(3, sum(c[1] for c in mon.ForModel(psi_fix_fir).values()))
+
+    def test_Disabled(self):
+        fmt = psi_fix_fmt_t(1, 0, 2)
+        with psi_fix_sat_monitor() as mon:
+            pass
+        psi_fix_resize(2.0, psi_fix_fmt_t(1, 2, 2), fmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.sat)
+        self.assertEqual(0, mon.Events())
+
+### psi_fix_parallel ###
+class PsiFixParallelTest(unittest.TestCase):
+
+    def test_Identical(self):
+        np.random.seed(0)
+        a = np.random.uniform(-4, 4, 1000)
+        b = np.random.uniform(-4, 4, (3, 1))
+        fmt = psi_fix_fmt_t(1, 2, 10)
+        rFmt = psi_fix_fmt_t(1, 1, 5)
+        ref = psi_fix_mult(a, fmt, b, fmt, rFmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+        refBits = psi_fix_get_bits_as_int(ref, rFmt)
+        refShift = psi_fix_shift_left(a, fmt, np.arange(1000) % 3, 2, rFmt)
+        with psi_fix_parallel(threads=4, chunkSize=64, minSize=100):
+            res = psi_fix_mult(a, fmt, b, fmt, rFmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+            resBits = psi_fix_get_bits_as_int(res, rFmt)
+            resShift = psi_fix_shift_left(a, fmt, np.arange(1000) % 3, 2, rFmt)
+            small = psi_fix_add(a[:10], fmt, 1.0, fmt, fmt)
+        self.assertTrue(np.array_equal(ref, res))
+        self.assertTrue(np.array_equal(refBits, resBits))
+        self.assertEqual(refBits.dtype, resBits.dtype)
+        self.assertTrue(np.array_equal(refShift, resShift))
+        self.assertTrue(np.array_equal(psi_fix_add(a[:10], fmt, 1.0, fmt, fmt), small))
+
+    def test_Error(self):
+        with psi_fix_parallel(threads=2, chunkSize=16, minSize=16):
+            with self.assertRaises(ValueError):
+                psi_fix_from_real(np.linspace(0, 2, 100), psi_fix_fmt_t(1, 0, 8))
+
+    def test_WithProfiler(self):
+        fmt = psi_fix_fmt_t(1, 2, 2)
+        with psi_fix_profiler() as prof, psi_fix_parallel(threads=2, chunkSize=16, minSize=16):
+            psi_fix_add(np.zeros(100), fmt, 0.5, fmt, fmt)
+        calls, elements, _ = prof.stats[("psi_fix_add", "a_fmt=(1, 2, 2) b_fmt=(1, 2, 2) r_fmt=(1, 2, 2) trunc wrap")]
+        self.assertEqual((1, 100), (calls, elements))
+
+### out parameter ###
+class PsiFixOutTest(unittest.TestCase):
+
+    def test_InPlace(self):
+        np.random.seed(1)
+        aFmt = psi_fix_fmt_t(1, 2, 10)
+        bFmt = psi_fix_fmt_t(0, 1, 6)
+        rFmt = psi_fix_fmt_t(1, 1, 4)
+        a = psi_fix_from_real(np.random.uniform(-4, 4, 500), aFmt)
+        b = psi_fix_from_real(np.random.uniform(0, 1.9, 500), bFmt)
+        shift = np.arange(500) % 3
+        for rnd in psi_fix_rnd_t:
+            for sat in psi_fix_sat_t:
+                calls = [lambda o: psi_fix_resize(a, aFmt, rFmt, rnd, sat, out=o),
+                         lambda o: psi_fix_add(a, aFmt, b, bFmt, rFmt, rnd, sat, out=o),
+                         lambda o: psi_fix_sub(a, aFmt, b, bFmt, rFmt, rnd, sat, out=o),
+                         lambda o: psi_fix_mult(a, aFmt, b, bFmt, rFmt, rnd, sat, out=o),
+                         lambda o: psi_fix_abs(a, aFmt, rFmt, rnd, sat, out=o),
+                         lambda o: psi_fix_neg(a, aFmt, rFmt, rnd, sat, out=o),
+                         lambda o: psi_fix_shift_left(a, aFmt, shift, 2, rFmt, rnd, sat, out=o),
+                         lambda o: psi_fix_shift_right(a, aFmt, shift, 2, rFmt, rnd, sat, out=o)]
+                for call in calls:
+                    out = np.empty(500)
+                    self.assertIs(out, call(out))
+                    self.assertTrue(np.array_equal(call(None), out))
+
+    def test_Alias(self):
+        fmt = psi_fix_fmt_t(1, 3, 4)
+        a = np.array([1.5, -2.25, 7.0])
+        psi_fix_add(a, fmt, a, fmt, fmt, psi_fix_rnd_t.trunc, psi_fix_sat_t.sat, out=a)
+        self.assertEqual([3.0, -4.5, psi_fix_upper_bound(fmt)], list(a))
+
+    def test_Wide(self):
+        # Formats that are not exact in double precision are calculated by en_cl_fix and copied
+        fmt = psi_fix_fmt_t(1, 20, 20)
+        a = np.array([1.5, -2.25])
+        out = np.empty(2)
+        self.assertIs(out, psi_fix_mult(a, fmt, a, fmt, fmt, out=out))
+        self.assertEqual([2.25, 5.0625], list(out))
+
+    def test_Misaligned(self):
+        # The exact sum of operands with different binary point positions is wider than both operands
+        aFmt = psi_fix_fmt_t(1, 40, 0)
+        bFmt = psi_fix_fmt_t(1, 0, 40)
+        rFmt = psi_fix_fmt_t(1, 41, 0)
+        a = np.array([2.0**39, -2.0**39])
+        b = np.array([-2.0**-40, 2.0**-40])
+        for backend in ("reference", "fast"):
+            with psi_fix_use_backend(backend):
+                out = np.empty(2)
+                psi_fix_add(a, aFmt, b, bFmt, rFmt, out=out)
+                self.assertEqual([2.0**39 - 1, -2.0**39], list(out))
+                self.assertTrue(np.array_equal(psi_fix_add(a, aFmt, b, bFmt, rFmt), out))
+                psi_fix_sub(a, aFmt, -b, bFmt, rFmt, out=out)
+                self.assertEqual([2.0**39 - 1, -2.0**39], list(out))
+
+### psi_fix_workspace ###
+class PsiFixWorkspaceTest(unittest.TestCase):
+
+    def test_Reuse(self):
+        ws = psi_fix_workspace()
+        buf = ws.Get("a", 10)
+        self.assertIs(buf, ws.Get("a", (10,)))
+        self.assertIsNot(buf, ws.Get("a", (2, 5)))
+        self.assertEqual(80, ws.Nbytes())
+        ws.Clear()
+        self.assertEqual(0, ws.Nbytes())
+
+    def test_Disabled(self):
+        ws = psi_fix_workspace(enabled=False)
+        self.assertIsNot(ws.Get("a", 10), ws.Get("a", 10))
+        self.assertEqual(0, ws.Nbytes())
+
+### psi_fix_compact ###
+class PsiFixCompactTest(unittest.TestCase):
+
+    def test_Storage(self):
+        self.assertEqual(np.int8, psi_fix_compact.CodeType(psi_fix_fmt_t(1, 2, 5)))
+        self.assertEqual(np.uint16, psi_fix_compact.CodeType(psi_fix_fmt_t(0, 1, 15)))
+        self.assertEqual(np.int32, psi_fix_compact.CodeType(psi_fix_fmt_t(1, 0, 17)))
+        self.assertIsNone(psi_fix_compact.CodeType(psi_fix_fmt_t(1, 8, 24)))
+        self.assertEqual(np.float32, psi_fix_compact.CodeType(psi_fix_fmt_t(1, 0, 23), useFloat32=True))
+        self.assertIsNone(psi_fix_compact.CodeType(psi_fix_fmt_t(1, 0, 24), useFloat32=True))
+        fmt = psi_fix_fmt_t(1, 0, 15)
+        data = np.array([[-1.0, 0.5], [2**-15, 1-2**-15]])
+        for useFloat32 in (False, True):
+            c = psi_fix_compact(data, fmt, useFloat32)
+            self.assertEqual(8 if not useFloat32 else 16, c.nbytes)
+            self.assertEqual((2, 2), c.shape)
+            self.assertTrue(np.array_equal(data, c.ToReal()))
+            self.assertEqual(0.5, c[0, 1])
+            self.assertTrue(np.array_equal(data[1], np.asarray(c[1])))
+            c[0] = [0.25, -0.25]
+            self.assertEqual([0.25, -0.25], list(np.asarray(c[0])))
+        with self.assertRaises(ValueError):
+            psi_fix_compact([2**-16], fmt)
+        with self.assertRaises(ValueError):
+            psi_fix_compact([1.0], fmt)
+        with self.assertRaises(ValueError):
+            psi_fix_compact([1.0], psi_fix_fmt_t(1, 10, 30))
+
+    def test_Promote(self):
+        fmt = psi_fix_fmt_t(1, 2, 4)
+        data = np.array([1.5, -2.25, 3.0])
+        c = psi_fix_compact(data, fmt)
+        self.assertTrue(np.array_equal(data * 2, c * 2))
+        self.assertTrue(np.array_equal(np.cumsum(data), np.cumsum(c)))
+        self.assertTrue(np.array_equal(np.concatenate((data, data)), np.concatenate((c, c))))
+        self.assertTrue(np.array_equal(psi_fix_add(data, fmt, data, fmt, fmt), psi_fix_add(c, fmt, c, fmt, fmt)))
+
+    def test_Mode(self):
+        fmt = psi_fix_fmt_t(1, 2, 4)
+        data = np.array([1.5, -2.25, 3.0])
+        with psi_fix_compact_mode():
+            res = psi_fix_mult(data, fmt, data, fmt, psi_fix_fmt_t(1, 4, 8))
+            wide = psi_fix_mult(data, fmt, data, fmt, psi_fix_fmt_t(1, 30, 8))
+            bits = psi_fix_get_bits_as_int(data, fmt)
+            scalar = psi_fix_add(1.0, fmt, 0.5, fmt, fmt)
+        self.assertIsInstance(res, psi_fix_compact)
+        self.assertEqual(np.int16, res.codes.dtype)
+        self.assertTrue(np.array_equal(data * data, res))
+        self.assertIsInstance(wide, np.ndarray)
+        self.assertIsInstance(bits, np.ndarray)
+        self.assertEqual(1.5, scalar)
+
 ########################################################################################################################
 # Test Runner
 ########################################################################################################################
+### Backends ###
+class _OffByOneBackend(psi_fix_backend_ref):
+    # Broken backend for the differential check
+    def Add(self, a, a_fmt, b, b_fmt, r_fmt, rnd, sat, out):
+        return super().Add(a, a_fmt, b, b_fmt, r_fmt, rnd, sat, out) + 2.0**-r_fmt.f
+
+class PsiFixBackendTest(unittest.TestCase):
+
+    def test_Select(self):
+        before = psi_fix_get_backend()
+        with psi_fix_use_backend("fast") as backend:
+            self.assertIsInstance(backend, psi_fix_backend_fast)
+            self.assertIs(backend, psi_fix_get_backend())
+            with psi_fix_use_backend("reference"):
+                self.assertEqual(psi_fix_backend_ref, type(psi_fix_get_backend()))
+            self.assertIs(backend, psi_fix_get_backend())
+        self.assertIs(before, psi_fix_get_backend())
+        with self.assertRaises(ValueError):
+            psi_fix_set_backend("unknown")
+        if os.environ.get("PSI_FIX_BACKEND") is None and os.environ.get("PSI_FIX_BACKEND_CHECK") is None:
+            self.assertIsInstance(before, psi_fix_backend_inplace)
+
+    def test_Fast(self):
+        np.random.seed(2)
+        aFmt = psi_fix_fmt_t(1, 2, 10)
+        bFmt = psi_fix_fmt_t(0, 1, 6)
+        rFmt = psi_fix_fmt_t(1, 1, 4)
+        a = psi_fix_from_real(np.random.uniform(-4, 4, 300), aFmt)
+        b = psi_fix_from_real(np.random.uniform(0, 1.9, 300), bFmt)
+        for rnd in psi_fix_rnd_t:
+            for sat in psi_fix_sat_t:
+                calls = [lambda: psi_fix_resize(a, aFmt, rFmt, rnd, sat),
+                         lambda: psi_fix_add(a, aFmt, b, bFmt, rFmt, rnd, sat),
+                         lambda: psi_fix_sub(a, aFmt, b[0], bFmt, rFmt, rnd, sat),
+                         lambda: psi_fix_mult(a, aFmt, b, bFmt, rFmt, rnd, sat),
+                         lambda: psi_fix_abs(a, aFmt, rFmt, rnd, sat),
+                         lambda: psi_fix_neg(a, aFmt, rFmt, rnd, sat),
+                         lambda: psi_fix_shift_right(a, aFmt, np.arange(300) % 3, 2, rFmt, rnd, sat),
+                         lambda: psi_fix_shift_left(a[0], aFmt, 1, 2, rFmt, rnd, sat)]
+                for call in calls:
+                    with psi_fix_use_backend("reference"):
+                        ref = call()
+                    with psi_fix_use_backend("fast"):
+                        res = call()
+                    self.assertTrue(np.array_equal(ref, res))
+                    self.assertEqual(np.shape(ref), np.shape(res))
+        # Wide formats are calculated by the reference backend
+        wide = psi_fix_fmt_t(1, 30, 30)
+        with psi_fix_use_backend("fast"):
+            self.assertEqual(2.0**29, psi_fix_mult(2.0**15, wide, 2.0**14, wide, wide))
+
+    def test_InPlaceMemory(self):
+        # With out, the default and the fast backend need no memory in the size of the data (only for the range/grid
+        # check in chunks)
+        fmt = psi_fix_fmt_t(1, 3, 12)
+        a = psi_fix_from_real(np.linspace(-4, 4, 1 << 20), fmt)
+        out = np.empty_like(a)
+        for backend in ("inplace", "fast"):
+            with psi_fix_use_backend(backend):
+                tracemalloc.start()
+                psi_fix_add(a, fmt, a, fmt, fmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat, out=out)
+                psi_fix_mult(out, fmt, a, fmt, fmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat, out=out)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                self.assertLess(peak, a.nbytes // 8, backend)
+        # Without out, the default backend calculates by en_cl_fix
+        with psi_fix_use_backend(psi_fix_backend_diff("inplace")) as diff:
+            psi_fix_add(a, fmt, a, fmt, fmt, out=out)
+            self.assertTrue(np.array_equal(psi_fix_add(a, fmt, a, fmt, fmt), out))
+        self.assertEqual(2, diff.checked)
+
+    def test_Register(self):
+        psi_fix_register_backend("off_by_one", _OffByOneBackend())
+        with psi_fix_use_backend("off_by_one"):
+            self.assertEqual(0.75, psi_fix_add(0.25, psi_fix_fmt_t(1, 0, 2), 0.25, psi_fix_fmt_t(1, 0, 2),
+                                               psi_fix_fmt_t(1, 0, 2)))
+            # Operations not overridden fall back to the reference
+            self.assertEqual(0.0, psi_fix_sub(0.25, psi_fix_fmt_t(1, 0, 2), 0.25, psi_fix_fmt_t(1, 0, 2),
+                                              psi_fix_fmt_t(1, 0, 2)))
+
+    def test_Diff(self):
+        fmt = psi_fix_fmt_t(1, 3, 8)
+        a = psi_fix_from_real(np.linspace(-4, 4, 100), fmt)
+        with psi_fix_use_backend(psi_fix_backend_diff("fast")) as diff:
+            psi_fix_add(a, fmt, a, fmt, fmt, out=a)
+            psi_fix_mult(a, fmt, a, fmt, fmt, psi_fix_rnd_t.round, psi_fix_sat_t.sat)
+        self.assertEqual((2, 2), (diff.calls, diff.checked))
+        with psi_fix_use_backend(psi_fix_backend_diff(_OffByOneBackend(), every=2)) as diff:
+            with self.assertRaises(BittruenessNotGuaranteed):
+                psi_fix_add(a, fmt, a, fmt, fmt)
+            psi_fix_add(a, fmt, a, fmt, fmt)     # Not checked
+            with self.assertRaises(BittruenessNotGuaranteed):
+                psi_fix_add(a, fmt, a, fmt, fmt)
+        self.assertEqual((3, 2), (diff.calls, diff.checked))
+        # Operands with different binary point positions
+        aFmt = psi_fix_fmt_t(1, 40, 0)
+        bFmt = psi_fix_fmt_t(1, 0, 40)
+        with psi_fix_use_backend(psi_fix_backend_diff("fast")) as diff:
+            psi_fix_add(np.array([2.0**39, -3.0]), aFmt, np.array([-2.0**-40, 0.5]), bFmt, psi_fix_fmt_t(1, 41, 0))
+            psi_fix_sub(2.0**39, aFmt, 2.0**-40, bFmt, psi_fix_fmt_t(1, 41, 0))
+            psi_fix_sub(0.25, psi_fix_fmt_t(0, 20, 2), -2.0**-30, psi_fix_fmt_t(1, 0, 30), psi_fix_fmt_t(1, 20, 30))
+        self.assertEqual(3, diff.checked)
+
+    def test_EmptyShift(self):
+        fmt = psi_fix_fmt_t(1, 3, 8)
+        for backend in ("reference", "fast"):
+            with psi_fix_use_backend(backend):
+                self.assertEqual((0,), np.shape(psi_fix_shift_left(np.zeros(0), fmt, np.zeros(0, int), 2, fmt)))
+                out = np.empty(0)
+                self.assertIs(out, psi_fix_shift_right(np.zeros(0), fmt, np.zeros(0, int), 2, fmt, out=out))
+
+    def test_OffGrid(self):
+        # Models passing raw (unquantized) values to the psi_fix_pkg functions must give the reference results
+        from psi_fix_bin_div import psi_fix_bin_div
+        from psi_fix_phase_unwrap import psi_fix_phase_unwrap
+        np.random.seed(3)
+        num = np.random.uniform(-2, 2, 200)
+        denom = np.random.uniform(0.1, 2, 200)
+        phase = np.random.uniform(-1, 1, 200)
+        divFmt = (psi_fix_fmt_t(1, 1, 10), psi_fix_fmt_t(1, 1, 8), psi_fix_fmt_t(1, 4, 10))
+        unwrap = psi_fix_phase_unwrap(psi_fix_fmt_t(1, 0, 15), psi_fix_fmt_t(1, 5, 15), psi_fix_rnd_t.round)
+        with psi_fix_use_backend("reference"):
+            refDiv = psi_fix_bin_div(num, divFmt[0], denom, divFmt[1], divFmt[2], psi_fix_rnd_t.trunc, psi_fix_sat_t.sat)
+            refUnwrap = unwrap.Process(phase)
+        with psi_fix_use_backend(psi_fix_backend_diff("fast")) as diff:
+            div = psi_fix_bin_div(num, divFmt[0], denom, divFmt[1], divFmt[2], psi_fix_rnd_t.trunc, psi_fix_sat_t.sat)
+            res = unwrap.Process(phase)
+        self.assertGreater(diff.checked, 0)
+        self.assertTrue(np.array_equal(refDiv, div))
+        self.assertTrue(np.array_equal(refUnwrap[0], res[0]))
+        self.assertTrue(np.array_equal(refUnwrap[1], res[1]))
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,100 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+import sys
+sys.path.append("../model")
+from psi_fix_pkg import *
+from psi_fix_pkg_writer import psi_fix_pkg_writer, VhdlType
+
+import unittest
+import tempfile
+
+########################################################################################################################
+# Test Cases
+########################################################################################################################
+def WriteAndRead(writer : psi_fix_pkg_writer) -> str:
+    with tempfile.TemporaryDirectory() as tmp:
+        writer.WritePkg("test_pkg", tmp)
+        with open(tmp + "/test_pkg.vhd") as f:
+            return f.read()
+
+### psi_fix_pkg_writer ###
+class PsiFixPkgWriterTest(unittest.TestCase):
+
+    def test_Constants(self):
+        w = psi_fix_pkg_writer()
+        w.AddConstant("Int_c", 3, VhdlType.INTEGER)
+        w.AddConstant("IntFloat_c", -7.0, VhdlType.INTEGER)
+        w.AddConstant("Real_c", 0.25, VhdlType.REAL)
+        content = WriteAndRead(w)
+        self.assertIn("package test_pkg is", content)
+        self.assertIn("\tconstant Int_c : integer := 3;\n", content)
+        self.assertIn("\tconstant IntFloat_c : integer := -7;\n", content)
+        self.assertIn("\tconstant Real_c : real := 0.25;\n", content)
+
+    def test_Arrays(self):
+        w = psi_fix_pkg_writer()
+        w.AddArray("Int_c", [1, -2, 3], VhdlType.INTEGER)
+        w.AddArray("IntFloat2d_c", np.array([[1.0, -2.0], [3.0, 4.0]]), VhdlType.INTEGER)
+        w.AddArray("Real_c", [0.5, -1.25], VhdlType.REAL)
+        content = WriteAndRead(w)
+        self.assertIn("\tconstant Int_c : t_ainteger(0 to 2) := (\n\t\t1,\n\t\t-2,\n\t\t3);\n", content)
+        self.assertIn("\tconstant IntFloat2d_c : t_ainteger(0 to 3) := (\n\t\t1,\n\t\t-2,\n\t\t3,\n\t\t4);\n", content)
+        self.assertIn("\tconstant Real_c : t_areal(0 to 1) := (\n\t\t0.5,\n\t\t-1.25);\n", content)
+
+    def test_Chunks(self):
+        w = psi_fix_pkg_writer()
+        w.ARRAY_CHUNK_SIZE = 2
+        w.AddArray("Int_c", [5, 6, 7, 8, 9], VhdlType.INTEGER)
+        content = WriteAndRead(w)
+        self.assertIn("\tconstant Int_c : t_ainteger(0 to 4) := (\n\t\t5,\n\t\t6,\n\t\t7,\n\t\t8,\n\t\t9);\n", content)
+
+    def test_StdLogicVectorHex(self):
+        fmt = psi_fix_fmt_t(1, 3, 4)    # 8 bits
+        w = psi_fix_pkg_writer()
+        w.AddConstant("Slv_c", -0.5, VhdlType.STD_LOGIC_VECTOR, fmt)
+        w.AddArray("Tbl_c", [-0.5, 0.25, psi_fix_upper_bound(fmt), -8.0], VhdlType.STD_LOGIC_VECTOR, fmt)
+        content = WriteAndRead(w)
+        self.assertIn("\tconstant Slv_c : std_logic_vector(7 downto 0) := x\"f8\";\n", content)
+        self.assertIn("\ttype Tbl_c_t is array (0 to 3) of std_logic_vector(7 downto 0);\n", content)
+        self.assertIn("\tconstant Tbl_c : Tbl_c_t := (\n\t\tx\"f8\",\n\t\tx\"04\",\n\t\tx\"7f\",\n\t\tx\"80\");\n", content)
+
+    def test_StdLogicVectorBits(self):
+        fmt = psi_fix_fmt_t(1, 2, 2)    # 5 bits
+        w = psi_fix_pkg_writer()
+        w.AddConstant("Slv_c", -0.25, VhdlType.STD_LOGIC_VECTOR, fmt)
+        w.AddArray("Tbl_c", [-0.5, 0.25, -4.0], VhdlType.STD_LOGIC_VECTOR, fmt)
+        content = WriteAndRead(w)
+        self.assertIn("\tconstant Slv_c : std_logic_vector(4 downto 0) := \"11111\";\n", content)
+        self.assertIn("\ttype Tbl_c_t is array (0 to 2) of std_logic_vector(4 downto 0);\n", content)
+        self.assertIn("\tconstant Tbl_c : Tbl_c_t := (\n\t\t\"11110\",\n\t\t\"00001\",\n\t\t\"10000\");\n", content)
+
+    def test_Errors(self):
+        fmt = psi_fix_fmt_t(1, 0, 2)
+        w = psi_fix_pkg_writer()
+        with self.assertRaises(ValueError):
+            w.AddConstant("Int0_c", 1.5, VhdlType.INTEGER)
+        with self.assertRaises(ValueError):
+            w.AddArray("Int1_c", [1, 2.5], VhdlType.INTEGER)
+        with self.assertRaises(ValueError):
+            w.AddArray("Empty_c", [], VhdlType.INTEGER)
+        # Values off the grid or out of the range of the format
+        with self.assertRaises(ValueError):
+            w.AddConstant("Slv2_c", 0.3, VhdlType.STD_LOGIC_VECTOR, fmt)
+        with self.assertRaises(ValueError):
+            w.AddArray("Slv3_c", [0.25, 1.0], VhdlType.STD_LOGIC_VECTOR, fmt)
+        with self.assertRaises(ValueError):
+            w.AddArray("Slv4_c", [0.25, -1.25], VhdlType.STD_LOGIC_VECTOR, fmt)
+        # Missing format
+        with self.assertRaises(ValueError):
+            w.AddConstant("Slv5_c", 0.25, VhdlType.STD_LOGIC_VECTOR)
+        with self.assertRaises(ValueError):
+            w.AddArray("Slv6_c", [0.25], VhdlType.STD_LOGIC_VECTOR)
+        # Duplicate names (case insensitive as in VHDL)
+        w.AddConstant("Name_c", 1, VhdlType.INTEGER)
+        with self.assertRaises(ValueError):
+            w.AddConstant("NAME_C", 2, VhdlType.INTEGER)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+import sys
+sys.path.append("../model")
+from psi_fix_pkg import *
+from psi_fix_probe import psi_fix_probe
+from psi_fix_cic_dec import psi_fix_cic_dec
+from psi_fix_lowpass_iir_order1 import psi_fix_lowpass_iir_order1
+
+import unittest
+
+########################################################################################################################
+# Test Cases
+########################################################################################################################
+
+### psi_fix_probe ###
+class PsiFixProbeTest(unittest.TestCase):
+
+    def test_Stats(self):
+        probe = psi_fix_probe()
+        probe.Attach()
+        probe("a", np.array([1.0, -3.0]))
+        probe("a", np.array([[2.0], [0.0]]))
+        s = probe.Stats("a")
+        self.assertEqual(4, s["count"])
+        self.assertEqual(-3.0, s["min"])
+        self.assertEqual(2.0, s["max"])
+        self.assertEqual(0.0, s["mean"])
+        self.assertAlmostEqual(np.sqrt(14/4), s["rms"])
+
+    def test_Histogram(self):
+        probe = psi_fix_probe()
+        probe.Attach("a", histEdges=[-1, 0, 1])
+        probe("a", np.array([-5.0, -0.5, 0.5, 0.75, 5.0]))
+        counts, edges = probe.Histogram("a")
+        self.assertEqual([2, 3], list(counts))
+        self.assertEqual([-1, 0, 1], list(edges))
+
+    def test_CaptureDecimated(self):
+        probe = psi_fix_probe()
+        probe.Attach("a", decimation=3, maxSamples=5)
+        data = np.arange(20.0)
+        probe("a", data[:4])
+        probe("a", data[4:11])
+        probe("a", data[11:])
+        self.assertEqual([0, 3, 6, 9, 12], list(probe.Capture("a")))
+
+    def test_Attach(self):
+        probe = psi_fix_probe()
+        probe.Attach("int*", decimation=1)
+        probe.Attach("*")
+        probe("int1", np.zeros(2))
+        probe("diff1", np.zeros(2))
+        self.assertEqual(["diff1", "int1"], probe.Nodes())
+        self.assertEqual(2, len(probe.Capture("int1")))
+        with self.assertRaises(ValueError):
+            probe.Capture("diff1")
+        probe2 = psi_fix_probe()
+        probe2.Attach("x")
+        probe2("y", np.zeros(2))
+        with self.assertRaises(KeyError):
+            probe2.Stats("y")
+
+    def test_CicDec(self):
+        probe = psi_fix_probe()
+        probe.Attach()
+        cic = psi_fix_cic_dec(3, 4, 1, psi_fix_fmt_t(1, 0, 15), psi_fix_fmt_t(1, 0, 15), True, trace=probe)
+        inp = psi_fix_from_real(np.full(100, 0.5), psi_fix_fmt_t(1, 0, 15))
+        cic.Process(inp)
+        self.assertEqual(["diff1", "diff2", "diff3", "int1", "int2", "int3"], probe.Nodes())
+        # First integrator accumulates the constant input without wrapping
+        self.assertEqual(50.0, probe.Stats("int1")["max"])
+        self.assertEqual(0.5, probe.Stats("int1")["min"])
+
+    def test_Iir(self):
+        probe = psi_fix_probe()
+        probe.Attach("add", decimation=10)
+        iir = psi_fix_lowpass_iir_order1(100e6, 1e6, psi_fix_fmt_t(1, 0, 15), psi_fix_fmt_t(1, 0, 14),
+                                         psi_fix_fmt_t(1, 0, 24), psi_fix_fmt_t(1, 0, 17), trace=probe)
+        out = iir.Filter(np.full(100, 0.5))
+        self.assertEqual(10, len(probe.Capture("add")))
+        self.assertTrue(np.allclose(out[::10], probe.Capture("add"), atol=2**-14))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+import sys
+sys.path.append("../model")
+from psi_fix_pkg import *
+from psi_fix_shard import psi_fix_shared_array, psi_fix_channel_shard
+from psi_fix_cic_dec import psi_fix_cic_dec
+from psi_fix_mov_avg import psi_fix_mov_avg
+from psi_fix_fir import psi_fix_fir
+from psi_fix_demod_real2cplx import psi_fix_demod_real2cplx
+
+import unittest
+import pickle
+
+########################################################################################################################
+# Test Cases
+########################################################################################################################
+FMT = psi_fix_fmt_t(1, 0, 15)
+
+def Data(channels : int, samples : int) -> np.ndarray:
+    np.random.seed(2)
+    return psi_fix_from_real(np.random.uniform(-1, 1, (channels, samples)), FMT, err_sat=False)
+
+### psi_fix_shared_array ###
+class PsiFixSharedArrayTest(unittest.TestCase):
+
+    def test_Pickle(self):
+        with psi_fix_shared_array.FromArray(np.arange(6.0).reshape(2, 3)) as a:
+            b = pickle.loads(pickle.dumps(a))
+            b.array[1, 2] = 10
+            self.assertEqual(10, a.array[1, 2])
+            b.Close()
+            self.assertEqual([0, 1, 2], list(a.array[0]))
+
+### psi_fix_channel_shard ###
+class PsiFixChannelShardTest(unittest.TestCase):
+
+    def test_PerChannel(self):
+        data = Data(7, 200)
+        cic = psi_fix_cic_dec(3, 4, 1, FMT, FMT, True)
+        out = psi_fix_channel_shard(cic, processes=3).Process(data)
+        ref = np.stack([cic.Process(ch) for ch in data])
+        self.assertTrue(np.array_equal(ref, out))
+
+    def test_MultiChannel(self):
+        data = Data(9, 300)
+        avg = psi_fix_mov_avg(FMT, FMT, 5)
+        with psi_fix_shared_array.FromArray(data) as inp, psi_fix_shared_array(data.shape) as out:
+            psi_fix_channel_shard(avg, perChannel=False, processes=2).Process(inp, out=out)
+            self.assertTrue(np.array_equal(avg.Process(data), out.array))
+
+    def test_Args(self):
+        data = Data(4, 100)
+        coefs = np.linspace(-0.3, 0.3, 7)
+        fir = psi_fix_fir(FMT, FMT, psi_fix_fmt_t(1, 0, 17))
+        out = psi_fix_channel_shard(fir, "Filter", processes=2).Process(data, 2, coefs)
+        self.assertEqual((4, 50), out.shape)
+        self.assertTrue(np.array_equal(fir.Filter(data[3], 2, coefs), out[3]))
+
+    def test_TupleOutput(self):
+        data = Data(5, 100)
+        demod = psi_fix_demod_real2cplx(FMT, FMT, 25, 5, 1)
+        outI, outQ = psi_fix_channel_shard(demod, perChannel=False, processes=1).Process(data, 0)
+        refI, refQ = demod.Process(data, 0)
+        self.assertTrue(np.array_equal(refI, outI))
+        self.assertTrue(np.array_equal(refQ, outQ))
+
+    def test_OutMismatch(self):
+        data = Data(3, 100)
+        with psi_fix_shared_array((3, 99)) as out:
+            with self.assertRaises(ValueError):
+                psi_fix_channel_shard(psi_fix_mov_avg(FMT, FMT, 5), processes=1).Process(data, out=out)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+import sys
+sys.path.append("../model")
+from psi_fix_pkg import *
+from psi_fix_stim_cache import *
+
+import unittest
+import tempfile
+import os
+
+########################################################################################################################
+# Test Cases
+########################################################################################################################
+
+### psi_fix_stim_cache ###
+class PsiFixStimCacheTest(unittest.TestCase):
+
+    def _Cache(self, d, params, cacheDir=None):
+        return psi_fix_stim_cache([os.path.join(d, "out.txt")], params=params, models=[], script=__file__,
+                                  cacheDir=os.path.join(d, "cache") if cacheDir is None else cacheDir)
+
+    def test_StoreRestore(self):
+        with tempfile.TemporaryDirectory() as d:
+            params = {"fmt" : psi_fix_fmt_t(1, 0, 15), "rnd" : psi_fix_rnd_t.round, "coefs" : np.arange(3)}
+            self.assertFalse(self._Cache(d, params).Restore())
+            with open(os.path.join(d, "out.txt"), "w") as f:
+                f.write("1\n2\n")
+            self._Cache(d, params).Store()
+            os.remove(os.path.join(d, "out.txt"))
+            self.assertTrue(self._Cache(d, dict(params)).Restore())
+            with open(os.path.join(d, "out.txt")) as f:
+                self.assertEqual("1\n2\n", f.read())
+
+    def test_ParamsChanged(self):
+        with tempfile.TemporaryDirectory() as d:
+            with open(os.path.join(d, "out.txt"), "w") as f:
+                f.write("1\n")
+            self._Cache(d, [psi_fix_fmt_t(1, 0, 15), np.arange(3)]).Store()
+            self.assertTrue(self._Cache(d, [psi_fix_fmt_t(1, 0, 15), np.arange(3)]).Restore())
+            self.assertFalse(self._Cache(d, [psi_fix_fmt_t(1, 0, 14), np.arange(3)]).Restore())
+            self.assertFalse(self._Cache(d, [psi_fix_fmt_t(1, 0, 15), np.arange(4)]).Restore())
+
+    def test_Disabled(self):
+        with tempfile.TemporaryDirectory() as d:
+            with open(os.path.join(d, "out.txt"), "w") as f:
+                f.write("1\n")
+            cache = self._Cache(d, None, cacheDir="")
+            self.assertFalse(cache.Enabled())
+            cache.Store()
+            self.assertFalse(cache.Restore())
+            self.assertEqual(["out.txt"], os.listdir(d))
+
+########################################################################################################################
+# Test Runner
+########################################################################################################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+########################################################################################################################
+#  Copyright (c) 2026 by Paul Scherrer Institute, Switzerland
+#  All rights reserved.
+########################################################################################################################
+import sys
+sys.path.append("../model")
+from psi_fix_pkg import *
+from psi_fix_sweep import psi_fix_sweep
+from psi_fix_cic_dec import psi_fix_cic_dec
+from psi_fix_mov_avg import psi_fix_mov_avg
+from psi_fix_fir import psi_fix_fir
+
+import unittest
+
+########################################################################################################################
+# Helpers (must be defined at module level to be picklable)
+########################################################################################################################
+FMT = psi_fix_fmt_t(1, 0, 16)
+
+def Chirp(params : dict) -> np.ndarray:
+    t = np.arange(3000)
+    return psi_fix_from_real(np.sin(t * t * 1e-5 * params["ratio"]), FMT, err_sat=False)
+
+def FilterDecim(model, params, inp):
+    return model.Filter(inp, 2, np.ones(5) / 5)
+
+########################################################################################################################
+# Test Cases
+########################################################################################################################
+
+### psi_fix_sweep ###
+class PsiFixSweepTest(unittest.TestCase):
+
+    def test_Grid(self):
+        sweep = psi_fix_sweep(psi_fix_cic_dec, {"order" : [3, 4], "ratio" : [5, 10]}, Chirp,
+                              constants={"diffDelay" : 1, "inFmt" : FMT, "outFmt" : FMT, "autoGainCorr" : True},
+                              processes=2)
+        runs = sweep.Run()
+        self.assertEqual([(3, 5), (3, 10), (4, 5), (4, 10)], [(r.params["order"], r.params["ratio"]) for r in runs])
+        for r in runs:
+            self.assertIsNone(r.error)
+            self.assertGreater(r.seconds, 0)
+            ref = psi_fix_cic_dec(r.params["order"], r.params["ratio"], 1, FMT, FMT, True).Process(Chirp(r.params))
+            self.assertTrue(np.array_equal(ref, r.output))
+
+    def test_SharedInput(self):
+        np.random.seed(0)
+        data = psi_fix_from_real(np.random.uniform(-1, 1, 100000), FMT, err_sat=False)
+        for processes in (1, 2):
+            sweep = psi_fix_sweep(psi_fix_mov_avg, [{"taps" : 3}, {"taps" : 7}], data,
+                                  constants={"inFmt" : FMT, "outFmt" : FMT}, processes=processes)
+            for r in sweep.Run():
+                self.assertTrue(np.array_equal(psi_fix_mov_avg(FMT, FMT, r.params["taps"]).Process(data), r.output))
+
+    def test_Call(self):
+        data = Chirp({"ratio" : 1})
+        sweep = psi_fix_sweep(psi_fix_fir, [{"coefFmt" : psi_fix_fmt_t(1, 0, 17)}], data,
+                              constants={"inFmt" : FMT, "outFmt" : FMT}, call=FilterDecim, processes=1)
+        run = sweep.Run()[0]
+        self.assertTrue(np.array_equal(FilterDecim(psi_fix_fir(FMT, FMT, psi_fix_fmt_t(1, 0, 17)), None, data),
+                                       run.output))
+
+    def test_Error(self):
+        sweep = psi_fix_sweep(psi_fix_mov_avg, [{"taps" : 3, "gaincorr" : "Invalid"}, {"taps" : 3}], np.zeros(10),
+                              constants={"inFmt" : FMT, "outFmt" : FMT}, processes=2)
+        runs = sweep.Run()
+        self.assertIn("ValueError", runs[0].error)
+        self.assertIsNone(runs[0].output)
+        self.assertIsNone(runs[1].error)
+
+if __name__ == "__main__":
+    unittest.main()